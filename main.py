@@ -1,7 +1,11 @@
 import sys
 import os
 import json
+import re
+import time
 import threading
+import collections
+import queue
 import webbrowser
 import tkinter as tk
 from tkinter import messagebox, colorchooser
@@ -21,6 +25,24 @@ try:
 except Exception:
 	keyboard = None
 
+try:
+	import mouse
+except Exception:
+	mouse = None
+
+try:
+	import numpy as np
+	_NUMPY_AVAILABLE = True
+except Exception:
+	np = None
+	_NUMPY_AVAILABLE = False
+
+try:
+	from Xlib import X, display as xdisplay
+	from Xlib.protocol import event as xevent, request as xrequest
+except Exception:
+	X = xdisplay = xevent = xrequest = None
+
 
 def resource_path(rel_path: str) -> str:
 	# Return absolute path to a resource bundled with the app.
@@ -313,6 +335,90 @@ def apply_bg_color(color):
 		pass
 
 
+# Dialogs are built once, then hidden and shown again instead of rebuilt --------
+_DIALOGS = {}
+
+
+def retheme_dialog(win):
+	"""
+	Bring a cached dialog's labels and checkbuttons in line with the current background:
+	apply_bg_color only recolors backgrounds, which leaves the old text color behind.
+	"""
+	if not CURRENT_BG:
+		return
+	fg = 'white' if is_dark_hex(CURRENT_BG) else 'black'
+
+	def _apply(w):
+		try:
+			if isinstance(w, (tk.Label, tk.Checkbutton, tk.Radiobutton)):
+				w.configure(bg=CURRENT_BG, fg=fg)
+			elif isinstance(w, tk.Frame):
+				w.configure(bg=CURRENT_BG)
+		except Exception:
+			pass
+		try:
+			children = w.winfo_children()
+		except Exception:
+			children = []
+		for c in children:
+			_apply(c)
+
+	_apply(win)
+
+
+def show_cached_dialog(name):
+	"""
+	Show the cached Toplevel `name` again if there is one; a hidden or minimized one gets
+	its reopen callback (state refresh) first. Returns the window, or None if it must be built.
+	"""
+	win = _DIALOGS.get(name)
+	if win is None:
+		return None
+	try:
+		if not win.winfo_exists():
+			raise tk.TclError(name)
+		if win.state() != 'normal':
+			retheme_dialog(win)
+			on_reopen = getattr(win, '_on_reopen', None)
+			if on_reopen:
+				on_reopen()
+			win.deiconify()
+		win.lift()
+		win.focus_force()
+		return win
+	except Exception:
+		_DIALOGS.pop(name, None)
+		return None
+
+
+def cache_dialog(name, win, on_reopen=None):
+	win._on_reopen = on_reopen
+	_DIALOGS[name] = win
+
+
+def hide_dialog(win):
+	try:
+		win.withdraw()
+	except Exception:
+		pass
+
+
+def set_var_quietly(var, value):
+	"""
+	Set a Tk variable for display only: traces that persist or act on changes check
+	is_quiet(var) and skip, so syncing a checkbox with the app's state has no side effects.
+	"""
+	var._quiet = True
+	try:
+		var.set(value)
+	finally:
+		var._quiet = False
+
+
+def is_quiet(var):
+	return getattr(var, '_quiet', False)
+
+
 # Color utilities ---------------------------------------------------------
 def hex_to_rgb(hexcol: str):
 	try:
@@ -385,24 +491,1255 @@ def mk_button(master, **kwargs):
 # --- Windows API helpers -------------------------------------------------
 
 
-def move_roblox_windows_top_left():
-	if sys.platform != 'win32':
-		messagebox.showerror('Unsupported', 'This feature is only supported on Windows.')
-		return
+ROBLOX_IMAGE_NAME = 'RobloxPlayerBeta.exe'
+
+
+class MONITORINFO(ctypes.Structure):
+	_fields_ = [
+		('cbSize', wintypes.DWORD),
+		('rcMonitor', wintypes.RECT),
+		('rcWork', wintypes.RECT),
+		('dwFlags', wintypes.DWORD),
+	]
+
+
+class WINDOWPLACEMENT(ctypes.Structure):
+	_fields_ = [
+		('length', wintypes.UINT),
+		('flags', wintypes.UINT),
+		('showCmd', wintypes.UINT),
+		('ptMinPosition', wintypes.POINT),
+		('ptMaxPosition', wintypes.POINT),
+		('rcNormalPosition', wintypes.RECT),
+	]
+
+
+class PROCESSENTRY32W(ctypes.Structure):
+	_fields_ = [
+		('dwSize', wintypes.DWORD),
+		('cntUsage', wintypes.DWORD),
+		('th32ProcessID', wintypes.DWORD),
+		('th32DefaultHeapID', ctypes.c_size_t),
+		('th32ModuleID', wintypes.DWORD),
+		('cntThreads', wintypes.DWORD),
+		('th32ParentProcessID', wintypes.DWORD),
+		('pcPriClassBase', wintypes.LONG),
+		('dwFlags', wintypes.DWORD),
+		('szExeFile', ctypes.c_wchar * 260),
+	]
+
+
+class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+	_fields_ = [
+		('cb', wintypes.DWORD),
+		('PageFaultCount', wintypes.DWORD),
+		('PeakWorkingSetSize', ctypes.c_size_t),
+		('WorkingSetSize', ctypes.c_size_t),
+		('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+		('QuotaPagedPoolUsage', ctypes.c_size_t),
+		('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+		('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+		('PagefileUsage', ctypes.c_size_t),
+		('PeakPagefileUsage', ctypes.c_size_t),
+	]
+
+
+class BITMAPINFOHEADER(ctypes.Structure):
+	_fields_ = [
+		('biSize', wintypes.DWORD), ('biWidth', wintypes.LONG), ('biHeight', wintypes.LONG),
+		('biPlanes', wintypes.WORD), ('biBitCount', wintypes.WORD), ('biCompression', wintypes.DWORD),
+		('biSizeImage', wintypes.DWORD), ('biXPelsPerMeter', wintypes.LONG), ('biYPelsPerMeter', wintypes.LONG),
+		('biClrUsed', wintypes.DWORD), ('biClrImportant', wintypes.DWORD),
+	]
+
+
+def win32_prototypes(WNDENUMPROC, MONITORENUMPROC, WINEVENTPROC):
+	"""
+	{dll: {function: (restype, argtypes)}} for every Win32 call the app makes.
+	Handles are declared pointer sized so 64-bit HWNDs/HDCs are never truncated to int.
+	"""
+	P = ctypes.POINTER
+	w = wintypes
+	c_int = ctypes.c_int
+	return {
+		'user32': {
+			'EnumWindows': (w.BOOL, [WNDENUMPROC, w.LPARAM]),
+			'IsWindow': (w.BOOL, [w.HWND]),
+			'IsWindowVisible': (w.BOOL, [w.HWND]),
+			'IsIconic': (w.BOOL, [w.HWND]),
+			'IsZoomed': (w.BOOL, [w.HWND]),
+			'IsHungAppWindow': (w.BOOL, [w.HWND]),
+			'GetClassNameW': (c_int, [w.HWND, w.LPWSTR, c_int]),
+			'GetWindowThreadProcessId': (w.DWORD, [w.HWND, P(w.DWORD)]),
+			'GetWindowRect': (w.BOOL, [w.HWND, P(w.RECT)]),
+			'GetWindowPlacement': (w.BOOL, [w.HWND, P(WINDOWPLACEMENT)]),
+			'MonitorFromWindow': (w.HMONITOR, [w.HWND, w.DWORD]),
+			'GetClientRect': (w.BOOL, [w.HWND, P(w.RECT)]),
+			'ClientToScreen': (w.BOOL, [w.HWND, P(w.POINT)]),
+			'GetWindowTextW': (c_int, [w.HWND, w.LPWSTR, c_int]),
+			'ShowWindow': (w.BOOL, [w.HWND, c_int]),
+			'SetWindowPos': (w.BOOL, [w.HWND, w.HWND, c_int, c_int, c_int, c_int, w.UINT]),
+			'BeginDeferWindowPos': (w.HANDLE, [c_int]),
+			'DeferWindowPos': (w.HANDLE, [w.HANDLE, w.HWND, w.HWND, c_int, c_int, c_int, c_int, w.UINT]),
+			'EndDeferWindowPos': (w.BOOL, [w.HANDLE]),
+			'GetForegroundWindow': (w.HWND, []),
+			'SetForegroundWindow': (w.BOOL, [w.HWND]),
+			'PostMessageW': (w.BOOL, [w.HWND, w.UINT, w.WPARAM, w.LPARAM]),
+			'MapVirtualKeyW': (w.UINT, [w.UINT, w.UINT]),
+			'EnumDisplayMonitors': (w.BOOL, [w.HDC, P(w.RECT), MONITORENUMPROC, w.LPARAM]),
+			'GetMonitorInfoW': (w.BOOL, [w.HMONITOR, P(MONITORINFO)]),
+			'GetDC': (w.HDC, [w.HWND]),
+			'ReleaseDC': (c_int, [w.HWND, w.HDC]),
+			'PrintWindow': (w.BOOL, [w.HWND, w.HDC, w.UINT]),
+			'SetWinEventHook': (w.HANDLE, [w.DWORD, w.DWORD, w.HMODULE, WINEVENTPROC, w.DWORD, w.DWORD, w.DWORD]),
+			'UnhookWinEvent': (w.BOOL, [w.HANDLE]),
+			'GetMessageW': (w.BOOL, [P(w.MSG), w.HWND, w.UINT, w.UINT]),
+			'TranslateMessage': (w.BOOL, [P(w.MSG)]),
+			'DispatchMessageW': (ctypes.c_ssize_t, [P(w.MSG)]),
+			'PostThreadMessageW': (w.BOOL, [w.DWORD, w.UINT, w.WPARAM, w.LPARAM]),
+		},
+		'kernel32': {
+			'OpenProcess': (w.HANDLE, [w.DWORD, w.BOOL, w.DWORD]),
+			'CloseHandle': (w.BOOL, [w.HANDLE]),
+			'QueryFullProcessImageNameW': (w.BOOL, [w.HANDLE, w.DWORD, w.LPWSTR, P(w.DWORD)]),
+			'CreateToolhelp32Snapshot': (w.HANDLE, [w.DWORD, w.DWORD]),
+			'Process32FirstW': (w.BOOL, [w.HANDLE, P(PROCESSENTRY32W)]),
+			'Process32NextW': (w.BOOL, [w.HANDLE, P(PROCESSENTRY32W)]),
+			'SetPriorityClass': (w.BOOL, [w.HANDLE, w.DWORD]),
+			'SetProcessAffinityMask': (w.BOOL, [w.HANDLE, ctypes.c_size_t]),
+			'K32GetProcessMemoryInfo': (w.BOOL, [w.HANDLE, P(PROCESS_MEMORY_COUNTERS), w.DWORD]),
+			'K32EmptyWorkingSet': (w.BOOL, [w.HANDLE]),
+			'GetExitCodeProcess': (w.BOOL, [w.HANDLE, P(w.DWORD)]),
+			'GetCurrentThreadId': (w.DWORD, []),
+		},
+		'gdi32': {
+			'CreateCompatibleDC': (w.HDC, [w.HDC]),
+			'CreateCompatibleBitmap': (w.HBITMAP, [w.HDC, c_int, c_int]),
+			'SelectObject': (w.HGDIOBJ, [w.HDC, w.HGDIOBJ]),
+			'DeleteObject': (w.BOOL, [w.HGDIOBJ]),
+			'DeleteDC': (w.BOOL, [w.HDC]),
+			'GetDIBits': (c_int, [w.HDC, w.HBITMAP, w.UINT, w.UINT, ctypes.c_void_p, P(BITMAPINFOHEADER), w.UINT]),
+		},
+		'winmm': {
+			'timeBeginPeriod': (w.UINT, [w.UINT]),
+			'timeEndPeriod': (w.UINT, [w.UINT]),
+		},
+	}
+
+
+class Win32Api:
+	"""
+	The Win32 DLLs with every prototype from win32_prototypes declared once.
+	Uses private WinDLL instances, so declarations made by other libraries (keyboard,
+	mouse) on ctypes.windll can't clash with ours. Also hands out per-thread RECT/DWORD
+	buffers for hot loops.
+	"""
+
+	def __init__(self, loader=None):
+		self.WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+		self.MONITORENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HMONITOR, wintypes.HDC,
+			ctypes.POINTER(wintypes.RECT), wintypes.LPARAM)
+		self.WINEVENTPROC = ctypes.WINFUNCTYPE(None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+			wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
+		loader = loader or ctypes.WinDLL
+		for dll_name, prototypes in win32_prototypes(self.WNDENUMPROC, self.MONITORENUMPROC, self.WINEVENTPROC).items():
+			dll = loader(dll_name)
+			for name, (restype, argtypes) in prototypes.items():
+				try:
+					fn = getattr(dll, name)
+				except AttributeError:
+					# e.g. K32* exports on old systems; callers already treat failures as "unsupported"
+					continue
+				fn.restype = restype
+				fn.argtypes = argtypes
+			setattr(self, dll_name, dll)
+		self._local = threading.local()
+
+	def rect(self):
+		"""A RECT owned by the calling thread, reused across calls."""
+		r = getattr(self._local, 'rect', None)
+		if r is None:
+			r = self._local.rect = wintypes.RECT()
+		return r
+
+	def dword(self):
+		"""A DWORD owned by the calling thread, reused across calls."""
+		d = getattr(self._local, 'dword', None)
+		if d is None:
+			d = self._local.dword = wintypes.DWORD()
+		return d
+
+
+_WIN32_API = None
+_WIN32_API_LOCK = threading.Lock()
+
+
+def win32_api():
+	"""
+	Return the shared Win32Api, declaring the prototypes on first use (not at import, so
+	the module still imports where there is no Win32). None on other platforms.
+	"""
+	global _WIN32_API
+	if _WIN32_API is None and sys.platform == 'win32':
+		with _WIN32_API_LOCK:
+			if _WIN32_API is None:
+				_WIN32_API = Win32Api()
+	return _WIN32_API
+
+
+def _require_win32_api():
+	api = win32_api()
+	if api is None:
+		raise OSError('the Win32 API is not available on this platform')
+	return api
+
+
+# --- Window matching -----------------------------------------------------------
 
-	user32 = ctypes.windll.user32
-	kernel32 = ctypes.windll.kernel32
+DEFAULT_WINDOW_MATCH = {
+	# Empty class_names / title_regex mean "don't filter on it"
+	'class_names': [],
+	'title_regex': '',
+	'image_names': [ROBLOX_IMAGE_NAME],
+}
+
+
+def window_match_config(settings=None):
+	"""
+	Which windows count as clients, from the 'window_match' setting merged over
+	DEFAULT_WINDOW_MATCH. E.g. the Microsoft Store build runs as Windows10Universal.exe:
+	add that image name plus a title_regex like '^Roblox$' so other Store apps aren't picked up.
+	"""
+	s = settings if settings is not None else load_settings()
+	config = dict(DEFAULT_WINDOW_MATCH)
+	user = s.get('window_match')
+	if isinstance(user, dict):
+		for key in config:
+			if key in user:
+				config[key] = user[key]
+	if isinstance(config['class_names'], str):
+		config['class_names'] = [config['class_names']]
+	if isinstance(config['image_names'], str):
+		config['image_names'] = [config['image_names']]
+	if not config['image_names']:
+		config['image_names'] = list(DEFAULT_WINDOW_MATCH['image_names'])
+	_validate_title_regex(config)
+	return config
+
+
+# Last problem found in the 'window_match' setting, or None (shown in get_stats)
+WINDOW_MATCH_ERROR = None
+
+
+def _validate_title_regex(config):
+	# A broken pattern would otherwise reject every window and the app would find no clients
+	global WINDOW_MATCH_ERROR
+	pattern = config.get('title_regex') or ''
+	try:
+		re.compile(pattern)
+		WINDOW_MATCH_ERROR = None
+	except (re.error, TypeError) as e:
+		config['title_regex'] = ''
+		WINDOW_MATCH_ERROR = f'invalid title_regex {pattern!r}: {e}'
+
+
+class WindowProbe:
+	"""
+	One window's attributes, fetched from `source` (the window backend) on first use and
+	cached, so the PID is read once even if two predicates need it.
+	"""
+
+	__slots__ = ('source', 'hwnd', '_pid')
+
+	def __init__(self, source, hwnd):
+		self.source = source
+		self.hwnd = hwnd
+		self._pid = None
+
+	def visible(self):
+		return self.source.is_window_visible(self.hwnd)
+
+	def class_name(self):
+		return self.source.get_class_name(self.hwnd)
+
+	def title(self):
+		return self.source.get_window_title(self.hwnd)
+
+	def pid(self):
+		if self._pid is None:
+			self._pid = self.source.get_window_pid(self.hwnd)
+		return self._pid
+
+	def image_name(self):
+		pid = self.pid()
+		return self.source.get_process_image_name(pid) if pid else None
+
+
+class VisiblePredicate:
+	name = 'visible'
+	cost = 1
+
+	def __call__(self, probe):
+		return probe.visible()
+
+
+class PidSetPredicate:
+	# GetWindowThreadProcessId doesn't talk to the window, so this is nearly free
+	name = 'pid'
+	cost = 2
+
+	def __init__(self, pids):
+		self.pids = set(pids)
+
+	def __call__(self, probe):
+		return probe.pid() in self.pids
+
+
+class ClassNamePredicate:
+	name = 'class'
+	cost = 3
+
+	def __init__(self, class_names):
+		self.class_names = {c.lower() for c in class_names}
+
+	def __call__(self, probe):
+		return (probe.class_name() or '').lower() in self.class_names
+
+
+class TitlePredicate:
+	# GetWindowText sends WM_GETTEXT to the owning thread, so it is kept late
+	name = 'title'
+	cost = 5
+
+	def __init__(self, pattern):
+		self.regex = re.compile(pattern)
+
+	def __call__(self, probe):
+		return self.regex.search(probe.title() or '') is not None
+
+
+class ImageNamePredicate:
+	# Opens the owning process: by far the most expensive check
+	name = 'image'
+	cost = 10
+
+	def __init__(self, image_names):
+		self.image_names = {n.lower() for n in image_names}
+
+	def __call__(self, probe):
+		return (probe.image_name() or '').lower() in self.image_names
+
+
+class WindowMatcher:
+	"""
+	Runs predicates cheapest first and stops at the first that rejects a window.
+	Counts, per predicate, how many windows reached it and how many it rejected.
+	"""
+
+	def __init__(self, predicates):
+		self.predicates = sorted(predicates, key=lambda p: p.cost)
+		self.evaluated = [0] * len(self.predicates)
+		self.rejected = [0] * len(self.predicates)
+		self.windows = 0
+		self.matched = 0
+
+	def match(self, probe):
+		self.windows += 1
+		for i, predicate in enumerate(self.predicates):
+			self.evaluated[i] += 1
+			try:
+				ok = predicate(probe)
+			except Exception:
+				ok = False
+			if not ok:
+				self.rejected[i] += 1
+				return False
+		self.matched += 1
+		return True
+
+	def stats(self):
+		return {
+			'windows': self.windows,
+			'matched': self.matched,
+			'predicates': [
+				{'name': p.name, 'cost': p.cost, 'evaluated': self.evaluated[i], 'rejected': self.rejected[i]}
+				for i, p in enumerate(self.predicates)
+			],
+		}
+
+
+def build_window_matcher(config, pids=None):
+	"""
+	Matcher for a window_match_config(). With `pids` (client PIDs from a process snapshot)
+	the image check becomes a PID lookup; without it each candidate's process is opened.
+	"""
+	predicates = [VisiblePredicate()]
+	if config.get('class_names'):
+		predicates.append(ClassNamePredicate(config['class_names']))
+	if config.get('title_regex'):
+		predicates.append(TitlePredicate(config['title_regex']))
+	if pids is not None:
+		predicates.append(PidSetPredicate(pids))
+	else:
+		predicates.append(ImageNamePredicate(config['image_names']))
+	return WindowMatcher(predicates)
+
+
+class Win32LocationWatcher:
+	"""
+	Calls callback(hwnd) when a top-level window moves or resizes, from a WinEvent hook
+	(EVENT_OBJECT_LOCATIONCHANGE) on a thread of its own with a message loop. Events
+	for the cursor, carets and child objects are dropped before reaching Python code
+	beyond a couple of integer compares.
+	"""
+
+	EVENT_OBJECT_LOCATIONCHANGE = 0x800B
+	WINEVENT_OUTOFCONTEXT = 0x0000
+	WINEVENT_SKIPOWNPROCESS = 0x0002
+	OBJID_WINDOW = 0
+	WM_QUIT = 0x0012
+
+	def __init__(self, api, callback):
+		self.api = api
+		self.callback = callback
+		self._thread_id = None
+		self._ready = threading.Event()
+		self._thread = threading.Thread(target=self._run, name='location-events', daemon=True)
+		self._thread.start()
+		self._ready.wait(2.0)
+
+	def _run(self):
+		api = self.api
+		user32 = api.user32
+		callback = self.callback
+		OBJID_WINDOW = self.OBJID_WINDOW
+
+		@api.WINEVENTPROC
+		def _proc(hook, event, hwnd, id_object, id_child, thread, time_ms):
+			if id_object == OBJID_WINDOW and id_child == 0 and hwnd:
+				try:
+					callback(hwnd)
+				except Exception:
+					pass
+
+		self._thread_id = api.kernel32.GetCurrentThreadId()
+		hook = user32.SetWinEventHook(self.EVENT_OBJECT_LOCATIONCHANGE, self.EVENT_OBJECT_LOCATIONCHANGE,
+			None, _proc, 0, 0, self.WINEVENT_OUTOFCONTEXT | self.WINEVENT_SKIPOWNPROCESS)
+		self._ready.set()
+		if not hook:
+			return
+		try:
+			msg = wintypes.MSG()
+			while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+				user32.TranslateMessage(ctypes.byref(msg))
+				user32.DispatchMessageW(ctypes.byref(msg))
+		finally:
+			user32.UnhookWinEvent(hook)
+
+	def stop(self):
+		if self._thread_id:
+			self.api.user32.PostThreadMessageW(self._thread_id, self.WM_QUIT, 0, 0)
+		self._thread.join(timeout=2.0)
+
+
+class Win32Backend:
+	"""
+	Thin wrapper over the user32/kernel32 calls used to find and move Roblox windows.
+	All window operations go through the active backend (see get_window_backend),
+	so one Stacker action can be traced as a fixed number of OS calls.
+	"""
 
 	HWND_TOP = 0
 	SWP_NOSIZE = 0x0001
 	SWP_NOZORDER = 0x0004
+	SWP_NOACTIVATE = 0x0010
 	SW_RESTORE = 9
+	SW_MINIMIZE = 6
+	SW_MAXIMIZE = 3
+	PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+	TH32CS_SNAPPROCESS = 0x00000002
+	MONITOR_DEFAULTTONEAREST = 2
+	INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+	def __init__(self, match_config=None):
+		self.api = _require_win32_api()
+		self.user32 = self.api.user32
+		self.kernel32 = self.api.kernel32
+		self.set_match_config(match_config or window_match_config({}))
+		self.last_matcher = None
+
+	def set_match_config(self, config):
+		self.match_config = config
+
+	def enum_roblox_windows(self):
+		"""Single EnumWindows pass; returns the matching client HWNDs in Z-order."""
+		return [hwnd for hwnd, pid in self.enum_roblox_window_pids()]
+
+	def enum_roblox_window_pids(self):
+		"""
+		Like enum_roblox_windows, but keeps the owning PID: [(hwnd, pid), ...].
+		Windows are matched with build_window_matcher(self.match_config). One process
+		snapshot supplies the client PIDs, so no process is opened per window; if the
+		snapshot fails, candidates' image names are checked instead. The matcher of the
+		last pass is kept in self.last_matcher for its statistics.
+		"""
+		config = self.match_config
+		pids = self.snapshot_pids(config['image_names'])
+		if pids is not None and not pids:
+			return []
+		matcher = build_window_matcher(config, pids)
+		self.last_matcher = matcher
+		found = []
+		for hwnd in self.enum_top_level_windows():
+			probe = WindowProbe(self, hwnd)
+			if matcher.match(probe):
+				found.append((hwnd, probe.pid()))
+		return found
+
+	def enum_top_level_windows(self):
+		"""Every top-level HWND in Z-order, from one EnumWindows pass."""
+		hwnds = []
+
+		@self.api.WNDENUMPROC
+		def _enum_proc(hwnd, lParam):
+			hwnds.append(hwnd)
+			return True
+
+		try:
+			self.user32.EnumWindows(_enum_proc, 0)
+		except Exception:
+			pass
+		return hwnds
+
+	def snapshot_pids(self, image_names):
+		"""Set of PIDs running any of `image_names`, from one toolhelp snapshot; None if the snapshot fails."""
+		kernel32 = self.kernel32
+		snap = kernel32.CreateToolhelp32Snapshot(self.TH32CS_SNAPPROCESS, 0)
+		if not snap or snap == self.INVALID_HANDLE_VALUE:
+			return None
+		pids = set()
+		try:
+			entry = PROCESSENTRY32W()
+			entry.dwSize = ctypes.sizeof(entry)
+			targets = {n.lower() for n in image_names}
+			ok = kernel32.Process32FirstW(snap, ctypes.byref(entry))
+			while ok:
+				if entry.szExeFile.lower() in targets:
+					pids.add(entry.th32ProcessID)
+				ok = kernel32.Process32NextW(snap, ctypes.byref(entry))
+		finally:
+			kernel32.CloseHandle(snap)
+		return pids
+
+	def is_window_visible(self, hwnd):
+		return bool(self.user32.IsWindowVisible(hwnd))
+
+	def get_class_name(self, hwnd):
+		buf = ctypes.create_unicode_buffer(256)
+		self.user32.GetClassNameW(hwnd, buf, 256)
+		return buf.value
+
+	def get_window_pid(self, hwnd):
+		pid = self.api.dword()
+		self.user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+		return pid.value
+
+	def get_process_image_name(self, pid):
+		"""Executable file name of a process (e.g. 'RobloxPlayerBeta.exe'), or None."""
+		kernel32 = self.kernel32
+		h = kernel32.OpenProcess(self.PROCESS_QUERY_LIMITED_INFORMATION, False, int(pid))
+		if not h:
+			return None
+		try:
+			buf = ctypes.create_unicode_buffer(260)
+			size = wintypes.DWORD(260)
+			if kernel32.QueryFullProcessImageNameW(h, 0, buf, ctypes.byref(size)):
+				return os.path.basename(buf.value)
+			return None
+		finally:
+			kernel32.CloseHandle(h)
+
+	def get_window_rect(self, hwnd):
+		"""
+		Return (left, top, right, bottom) or None. For a minimized window this is where it
+		will be restored to, not the tiny iconic rect GetWindowRect reports.
+		"""
+		if self.user32.IsIconic(hwnd):
+			return self._normal_rect(hwnd)
+		rect = self.api.rect()
+		if self.user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+			return (rect.left, rect.top, rect.right, rect.bottom)
+		return None
+
+	def _normal_rect(self, hwnd):
+		wp = WINDOWPLACEMENT()
+		wp.length = ctypes.sizeof(wp)
+		if not self.user32.GetWindowPlacement(hwnd, ctypes.byref(wp)):
+			return None
+		# rcNormalPosition is in workspace coordinates: relative to the monitor's work area
+		dx = dy = 0
+		mi = MONITORINFO()
+		mi.cbSize = ctypes.sizeof(mi)
+		monitor = self.user32.MonitorFromWindow(hwnd, self.MONITOR_DEFAULTTONEAREST)
+		if monitor and self.user32.GetMonitorInfoW(monitor, ctypes.byref(mi)):
+			dx = mi.rcWork.left - mi.rcMonitor.left
+			dy = mi.rcWork.top - mi.rcMonitor.top
+		r = wp.rcNormalPosition
+		return (r.left + dx, r.top + dy, r.right + dx, r.bottom + dy)
+
+	def restore_window(self, hwnd):
+		self.user32.ShowWindow(hwnd, self.SW_RESTORE)
+
+	def move_window(self, hwnd, x, y, w=None, h=None):
+		"""Move a window; it is also resized when both w and h are given."""
+		if w and h:
+			self.user32.SetWindowPos(hwnd, self.HWND_TOP, int(x), int(y), int(w), int(h), self.SWP_NOZORDER)
+		else:
+			self.user32.SetWindowPos(hwnd, self.HWND_TOP, int(x), int(y), 0, 0, self.SWP_NOSIZE | self.SWP_NOZORDER)
+
+	def minimize_window(self, hwnd):
+		# SW_SHOWMINNOACTIVE: minimize without stealing focus from the active client
+		self.user32.ShowWindow(hwnd, 7)
+
+	def get_foreground_window(self):
+		return self.user32.GetForegroundWindow() or None
+
+	def get_client_rect(self, hwnd):
+		"""Client area in screen coordinates (left, top, right, bottom), or None."""
+		rect = self.api.rect()
+		if not self.user32.GetClientRect(hwnd, ctypes.byref(rect)):
+			return None
+		pt = wintypes.POINT(0, 0)
+		self.user32.ClientToScreen(hwnd, ctypes.byref(pt))
+		return (pt.x, pt.y, pt.x + rect.right, pt.y + rect.bottom)
+
+	def watch_locations(self, callback):
+		"""Call callback(hwnd) whenever a top-level window moves; returns an object with stop()."""
+		return Win32LocationWatcher(self.api, callback)
+
+	def focus_window(self, hwnd):
+		"""Bring a client to the front, restoring it first if minimized."""
+		if self.user32.IsIconic(hwnd):
+			self.user32.ShowWindow(hwnd, self.SW_RESTORE)
+		self.user32.SetForegroundWindow(hwnd)
+
+	def get_window_title(self, hwnd):
+		buf = ctypes.create_unicode_buffer(256)
+		self.user32.GetWindowTextW(hwnd, buf, 256)
+		return buf.value
+
+	def is_responsive(self, hwnd):
+		"""False when Windows considers the window hung (not pumping messages)."""
+		return not self.user32.IsHungAppWindow(hwnd)
+
+	def close_window(self, hwnd):
+		WM_CLOSE = 0x0010
+		self.user32.PostMessageW(hwnd, WM_CLOSE, 0, 0)
+
+	def get_show_state(self, hwnd):
+		"""Return 'minimized', 'maximized' or 'normal'."""
+		if self.user32.IsIconic(hwnd):
+			return 'minimized'
+		if self.user32.IsZoomed(hwnd):
+			return 'maximized'
+		return 'normal'
+
+	def apply_placements(self, placements, resize=True):
+		"""
+		Apply {hwnd: ((left, top, right, bottom), show_state)} in one DeferWindowPos batch.
+		With resize=False only the positions are applied. Windows that no longer exist
+		are skipped. Returns the number of windows placed.
+		"""
+		user32 = self.user32
+		live = [(hwnd, rect, state) for hwnd, (rect, state) in placements.items() if user32.IsWindow(hwnd)]
+		if not live:
+			return 0
+		# Minimized/maximized windows ignore positioning, so bring them back to normal first
+		for hwnd, rect, state in live:
+			if self.get_show_state(hwnd) != 'normal':
+				user32.ShowWindow(hwnd, self.SW_RESTORE)
+		flags = self.SWP_NOZORDER | self.SWP_NOACTIVATE
+		if not resize:
+			flags |= self.SWP_NOSIZE
+		hdwp = user32.BeginDeferWindowPos(len(live))
+		for hwnd, (left, top, right, bottom), state in live:
+			if not hdwp:
+				break
+			hdwp = user32.DeferWindowPos(hdwp, hwnd, None, int(left), int(top), int(right - left), int(bottom - top), flags)
+		if hdwp:
+			user32.EndDeferWindowPos(hdwp)
+		else:
+			# The batch was abandoned by the OS; fall back to one call per window
+			for hwnd, (left, top, right, bottom), state in live:
+				user32.SetWindowPos(hwnd, self.HWND_TOP, int(left), int(top), int(right - left), int(bottom - top), flags)
+		for hwnd, rect, state in live:
+			if state == 'minimized':
+				user32.ShowWindow(hwnd, self.SW_MINIMIZE)
+			elif state == 'maximized':
+				user32.ShowWindow(hwnd, self.SW_MAXIMIZE)
+		return len(live)
+
+
+# --- X11 window backend ----------------------------------------------------------
+
+# Besides Wine's RobloxPlayerBeta.exe, clients on Linux may run under Sober
+X11_CLIENT_IMAGE_NAMES = ['sober']
+
+
+def _proc_image_name(pid):
+	"""File name of argv[0] of a Linux process; Wine keeps the Windows path there."""
+	try:
+		with open(f'/proc/{int(pid)}/cmdline', 'rb') as f:
+			argv0 = f.read().split(b'\0', 1)[0].decode('utf-8', 'replace')
+	except Exception:
+		return None
+	return argv0.replace('\\', '/').rsplit('/', 1)[-1] or None
+
+
+def _proc_ns_pid(pid):
+	"""
+	PID of a Linux process inside its own PID namespace (the last NSpid field), e.g. what
+	a Flatpak-sandboxed client like Sober writes to _NET_WM_PID; None if unknown.
+	"""
+	try:
+		with open(f'/proc/{int(pid)}/status') as f:
+			for line in f:
+				if line.startswith('NSpid:'):
+					return int(line.split()[-1])
+	except Exception:
+		pass
+	return None
+
+
+class X11LocationWatcher:
+	"""
+	Calls callback(xid) when a client window moves or resizes. Runs on its own display
+	connection and thread: every window in _NET_CLIENT_LIST is watched for ConfigureNotify
+	(window managers send a synthetic one when only the frame moves), and the list is
+	re-read when the root window says it changed.
+	"""
+
+	def __init__(self, display_name, callback):
+		self.callback = callback
+		self._stop = threading.Event()
+		self._display = xdisplay.Display(display_name)
+		self._display.set_error_handler(lambda *args: None)
+		self._thread = threading.Thread(target=self._run, name='location-events', daemon=True)
+		self._thread.start()
+
+	def _watch_clients(self, root, client_list, watched):
+		prop = root.get_full_property(client_list, X.AnyPropertyType)
+		current = set(prop.value) if prop else set()
+		for xid in current - watched:
+			self._display.create_resource_object('window', xid).change_attributes(event_mask=X.StructureNotifyMask)
+		watched.clear()
+		watched.update(current)
+		self._display.flush()
+
+	def _run(self):
+		import select
+		d = self._display
+		root = d.screen().root
+		client_list = d.intern_atom('_NET_CLIENT_LIST')
+		watched = set()
+		try:
+			root.change_attributes(event_mask=X.PropertyChangeMask)
+			self._watch_clients(root, client_list, watched)
+			while not self._stop.is_set():
+				select.select([d.fileno()], [], [], 0.25)
+				for _ in range(d.pending_events()):
+					ev = d.next_event()
+					if ev.type == X.ConfigureNotify:
+						try:
+							self.callback(ev.window.id)
+						except Exception:
+							pass
+					elif ev.type == X.PropertyNotify and ev.atom == client_list:
+						self._watch_clients(root, client_list, watched)
+		except Exception:
+			pass
+		finally:
+			try:
+				d.close()
+			except Exception:
+				pass
+
+	def stop(self):
+		self._stop.set()
+		self._thread.join(timeout=2.0)
+
+
+class X11Backend:
+	"""
+	The window backend for Linux desktops (clients under Wine or Sober), talking EWMH to
+	the window manager over one persistent X connection. Window IDs stand in for HWNDs.
+	Reads for many windows are pipelined (all requests sent, then all replies read), so a
+	scan or a placement snapshot costs one round trip; moves are client messages that are
+	queued and flushed once per batch.
+	"""
+
+	# _NET_WM_STATE actions and the source indication for pagers/tools
+	STATE_REMOVE = 0
+	STATE_ADD = 1
+	SOURCE_PAGER = 2
+	NORMAL_STATE = 1
+	ICONIC_STATE = 3
+	NORTH_WEST_GRAVITY = 1
+	# Interned once up front, so no request needs an intern_atom round trip in the middle
+	ATOM_NAMES = (
+		'WM_STATE', 'WM_CLASS', 'WM_NAME', 'WM_CHANGE_STATE',
+		'_NET_SUPPORTED', '_NET_CLIENT_LIST', '_NET_CLIENT_LIST_STACKING', '_NET_ACTIVE_WINDOW',
+		'_NET_WORKAREA', '_NET_CURRENT_DESKTOP', '_NET_WM_PID', '_NET_WM_NAME', '_NET_FRAME_EXTENTS',
+		'_NET_WM_STATE', '_NET_WM_STATE_HIDDEN', '_NET_WM_STATE_MAXIMIZED_VERT', '_NET_WM_STATE_MAXIMIZED_HORZ',
+		'_NET_MOVERESIZE_WINDOW', '_NET_CLOSE_WINDOW',
+	)
+
+	def __init__(self, match_config=None, display_name=None):
+		if xdisplay is None:
+			raise OSError('X11 backend needs python-xlib')
+		self.display = xdisplay.Display(display_name)
+		# Moves and client messages are asynchronous; a window that vanished meanwhile is not an error
+		self.display.set_error_handler(lambda *args: None)
+		self.root = self.display.screen().root
+		self._lock = threading.RLock()
+		self._atoms = {}
+		self._props = None
+		# Sandbox PID -> host PID of namespaced clients, from the last snapshot_pids
+		self._ns_pids = {}
+		self.set_match_config(match_config or window_match_config({}))
+		self.last_matcher = None
+		with self._lock:
+			self._intern_atoms(self.ATOM_NAMES)
+			supported = self._root_property('_NET_SUPPORTED') or ()
+		self.can_moveresize = self.atom('_NET_MOVERESIZE_WINDOW') in supported
+
+	def set_match_config(self, config):
+		if config['image_names'] == DEFAULT_WINDOW_MATCH['image_names']:
+			config = dict(config, image_names=config['image_names'] + X11_CLIENT_IMAGE_NAMES)
+		self.match_config = config
+
+	def _intern_atoms(self, names):
+		d = self.display.display
+		pending = [(name, xrequest.InternAtom(display=d, defer=True, name=name, only_if_exists=False)) for name in names]
+		self.display.flush()
+		for name, req in pending:
+			req.reply()
+			self._atoms[name] = req.atom
+
+	def atom(self, name):
+		atom = self._atoms.get(name)
+		if atom is None:
+			with self._lock:
+				atom = self._atoms[name] = self.display.intern_atom(name)
+		return atom
+
+	def _root_property(self, name):
+		prop = self.root.get_full_property(self.atom(name), X.AnyPropertyType)
+		return prop.value if prop else None
+
+	def _fetch_properties(self, xids, names):
+		"""{(xid, name): value or None} for every pair, read in one round trip."""
+		d = self.display.display
+		pending = []
+		for xid in xids:
+			for name in names:
+				pending.append((xid, name, xrequest.GetProperty(display=d, defer=True, delete=False, window=xid,
+					property=self.atom(name), type=X.AnyPropertyType, long_offset=0, long_length=1024)))
+		self.display.flush()
+		values = {}
+		for xid, name, req in pending:
+			try:
+				req.reply()
+				values[(xid, name)] = req.value[1] if req.property_type else None
+			except Exception:
+				values[(xid, name)] = None
+		return values
+
+	def _prop(self, xid, name):
+		with self._lock:
+			if self._props is not None and (xid, name) in self._props:
+				return self._props[(xid, name)]
+			return self._fetch_properties([xid], [name])[(xid, name)]
+
+	def enum_roblox_windows(self):
+		return [xid for xid, pid in self.enum_roblox_window_pids()]
+
+	def enum_roblox_window_pids(self):
+		"""
+		[(xid, pid), ...] of the client windows, matched like Win32Backend does. The
+		properties the matcher needs are fetched for every window up front, in one batch.
+		"""
+		config = self.match_config
+		pids = self.snapshot_pids(config['image_names'])
+		if pids is not None and not pids:
+			return []
+		matcher = build_window_matcher(config, pids)
+		self.last_matcher = matcher
+		names = ['WM_STATE', '_NET_WM_PID']
+		if config.get('class_names'):
+			names.append('WM_CLASS')
+		if config.get('title_regex'):
+			names.append('_NET_WM_NAME')
+		found = []
+		with self._lock:
+			xids = self.enum_top_level_windows()
+			self._props = self._fetch_properties(xids, names)
+			try:
+				for xid in xids:
+					probe = WindowProbe(self, xid)
+					if matcher.match(probe):
+						found.append((xid, probe.pid()))
+			finally:
+				self._props = None
+		return found
+
+	def enum_top_level_windows(self):
+		"""Managed client windows, topmost first like EnumWindows."""
+		with self._lock:
+			stacking = self._root_property('_NET_CLIENT_LIST_STACKING')
+			if stacking is not None:
+				return list(reversed(stacking))
+			return list(self._root_property('_NET_CLIENT_LIST') or ())
+
+	def snapshot_pids(self, image_names):
+		"""
+		Set of PIDs running any of `image_names`, from one pass over /proc; None without /proc.
+		A sandboxed client's own-namespace PID is included too, since that is what it puts in
+		_NET_WM_PID; get_window_pid maps it back to the host PID.
+		"""
+		targets = {n.lower() for n in image_names}
+		try:
+			entries = os.listdir('/proc')
+		except Exception:
+			return None
+		pids = set()
+		ns_pids = {}
+		for entry in entries:
+			if entry.isdigit() and (_proc_image_name(entry) or '').lower() in targets:
+				pid = int(entry)
+				pids.add(pid)
+				ns = _proc_ns_pid(pid)
+				if ns is not None and ns != pid:
+					ns_pids[ns] = pid
+		self._ns_pids = {ns: pid for ns, pid in ns_pids.items() if ns not in pids}
+		return pids | set(self._ns_pids)
+
+	def get_process_image_name(self, pid):
+		return _proc_image_name(pid)
+
+	def is_window_visible(self, xid):
+		# Like IsWindowVisible, a minimized client still counts; only withdrawn ones don't
+		state = self._prop(xid, 'WM_STATE')
+		return not state or state[0] != 0
+
+	def get_class_name(self, xid):
+		value = self._prop(xid, 'WM_CLASS')
+		if not value:
+			return ''
+		if isinstance(value, bytes):
+			value = value.decode('utf-8', 'replace')
+		parts = value.split('\0')
+		return parts[1] if len(parts) > 1 else parts[0]
+
+	def get_window_pid(self, xid):
+		value = self._prop(xid, '_NET_WM_PID')
+		if not value:
+			return 0
+		pid = int(value[0])
+		return self._ns_pids.get(pid, pid)
+
+	def get_window_title(self, xid):
+		value = self._prop(xid, '_NET_WM_NAME') or self._prop(xid, 'WM_NAME') or b''
+		if isinstance(value, bytes):
+			value = value.decode('utf-8', 'replace')
+		return value
+
+	def _extents(self, props, xid):
+		# _NET_FRAME_EXTENTS is (left, right, top, bottom)
+		value = props.get((xid, '_NET_FRAME_EXTENTS'))
+		return tuple(value[:4]) if value and len(value) >= 4 else (0, 0, 0, 0)
+
+	def _show_state(self, props, xid):
+		net = props.get((xid, '_NET_WM_STATE')) or ()
+		wm = props.get((xid, 'WM_STATE'))
+		if self.atom('_NET_WM_STATE_HIDDEN') in net or (wm and wm[0] == self.ICONIC_STATE):
+			return 'minimized'
+		if self.atom('_NET_WM_STATE_MAXIMIZED_VERT') in net and self.atom('_NET_WM_STATE_MAXIMIZED_HORZ') in net:
+			return 'maximized'
+		return 'normal'
+
+	def _client_geometry(self, xids):
+		"""{xid: (x, y, width, height)} of the client areas in root coordinates, in one round trip."""
+		d = self.display.display
+		pending = []
+		for xid in xids:
+			geo = xrequest.GetGeometry(display=d, defer=True, drawable=xid)
+			pos = xrequest.TranslateCoords(display=d, defer=True, src_wid=xid, dst_wid=self.root.id, src_x=0, src_y=0)
+			pending.append((xid, geo, pos))
+		self.display.flush()
+		out = {}
+		for xid, geo, pos in pending:
+			try:
+				geo.reply()
+				pos.reply()
+				out[xid] = (pos.x, pos.y, geo.width, geo.height)
+			except Exception:
+				pass
+		return out
+
+	def get_placements(self, xids):
+		"""
+		{xid: ((left, top, right, bottom), show_state)} including the frame, for many
+		windows at once; used by snapshot_placements. Vanished windows are left out.
+		"""
+		xids = list(xids)
+		out = {}
+		with self._lock:
+			props = self._fetch_properties(xids, ('_NET_FRAME_EXTENTS', '_NET_WM_STATE', 'WM_STATE'))
+			geometry = self._client_geometry(xids)
+			for xid, (x, y, w, h) in geometry.items():
+				left, right, top, bottom = self._extents(props, xid)
+				out[xid] = ((x - left, y - top, x + w + right, y + h + bottom), self._show_state(props, xid))
+		return out
+
+	def get_window_rect(self, xid):
+		"""Return (left, top, right, bottom) including the frame, or None."""
+		placement = self.get_placements([xid]).get(xid)
+		return placement[0] if placement else None
+
+	def get_client_rect(self, xid):
+		with self._lock:
+			geometry = self._client_geometry([xid]).get(xid)
+		if not geometry:
+			return None
+		x, y, w, h = geometry
+		return (x, y, x + w, y + h)
+
+	def get_show_state(self, xid):
+		with self._lock:
+			props = self._fetch_properties([xid], ('_NET_WM_STATE', 'WM_STATE'))
+			return self._show_state(props, xid)
+
+	def get_foreground_window(self):
+		with self._lock:
+			value = self._root_property('_NET_ACTIVE_WINDOW')
+		return int(value[0]) if value and value[0] else None
+
+	def _send(self, xid, message, data):
+		# Queued only; callers flush once for the whole batch
+		data = [int(v) & 0xFFFFFFFF for v in data] + [0] * (5 - len(data))
+		ev = xevent.ClientMessage(window=xid, client_type=self.atom(message), data=(32, data))
+		self.root.send_event(ev, event_mask=X.SubstructureRedirectMask | X.SubstructureNotifyMask)
+
+	def _queue_state(self, xid, action, *names):
+		atoms = [self.atom(n) for n in names] + [0] * (2 - len(names))
+		self._send(xid, '_NET_WM_STATE', [action] + atoms + [self.SOURCE_PAGER])
+
+	def _queue_restore(self, xid, state):
+		if state == 'minimized':
+			self.display.create_resource_object('window', xid).map()
+		elif state == 'maximized':
+			self._queue_state(xid, self.STATE_REMOVE, '_NET_WM_STATE_MAXIMIZED_VERT', '_NET_WM_STATE_MAXIMIZED_HORZ')
+
+	def _queue_move(self, xid, x, y, w, h, extents):
+		# Positions are the frame's top-left (like SetWindowPos); sizes sent to the WM are the client's
+		left, right, top, bottom = extents
+		if w and h:
+			w, h = max(1, int(w) - left - right), max(1, int(h) - top - bottom)
+		if self.can_moveresize:
+			flags = self.NORTH_WEST_GRAVITY | (1 << 8) | (1 << 9) | (self.SOURCE_PAGER << 12)
+			if w and h:
+				flags |= (1 << 10) | (1 << 11)
+			self._send(xid, '_NET_MOVERESIZE_WINDOW', [flags, x, y, w or 0, h or 0])
+		else:
+			window = self.display.create_resource_object('window', xid)
+			if w and h:
+				window.configure(x=int(x), y=int(y), width=int(w), height=int(h))
+			else:
+				window.configure(x=int(x), y=int(y))
+
+	def restore_window(self, xid):
+		with self._lock:
+			props = self._fetch_properties([xid], ('_NET_WM_STATE', 'WM_STATE'))
+			self._queue_restore(xid, self._show_state(props, xid))
+			self.display.flush()
+
+	def move_window(self, xid, x, y, w=None, h=None):
+		"""Move a window; it is also resized when both w and h are given."""
+		with self._lock:
+			props = self._fetch_properties([xid], ('_NET_FRAME_EXTENTS',))
+			self._queue_move(xid, x, y, w, h, self._extents(props, xid))
+			self.display.flush()
+
+	def minimize_window(self, xid):
+		with self._lock:
+			self._send(xid, 'WM_CHANGE_STATE', [self.ICONIC_STATE])
+			self.display.flush()
+
+	def focus_window(self, xid):
+		with self._lock:
+			self._send(xid, '_NET_ACTIVE_WINDOW', [self.SOURCE_PAGER, X.CurrentTime])
+			self.display.flush()
+
+	def close_window(self, xid):
+		with self._lock:
+			self._send(xid, '_NET_CLOSE_WINDOW', [X.CurrentTime, self.SOURCE_PAGER])
+			self.display.flush()
+
+	def is_responsive(self, xid):
+		# No cheap equivalent of IsHungAppWindow (_NET_WM_PING needs the client to answer)
+		return True
+
+	def watch_locations(self, callback):
+		return X11LocationWatcher(self.display.get_display_name(), callback)
+
+	def apply_placements(self, placements, resize=True):
+		"""
+		Apply {xid: ((left, top, right, bottom), show_state)}: one round trip reads frame
+		extents and states, then every request is queued and sent in a single flush.
+		With resize=False only the positions are applied. Windows that are no longer
+		managed are skipped. Returns the number placed.
+		"""
+		with self._lock:
+			managed = set(self._root_property('_NET_CLIENT_LIST') or ())
+			live = [xid for xid in placements if xid in managed]
+			if not live:
+				return 0
+			props = self._fetch_properties(live, ('_NET_FRAME_EXTENTS', '_NET_WM_STATE', 'WM_STATE'))
+			for xid in live:
+				current = self._show_state(props, xid)
+				if current != 'normal':
+					self._queue_restore(xid, current)
+			for xid in live:
+				(left, top, right, bottom), state = placements[xid]
+				if resize:
+					self._queue_move(xid, left, top, right - left, bottom - top, self._extents(props, xid))
+				else:
+					self._queue_move(xid, left, top, None, None, self._extents(props, xid))
+			for xid in live:
+				state = placements[xid][1]
+				if state == 'minimized':
+					self._send(xid, 'WM_CHANGE_STATE', [self.ICONIC_STATE])
+				elif state == 'maximized':
+					self._queue_state(xid, self.STATE_ADD, '_NET_WM_STATE_MAXIMIZED_VERT', '_NET_WM_STATE_MAXIMIZED_HORZ')
+			self.display.flush()
+		return len(live)
+
+	def _work_area(self):
+		area = self._root_property('_NET_WORKAREA')
+		if not area or len(area) < 4:
+			return None
+		desktop = self._root_property('_NET_CURRENT_DESKTOP')
+		i = int(desktop[0]) * 4 if desktop else 0
+		if i + 4 > len(area):
+			i = 0
+		x, y, w, h = area[i:i + 4]
+		return (x, y, x + w, y + h)
+
+	def enum_monitors(self):
+		"""
+		Monitors from XRandR (1.5 monitors, else active CRTCs, else the whole screen) as
+		list_monitors' raw entries; the work area is the monitor clipped to _NET_WORKAREA.
+		"""
+		with self._lock:
+			work = self._work_area()
+			rects = []
+			try:
+				if hasattr(self.root, 'xrandr_get_monitors'):
+					for m in self.root.xrandr_get_monitors(is_active=True).monitors:
+						rects.append((m.name, bool(m.primary), (m.x, m.y, m.x + m.width_in_pixels, m.y + m.height_in_pixels)))
+				elif self.display.has_extension('RANDR'):
+					res = self.root.xrandr_get_screen_resources()
+					primary = self.root.xrandr_get_output_primary().output
+					for crtc in res.crtcs:
+						info = self.display.xrandr_get_crtc_info(crtc, res.config_timestamp)
+						if info.mode:
+							rects.append((crtc, primary in info.outputs, (info.x, info.y, info.x + info.width, info.y + info.height)))
+			except Exception:
+				rects = []
+			if not rects:
+				screen = self.display.screen()
+				rects = [(0, True, (0, 0, screen.width_in_pixels, screen.height_in_pixels))]
+		if not any(primary for _name, primary, _rc in rects):
+			rects[0] = (rects[0][0], True, rects[0][2])
+		monitors = []
+		for name, primary, rc in rects:
+			rc_work = rc
+			if work:
+				clipped = (max(rc[0], work[0]), max(rc[1], work[1]), min(rc[2], work[2]), min(rc[3], work[3]))
+				if clipped[0] < clipped[2] and clipped[1] < clipped[3]:
+					rc_work = clipped
+			monitors.append({'hMonitor': name, 'isPrimary': primary, 'rcMonitor': rc, 'rcWork': rc_work})
+		return monitors
+
+
+_WINDOW_BACKEND = None
+# Settings.json modification time the backend's match config was read at; None for backends set from outside
+_WINDOW_MATCH_STAMP = None
+
+
+def _settings_stamp():
+	try:
+		return os.stat(get_settings_path()).st_mtime_ns
+	except Exception:
+		return 0
+
+
+def get_window_backend():
+	"""
+	Return the active window backend, creating it on first use: Win32 on Windows,
+	X11 where there is a display and python-xlib. Returns None elsewhere.
+	The match config follows 'window_match' edits in Settings.json without a restart.
+	"""
+	global _WINDOW_BACKEND, _WINDOW_MATCH_STAMP
+	if _WINDOW_BACKEND is None:
+		try:
+			stamp = _settings_stamp()
+			if sys.platform == 'win32':
+				_WINDOW_BACKEND = Win32Backend(window_match_config())
+			elif xdisplay is not None and os.environ.get('DISPLAY'):
+				_WINDOW_BACKEND = X11Backend(window_match_config())
+			_WINDOW_MATCH_STAMP = stamp
+		except Exception:
+			_WINDOW_BACKEND = None
+	elif _WINDOW_MATCH_STAMP is not None:
+		stamp = _settings_stamp()
+		if stamp != _WINDOW_MATCH_STAMP:
+			_WINDOW_MATCH_STAMP = stamp
+			try:
+				_WINDOW_BACKEND.set_match_config(window_match_config())
+			except Exception:
+				pass
+	return _WINDOW_BACKEND
+
+
+def set_window_backend(backend):
+	"""Replace the active window backend (e.g. with a fake one); returns the previous backend."""
+	global _WINDOW_BACKEND, _WINDOW_MATCH_STAMP
+	prev = _WINDOW_BACKEND
+	_WINDOW_BACKEND = backend
+	_WINDOW_MATCH_STAMP = None
+	return prev
+
+
+def move_roblox_windows_top_left(notify=True):
+	"""
+	Restore every Roblox window and move it to the selected monitor's top-left corner.
+	Returns the resulting placements as {hwnd: (left, top, right, bottom)} in enumeration
+	order, so callers can record positions without enumerating windows again.
+	"""
+	backend = get_window_backend()
+	if backend is None:
+		if notify:
+			messagebox.showerror('Unsupported', 'This feature needs Windows or an X11 desktop.')
+		return {}
 
 	found = get_roblox_windows()
 
 	if not found:
-		messagebox.showinfo('No windows', 'No RobloxPlayerBeta.exe windows found.')
-		return
+		if notify:
+			messagebox.showinfo('No windows', 'No RobloxPlayerBeta.exe windows found.')
+		return {}
 
 	# Get selected monitor's work area
 	settings = load_settings()
@@ -415,69 +1752,63 @@ def move_roblox_windows_top_left():
 	else:
 		start_x, start_y = 0, 0
 
+	# The snapshot taken for undo doubles as the current state: windows already at their
+	# target are left alone, which costs no extra OS calls
+	before = snapshot_placements(found)
+	placements = {}
+	moved = skipped = 0
 	for hwnd in found:
 		try:
-			user32.ShowWindow(hwnd, SW_RESTORE)
 			x, y = start_x, start_y
 			if keep_in_bounds:
-				x, y = clamp_to_monitor(hwnd, x, y, monitor_work)
-			user32.SetWindowPos(hwnd, HWND_TOP, x, y, 0, 0, SWP_NOSIZE | SWP_NOZORDER)
+				size = None
+				if hwnd in before:
+					left, top, right, bottom = before[hwnd][0]
+					size = (right - left, bottom - top)
+				x, y = clamp_to_monitor(hwnd, x, y, monitor_work, size=size)
+			if hwnd in before:
+				target = moved_placement(before[hwnd], x, y)
+				if not placement_diff(before, {hwnd: target})[0]:
+					placements[hwnd] = target[0]
+					skipped += 1
+					continue
+			if before.get(hwnd, (None, None))[1] != 'normal':
+				backend.restore_window(hwnd)
+			backend.move_window(hwnd, x, y)
+			rect = backend.get_window_rect(hwnd)
+			if not rect:
+				rect = (int(x), int(y), int(x) + 800, int(y) + 600)
+			placements[hwnd] = rect
+			moved += 1
 		except Exception:
 			pass
+	PLACEMENT_HISTORY.record(before, {hwnd: (rect, 'normal') for hwnd, rect in placements.items()})
+	report_placement_pass(moved, skipped)
+	after_layout_pass()
+	return placements
 
 
 # --- Multi-Monitor Support -------------------------------------------------
 
 def list_monitors():
 	"""
-	Enumerate all monitors on Windows using WinAPI.
+	Enumerate all monitors using WinAPI (or the X11 backend's XRandR query).
 	Returns list of dicts: {hMonitor, name, rcMonitor, rcWork, isPrimary}
 	Names: "Primary", "Monitor #2", "Monitor #3", etc. (sorted by position)
 	rcMonitor: (left, top, right, bottom) - full area
 	rcWork: (left, top, right, bottom) - work area (excluding taskbar)
 	"""
-	raw_monitors = []
-	user32 = ctypes.windll.user32
-
-	class RECT(ctypes.Structure):
-		_fields_ = [
-			('left', wintypes.LONG),
-			('top', wintypes.LONG),
-			('right', wintypes.LONG),
-			('bottom', wintypes.LONG)
-		]
-
-	class MONITORINFO(ctypes.Structure):
-		_fields_ = [
-			('cbSize', wintypes.DWORD),
-			('rcMonitor', RECT),
-			('rcWork', RECT),
-			('dwFlags', wintypes.DWORD)
-		]
-
-	MONITORINFOF_PRIMARY = 1
-
-	@ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HMONITOR, wintypes.HDC, ctypes.POINTER(RECT), wintypes.LPARAM)
-	def enum_proc(hMonitor, hdcMonitor, lprcMonitor, dwData):
+	api = win32_api()
+	if api is not None:
+		raw_monitors = _enum_win32_monitors(api)
+	else:
+		enum_monitors = getattr(get_window_backend(), 'enum_monitors', None)
+		if enum_monitors is None:
+			return []
 		try:
-			mi = MONITORINFO()
-			mi.cbSize = ctypes.sizeof(MONITORINFO)
-			if user32.GetMonitorInfoW(hMonitor, ctypes.byref(mi)):
-				is_primary = bool(mi.dwFlags & MONITORINFOF_PRIMARY)
-				raw_monitors.append({
-					'hMonitor': hMonitor,
-					'isPrimary': is_primary,
-					'rcMonitor': (mi.rcMonitor.left, mi.rcMonitor.top, mi.rcMonitor.right, mi.rcMonitor.bottom),
-					'rcWork': (mi.rcWork.left, mi.rcWork.top, mi.rcWork.right, mi.rcWork.bottom)
-				})
+			raw_monitors = enum_monitors()
 		except Exception:
-			pass
-		return True
-
-	try:
-		user32.EnumDisplayMonitors(None, None, enum_proc, 0)
-	except Exception:
-		pass
+			return []
 
 	# Separate primary and non-primary monitors
 	primary = None
@@ -504,9 +1835,38 @@ def list_monitors():
 	return monitors
 
 
-def get_monitor_work_area(monitor_index=-1):
-	"""
-	Get the work area (rcWork) of a monitor by index.
+def _enum_win32_monitors(api):
+	raw_monitors = []
+	user32 = api.user32
+	MONITORINFOF_PRIMARY = 1
+	mi = MONITORINFO()
+	mi.cbSize = ctypes.sizeof(MONITORINFO)
+
+	@api.MONITORENUMPROC
+	def enum_proc(hMonitor, hdcMonitor, lprcMonitor, dwData):
+		try:
+			if user32.GetMonitorInfoW(hMonitor, ctypes.byref(mi)):
+				is_primary = bool(mi.dwFlags & MONITORINFOF_PRIMARY)
+				raw_monitors.append({
+					'hMonitor': hMonitor,
+					'isPrimary': is_primary,
+					'rcMonitor': (mi.rcMonitor.left, mi.rcMonitor.top, mi.rcMonitor.right, mi.rcMonitor.bottom),
+					'rcWork': (mi.rcWork.left, mi.rcWork.top, mi.rcWork.right, mi.rcWork.bottom)
+				})
+		except Exception:
+			pass
+		return True
+
+	try:
+		user32.EnumDisplayMonitors(None, None, enum_proc, 0)
+	except Exception:
+		pass
+	return raw_monitors
+
+
+def get_monitor_work_area(monitor_index=-1):
+	"""
+	Get the work area (rcWork) of a monitor by index.
 	monitor_index: -1 = primary (default), 1 = Monitor #2, 2 = Monitor #3, etc.
 	Returns: (left, top, right, bottom) or None if not found
 	"""
@@ -539,11 +1899,10 @@ def get_window_size(hwnd):
 	Returns: (width, height) or (800, 600) as fallback
 	"""
 	try:
-		user32 = ctypes.windll.user32
-		rect = wintypes.RECT()
-		if user32.GetWindowRect(hwnd, ctypes.byref(rect)):
-			win_width = rect.right - rect.left
-			win_height = rect.bottom - rect.top
+		rect = get_window_backend().get_window_rect(hwnd)
+		if rect:
+			win_width = rect[2] - rect[0]
+			win_height = rect[3] - rect[1]
 			if win_width > 0 and win_height > 0:
 				return (win_width, win_height)
 	except Exception:
@@ -557,50 +1916,15 @@ def get_roblox_windows(limit=None):
 	If limit is an int > 0, return only the first `limit` HWNDs (sorted ascending).
 	"""
 	try:
-		if sys.platform != 'win32':
+		backend = get_window_backend()
+		if backend is None:
 			return []
-		user32 = ctypes.windll.user32
-		kernel32 = ctypes.windll.kernel32
-		found = []
-
-		@ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
-		def _enum_proc(hwnd, lParam):
-			try:
-				if not user32.IsWindowVisible(hwnd):
-					return True
-			except Exception:
-				return True
-			pid = wintypes.DWORD()
-			user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-			pid_val = pid.value
-			if not pid_val:
-				return True
-			PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
-			hProcess = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid_val)
-			exe_name = None
-			if hProcess:
-				try:
-					buf = ctypes.create_unicode_buffer(260)
-					size = wintypes.DWORD(260)
-					if kernel32.QueryFullProcessImageNameW(hProcess, 0, buf, ctypes.byref(size)):
-						exe_name = os.path.basename(buf.value)
-				except Exception:
-					exe_name = None
-				try:
-					kernel32.CloseHandle(hProcess)
-				except Exception:
-					pass
-			if exe_name and exe_name.lower() == 'robloxplayerbeta.exe':
-				found.append(hwnd)
-			return True
-
-		try:
-			user32.EnumWindows(_enum_proc, 0)
-		except Exception:
-			pass
+		found = list(backend.enum_roblox_windows())
 
-		# Sort HWNDs for deterministic order
+		# Sort HWNDs for deterministic order; with the watchdog on, its slots decide
 		found.sort()
+		if WATCHDOG is not None:
+			found = WATCHDOG.order(found)
 		if isinstance(limit, int) and limit > 0:
 			return found[:limit]
 		return found
@@ -608,10 +1932,28 @@ def get_roblox_windows(limit=None):
 		return []
 
 
-def clamp_to_monitor(hwnd, x, y, monitor_rcWork):
+def get_roblox_window_pids():
+	"""
+	Enumerate open RobloxPlayerBeta.exe windows with their process IDs.
+	Returns {hwnd: pid} ordered by HWND, the same order get_roblox_windows uses.
+	"""
+	try:
+		backend = get_window_backend()
+		if backend is None:
+			return {}
+		clients = dict(sorted(backend.enum_roblox_window_pids()))
+		if WATCHDOG is not None:
+			clients = {hwnd: clients[hwnd] for hwnd in WATCHDOG.order(clients)}
+		return clients
+	except Exception:
+		return {}
+
+
+def clamp_to_monitor(hwnd, x, y, monitor_rcWork, size=None):
 	"""
 	Clamp window position (x, y) to stay within monitor work area.
 	monitor_rcWork: (left, top, right, bottom)
+	size: optional known (width, height); when given the window isn't queried
 	Returns: (x, y) clamped to monitor bounds
 	"""
 	try:
@@ -619,16 +1961,18 @@ def clamp_to_monitor(hwnd, x, y, monitor_rcWork):
 			return (x, y)
 
 		left, top, right, bottom = monitor_rcWork
-		user32 = ctypes.windll.user32
 
 		# Get window dimensions
-		rect = wintypes.RECT()
-		if user32.GetWindowRect(hwnd, ctypes.byref(rect)):
-			win_width = rect.right - rect.left
-			win_height = rect.bottom - rect.top
+		if size and size[0] and size[1]:
+			win_width, win_height = size
 		else:
-			win_width = 800
-			win_height = 600
+			rect = get_window_backend().get_window_rect(hwnd)
+			if rect:
+				win_width = rect[2] - rect[0]
+				win_height = rect[3] - rect[1]
+			else:
+				win_width = 800
+				win_height = 600
 
 		# Clamp x: window left edge >= monitor left, right edge <= monitor right
 		x = max(x, left)
@@ -643,25 +1987,218 @@ def clamp_to_monitor(hwnd, x, y, monitor_rcWork):
 		return (x, y)
 
 
-def stack_next_roblox(win):
-	if sys.platform != 'win32':
-		messagebox.showerror('Unsupported', 'This feature is only supported on Windows.')
-		return
+def _reflow_axis(pos, low, high, span, direction):
+	# Wrap a position that overflowed [low, high] back into range; returns (pos, wraps)
+	if direction > 0:
+		off = pos - low
+	else:
+		off = high - pos
+	if off < span:
+		return pos, 0
+	wraps = off // span
+	off = off % span
+	return (low + off if direction > 0 else high - off), wraps
+
+
+def clamp_layout_to_work_area(positions, sizes, monitor_rcWork, reflow=False, direction=1):
+	"""
+	Clamp a whole layout into a work area in one pass (NumPy when available).
+	positions: sequence of (x, y); sizes: sequence of (width, height); monitor_rcWork: (left, top, right, bottom)
+	Each window gets the same result clamp_to_monitor would give it.
+	With reflow=True, windows running off the bottom wrap back to the top in a new column
+	(one window width over, to the right or, with direction=-1, to the left) instead of
+	piling up in the corner; columns that run off the side wrap the same way.
+	Returns: list of (x, y)
+	"""
+	if not monitor_rcWork:
+		return [(int(x), int(y)) for x, y in positions]
+	left, top, right, bottom = monitor_rcWork
+	direction = -1 if direction < 0 else 1
+
+	if _NUMPY_AVAILABLE:
+		pos = np.asarray(positions, dtype=np.int64).reshape(-1, 2).copy()
+		size = np.asarray(sizes, dtype=np.int64).reshape(-1, 2)
+		lo = np.array([left, top], dtype=np.int64)
+		hi = np.array([right, bottom], dtype=np.int64) - size
+		if reflow and len(pos):
+			span = np.maximum(hi - lo + 1, 1)
+			off_y = pos[:, 1] - top
+			col = np.where(off_y >= span[:, 1], off_y // span[:, 1], 0)
+			pos[:, 1] = np.where(col > 0, top + off_y % span[:, 1], pos[:, 1])
+			pos[:, 0] += col * size[:, 0] * direction
+			off_x = pos[:, 0] - left if direction > 0 else hi[:, 0] - pos[:, 0]
+			over = off_x >= span[:, 0]
+			off_x = off_x % span[:, 0]
+			wrapped_x = left + off_x if direction > 0 else hi[:, 0] - off_x
+			pos[:, 0] = np.where(over, wrapped_x, pos[:, 0])
+		out = np.minimum(np.maximum(pos, lo), hi)
+		return [(int(x), int(y)) for x, y in out.tolist()]
+
+	out = []
+	for (x, y), (w, h) in zip(positions, sizes):
+		hi_x, hi_y = right - w, bottom - h
+		if reflow:
+			span_x = max(hi_x - left + 1, 1)
+			span_y = max(hi_y - top + 1, 1)
+			y, col = _reflow_axis(y, top, hi_y, span_y, 1)
+			x += col * w * direction
+			x, _ = _reflow_axis(x, left, hi_x, span_x, direction)
+		x = min(max(x, left), hi_x)
+		y = min(max(y, top), hi_y)
+		out.append((int(x), int(y)))
+	return out
+
+
+class FreeSpaceIndex:
+	"""
+	Coverage grid over a monitor work area, used to put the next window where it overlaps least.
+	The area is split into `cell`-pixel cells, each counting how many tracked windows cover it.
+	Updating a window touches only the cells it covers. The summed-area table a placement query
+	needs is rebuilt only on the first query after a change (with NumPy when available), so
+	its cost depends on the grid size rather than on how many windows are tracked.
+	"""
+
+	def __init__(self, work_area, cell=24):
+		self.work_area = tuple(int(v) for v in work_area)
+		left, top, right, bottom = self.work_area
+		self.cell = max(1, int(cell))
+		self.cols = max(1, -(-(right - left) // self.cell))
+		self.rows = max(1, -(-(bottom - top) // self.cell))
+		self.counts = [[0] * self.cols for _ in range(self.rows)]
+		self.rects = {}
+		self._sat = None
+
+	def _cell_span(self, rect):
+		left, top, right, bottom = self.work_area
+		c0 = max(0, (rect[0] - left) // self.cell)
+		r0 = max(0, (rect[1] - top) // self.cell)
+		c1 = min(self.cols, -(-(rect[2] - left) // self.cell))
+		r1 = min(self.rows, -(-(rect[3] - top) // self.cell))
+		return c0, r0, c1, r1
+
+	def _add(self, rect, delta):
+		self._sat = None
+		c0, r0, c1, r1 = self._cell_span(rect)
+		for r in range(r0, r1):
+			row = self.counts[r]
+			for c in range(c0, c1):
+				row[c] += delta
+
+	def update(self, key, rect):
+		"""Track (or move) a window's (left, top, right, bottom)."""
+		self.remove(key)
+		rect = tuple(int(v) for v in rect)
+		self.rects[key] = rect
+		self._add(rect, 1)
+
+	def remove(self, key):
+		rect = self.rects.pop(key, None)
+		if rect is not None:
+			self._add(rect, -1)
+
+	def best_position(self, width, height):
+		"""
+		Return the (x, y) where a width x height window overlaps the tracked windows least.
+		Ties go to the top-most, then left-most position.
+		"""
+		left, top, right, bottom = self.work_area
+		cw = min(self.cols, max(1, -(-int(width) // self.cell)))
+		ch = min(self.rows, max(1, -(-int(height) // self.cell)))
+		sat = self._table()
+		if _NUMPY_AVAILABLE:
+			cost = sat[ch:, cw:] - sat[:-ch, cw:] - sat[ch:, :-cw] + sat[:-ch, :-cw]
+			# argmin returns the first minimum in row-major order: top-most, then left-most
+			best_rc = divmod(int(cost.argmin()), cost.shape[1])
+		else:
+			best_rc = self._best_cell(sat, cw, ch)
+		x = left + best_rc[1] * self.cell
+		y = top + best_rc[0] * self.cell
+		# Keep the window inside the work area when the grid rounds past its edge
+		x = max(left, min(x, right - int(width)))
+		y = max(top, min(y, bottom - int(height)))
+		return (int(x), int(y))
 
-	user32 = ctypes.windll.user32
-	kernel32 = ctypes.windll.kernel32
+	def _table(self):
+		# Summed-area table: sat[r][c] = coverage of cells above and left of (r, c)
+		if self._sat is not None:
+			return self._sat
+		if _NUMPY_AVAILABLE:
+			sat = np.zeros((self.rows + 1, self.cols + 1), dtype=np.int64)
+			sat[1:, 1:] = np.asarray(self.counts, dtype=np.int64).cumsum(0).cumsum(1)
+		else:
+			cols = self.cols
+			sat = [[0] * (cols + 1)]
+			for r in range(self.rows):
+				prev = sat[-1]
+				row = self.counts[r]
+				cur = [0] * (cols + 1)
+				acc = 0
+				for c in range(cols):
+					acc += row[c]
+					cur[c + 1] = prev[c + 1] + acc
+				sat.append(cur)
+		self._sat = sat
+		return sat
+
+	def _best_cell(self, sat, cw, ch):
+		best = None
+		best_rc = (0, 0)
+		for r in range(self.rows - ch + 1):
+			top_row = sat[r]
+			bottom_row = sat[r + ch]
+			for c in range(self.cols - cw + 1):
+				cost = bottom_row[c + cw] - top_row[c + cw] - bottom_row[c] + top_row[c]
+				if best is None or cost < best:
+					best = cost
+					best_rc = (r, c)
+					if cost == 0:
+						break
+			if best == 0:
+				break
+		return best_rc
+
+
+def _smart_next_position(win, found, target, size, monitor_work):
+	# Pick the least-overlapping spot for `target` on the selected monitor.
+	area = tuple(monitor_work) if monitor_work else (0, 0, 1920, 1080)
+	index = getattr(win, '_placement_index', None)
+	# Any other layout pass, undo or redo since the last press leaves the index stale
+	if index is None or index.work_area != area or getattr(index, 'history_version', None) != PLACEMENT_HISTORY.version:
+		index = FreeSpaceIndex(area)
+		# Seed once from where the other clients are now; later presses only update the moved window
+		for hwnd, (rect, state) in snapshot_placements([h for h in found if h != target]).items():
+			if state != 'minimized':
+				index.update(hwnd, rect)
+		win._placement_index = index
+	for hwnd in set(index.rects) - set(found):
+		index.remove(hwnd)
+	# The target is about to move: its current spot must not count against it.
+	# stack_next_roblox puts it back at wherever it really ends up.
+	index.remove(target)
+	w, h = size
+	return index.best_position(w, h)
+
+
+def stack_next_roblox(win, notify=True):
+	"""
+	Move the next Roblox window one step down the stair (or to the least-covered spot in
+	smart mode). `win` carries the recording state. Returns the new (x, y), or None.
+	"""
+	backend = get_window_backend()
+	if backend is None:
+		if notify:
+			messagebox.showerror('Unsupported', 'This feature needs Windows or an X11 desktop.')
+		return None
 
 	found = get_roblox_windows()
 
 	if not found or len(found) < 2:
-		messagebox.showinfo('No windows', 'Need at least two Roblox windows to stack.')
-		return
+		if notify:
+			messagebox.showinfo('No windows', 'Need at least two Roblox windows to stack.')
+		return None
 
 	anchor = found[0]
 	others = found[1:]
-	if not others:
-		messagebox.showinfo('No targets', 'No other Roblox windows found to stack.')
-		return
 
 	# Get selected monitor's work area
 	settings = load_settings()
@@ -680,9 +2217,7 @@ def stack_next_roblox(win):
 	last_pos = getattr(win, '_last_moved_pos', None)
 	if last_pos is None:
 		try:
-			rect = wintypes.RECT()
-			user32.GetWindowRect(anchor, ctypes.byref(rect))
-			last_x, last_y = rect.left, rect.top
+			last_x, last_y = backend.get_window_rect(anchor)[:2]
 		except Exception:
 			last_x, last_y = monitor_left, (monitor_work[1] if monitor_work else 0)
 	else:
@@ -691,492 +2226,4674 @@ def stack_next_roblox(win):
 	new_x = int(last_x + 24)
 	new_y = int(last_y + 24)
 
-	HWND_TOP = 0
-	SWP_NOSIZE = 0x0001
-	SWP_NOZORDER = 0x0004
-	SW_RESTORE = 9
+	before = snapshot_placements([target])
+	placed = moved_placement(before.get(target), new_x, new_y)
+	if settings.get('next_placement_mode') == 'smart':
+		try:
+			left, top, right, bottom = placed[0]
+			new_x, new_y = _smart_next_position(win, found, target, (right - left, bottom - top), monitor_work)
+			placed = moved_placement(before.get(target), new_x, new_y)
+		except Exception:
+			pass
 	try:
-		user32.ShowWindow(target, SW_RESTORE)
+		backend.restore_window(target)
 		if keep_in_bounds:
-			new_x, new_y = clamp_to_monitor(target, new_x, new_y, monitor_work)
-		user32.SetWindowPos(target, HWND_TOP, new_x, new_y, 0, 0, SWP_NOSIZE | SWP_NOZORDER)
+			size = (placed[0][2] - placed[0][0], placed[0][3] - placed[0][1])
+			new_x, new_y = clamp_to_monitor(target, new_x, new_y, monitor_work, size=size)
+			placed = moved_placement(before.get(target), new_x, new_y)
+		backend.move_window(target, new_x, new_y)
+		PLACEMENT_HISTORY.record(before, {target: placed})
+		index = getattr(win, '_placement_index', None)
+		if index is not None:
+			# The final (clamped) rect; this pass is then already in the index
+			index.update(target, placed[0])
+			index.history_version = PLACEMENT_HISTORY.version
 	except Exception:
-		pass
+		# Not moved: it still covers its old spot
+		index = getattr(win, '_placement_index', None)
+		if index is not None and target in before and before[target][1] != 'minimized':
+			index.update(target, before[target][0])
+	after_layout_pass()
 
 	try:
 		if not hasattr(win, '_moved_order'):
 			win._moved_order = []
-		win._moved_order.append((new_x, new_y))
+		left, top, right, bottom = placed[0]
+		win._moved_order.append((new_x, new_y, right - left, bottom - top))
 		win._last_moved_pos = (new_x, new_y)
 		win._stack_next_index = (idx + 1) % len(others)
 	except Exception:
 		pass
+	return (new_x, new_y)
 
 
-def open_stacker():
-	win = tk.Toplevel(root)
-	win.title("Stacker")
-	_g = load_window_geometry_settings('stacker')
-	if _g:
+# --- Saved layouts ---------------------------------------------------------
+
+LOAD_SIZE_PRESETS = ["Keep size", "800x600", "640x480", "1024x768", "1280x720"]
+
+
+def parse_layout_entry(entry):
+	"""
+	Parse a saved `roblox_windows` entry.
+	Entries are [x, y] (position only) or [x, y, w, h] (position plus a per-slot size).
+	Returns (x, y, w, h) with w/h set to None when the entry has no size, or None if invalid.
+	"""
+	try:
+		x, y = int(entry[0]), int(entry[1])
+		if len(entry) >= 4 and int(entry[2]) > 0 and int(entry[3]) > 0:
+			return (x, y, int(entry[2]), int(entry[3]))
+		return (x, y, None, None)
+	except Exception:
+		return None
+
+
+def get_uniform_load_size(settings):
+	"""Return the (w, h) every loaded client should get, or None to keep current sizes."""
+	try:
+		size = settings.get('load_uniform_size')
+		if isinstance(size, (list, tuple)) and len(size) == 2:
+			w, h = int(size[0]), int(size[1])
+			if w > 0 and h > 0:
+				return (w, h)
+	except Exception:
+		pass
+	return None
+
+
+def get_force_uniform_size(settings):
+	"""True when the uniform size should override per-slot sizes too ('load_force_uniform')."""
+	return bool(settings.get('load_force_uniform', False)) and get_uniform_load_size(settings) is not None
+
+
+def resolve_slot_size(entry, uniform_size, force_uniform=False):
+	"""
+	Per-slot size from the entry wins over the uniform size, unless force_uniform is set;
+	None keeps the window's size.
+	"""
+	if force_uniform and uniform_size:
+		return uniform_size
+	parsed = parse_layout_entry(entry) if entry is not None else None
+	if parsed and parsed[2]:
+		return (parsed[2], parsed[3])
+	return uniform_size
+
+
+def layout_entry(x, y, w=None, h=None):
+	"""Build a `roblox_windows` entry; the size is stored whenever it is known."""
+	if w and h:
+		return [int(x), int(y), int(w), int(h)]
+	return [int(x), int(y)]
+
+
+# --- Placement history ---------------------------------------------------
+
+def snapshot_placements(hwnds):
+	"""
+	Read {hwnd: ((left, top, right, bottom), show_state)} for the given windows.
+	Windows whose rect can't be read are left out. Backends that can read many windows
+	at once (get_placements) do so.
+	"""
+	snap = {}
+	backend = get_window_backend()
+	if backend is None:
+		return snap
+	bulk = getattr(backend, 'get_placements', None)
+	if bulk is not None:
 		try:
-			_w, _h, _x, _y = _g
-			# Enforce minimum size of 450x260
-			_w = max(_w, 450)
-			_h = max(_h, 260)
-			win.geometry(f'{_w}x{_h}+{_x}+{_y}')
+			return bulk(hwnds)
 		except Exception:
-			win.geometry("450x260")
-	else:
-		win.geometry("450x260")
-	if CURRENT_BG:
+			return snap
+	for hwnd in hwnds:
 		try:
-			win.configure(bg=CURRENT_BG)
+			rect = backend.get_window_rect(hwnd)
+			if rect:
+				snap[hwnd] = (tuple(rect), backend.get_show_state(hwnd))
 		except Exception:
 			pass
-	# removed label to keep only the controls as requested
+	return snap
 
-	win._moved_order = []
-	win._last_moved_pos = None
-	win._stack_next_index = 0
 
-	# Monitor selection controls
-	monitor_frame = tk.Frame(win)
-	if CURRENT_BG:
-		try:
-			monitor_frame.configure(bg=CURRENT_BG)
-		except Exception:
-			pass
-	monitor_frame.pack(pady=4)
+def placement_diff(current, target):
+	"""
+	Split target placements into windows that need moving and windows already in place.
+	Both map hwnd -> ((left, top, right, bottom), show_state); windows missing from
+	`current` always need moving. Returns (changed, skipped) lists of HWNDs.
+	"""
+	changed, skipped = [], []
+	for hwnd, (rect, state) in target.items():
+		cur = current.get(hwnd)
+		if cur is not None and tuple(cur[0]) == tuple(rect) and cur[1] == state:
+			skipped.append(hwnd)
+		else:
+			changed.append(hwnd)
+	return changed, skipped
 
-	lbl_monitor = tk.Label(monitor_frame, text="Monitor:", font=("Arial", 10, "bold"))
-	if CURRENT_BG:
-		try:
-			lbl_monitor.configure(bg=CURRENT_BG)
-			if is_dark_hex(CURRENT_BG):
-				lbl_monitor.configure(fg="white")
-			else:
-				lbl_monitor.configure(fg="black")
-		except Exception:
-			pass
-	lbl_monitor.pack(side=tk.LEFT, padx=(4, 2))
 
-	monitors = list_monitors()
-	monitor_names = [m['name'] for m in monitors]  # ["Primary", "Monitor #2", "Monitor #3", ...]
+# Outcome of the last layout pass: windows moved vs. left alone because already in place
+LAST_PLACEMENT_REPORT = {'moved': 0, 'skipped': 0}
 
-	settings = load_settings()
-	saved_idx = settings.get('selected_monitor_index', -1)
-	
-	# Map saved_idx back to display name
-	if saved_idx == -1:
-		selected_name = "Primary"
+
+def report_placement_pass(moved, skipped):
+	LAST_PLACEMENT_REPORT['moved'] = moved
+	LAST_PLACEMENT_REPORT['skipped'] = skipped
+
+
+def moved_placement(before, x, y, size=None):
+	"""
+	Placement of a window after moving it to (x, y); `before` is its snapshot entry.
+	The size is kept unless a new (width, height) is given.
+	"""
+	if size and size[0] and size[1]:
+		w, h = int(size[0]), int(size[1])
+	elif before:
+		left, top, right, bottom = before[0]
+		w, h = right - left, bottom - top
 	else:
-		# saved_idx N corresponds to "Monitor #(N+1)"
-		target_name = f"Monitor #{saved_idx + 1}"
-		selected_name = target_name if target_name in monitor_names else "Primary"
+		w, h = 800, 600
+	return ((int(x), int(y), int(x) + w, int(y) + h), 'normal')
 
-	monitor_var = tk.StringVar(value=selected_name)
 
-	def _on_monitor_changed(*args):
+class PlacementHistory:
+	"""
+	Undo/redo stack of layout passes.
+	Each step stores only the windows the pass changed, as {hwnd: (before, after)},
+	so memory grows with changed windows rather than open windows. The first placement
+	seen for each window is kept separately so the pre-layout positions can always be restored.
+	Oldest steps are dropped once the estimated size exceeds max_bytes.
+	Thread-safe: passes come from the Tk thread, the control server, the registry and
+	the watchdog. Listeners are called outside the lock.
+	"""
+
+	# Rough per-window cost of one step entry (key + two rect/state tuples)
+	ENTRY_BYTES = 256
+
+	def __init__(self, max_bytes=1024 * 1024):
+		self.max_bytes = max_bytes
+		self._undo = []
+		self._redo = []
+		self._origin = {}
+		self._current = {}
+		self._listeners = []
+		self._bytes = 0
+		self._lock = threading.RLock()
+		# Bumped whenever windows are given placements, so caches of the layout can tell they're stale
+		self.version = 0
+
+	def add_listener(self, fn):
+		"""Call fn(placements) whenever a pass, undo or redo sets windows' placements."""
+		self._listeners.append(fn)
+
+	def remove_listener(self, fn):
 		try:
-			sel = monitor_var.get()
-			s = load_settings()
-			
-			if sel == "Primary":
-				s['selected_monitor_index'] = -1
-			else:
-				# Extract number from "Monitor #X": save X-1
-				parts = sel.split('#')
-				if len(parts) == 2:
-					try:
-						monitor_num = int(parts[1])
-						s['selected_monitor_index'] = monitor_num - 1
-					except Exception:
-						s['selected_monitor_index'] = -1
-				else:
-					s['selected_monitor_index'] = -1
-			
-			save_settings(s)
-		except Exception:
+			self._listeners.remove(fn)
+		except ValueError:
 			pass
 
-	monitor_var.trace('w', _on_monitor_changed)
+	def _set_current(self, placements):
+		# Caller holds the lock
+		self.version += 1
+		self._current.update(placements)
 
-	monitor_combo = tk.OptionMenu(monitor_frame, monitor_var, *monitor_names)
-	if CURRENT_BG:
+	def _notify(self, placements):
+		for fn in list(self._listeners):
+			try:
+				fn(placements)
+			except Exception:
+				pass
+
+	def current(self):
+		"""The placement each tracked window was last given."""
+		with self._lock:
+			return dict(self._current)
+
+	def record(self, before, after):
+		"""
+		Record one layout pass. before/after map hwnd -> (rect, show_state).
+		Returns the number of windows that actually changed.
+		"""
+		with self._lock:
+			for hwnd, placement in before.items():
+				self._origin.setdefault(hwnd, placement)
+			self._set_current(after)
+			delta = {}
+			for hwnd, new in after.items():
+				old = before.get(hwnd)
+				if old is not None and old != new:
+					delta[hwnd] = (old, new)
+			if delta:
+				self._undo.append(delta)
+				self._bytes += len(delta) * self.ENTRY_BYTES
+				self._bytes -= sum(len(d) for d in self._redo) * self.ENTRY_BYTES
+				self._redo = []
+				self._trim()
+		self._notify(after)
+		return len(delta)
+
+	def _trim(self):
+		while self._bytes > self.max_bytes and len(self._undo) > 1:
+			dropped = self._undo.pop(0)
+			self._bytes -= len(dropped) * self.ENTRY_BYTES
+
+	def can_undo(self):
+		with self._lock:
+			return bool(self._undo)
+
+	def can_redo(self):
+		with self._lock:
+			return bool(self._redo)
+
+	def undo(self):
+		"""Pop the last step and return the placements that revert it, or {}."""
+		with self._lock:
+			if not self._undo:
+				return {}
+			delta = self._undo.pop()
+			self._redo.append(delta)
+			placements = {hwnd: old for hwnd, (old, new) in delta.items()}
+			self._set_current(placements)
+		self._notify(placements)
+		return placements
+
+	def redo(self):
+		"""Re-apply the last undone step; returns its placements, or {}."""
+		with self._lock:
+			if not self._redo:
+				return {}
+			delta = self._redo.pop()
+			self._undo.append(delta)
+			placements = {hwnd: new for hwnd, (old, new) in delta.items()}
+			self._set_current(placements)
+		self._notify(placements)
+		return placements
+
+	def origin(self):
+		"""Placements each window had before the first layout pass that touched it."""
+		with self._lock:
+			return dict(self._origin)
+
+	def forget(self, hwnds):
+		"""Drop windows that have closed from every step."""
+		gone = set(hwnds)
+		with self._lock:
+			for stack in (self._undo, self._redo):
+				for delta in stack:
+					for hwnd in gone & delta.keys():
+						del delta[hwnd]
+						self._bytes -= self.ENTRY_BYTES
+				stack[:] = [d for d in stack if d]
+			for hwnd in gone:
+				self._origin.pop(hwnd, None)
+				self._current.pop(hwnd, None)
+
+	def memory_estimate(self):
+		with self._lock:
+			return self._bytes
+
+	def step_count(self):
+		"""Number of steps that can be undone."""
+		with self._lock:
+			return len(self._undo)
+
+
+PLACEMENT_HISTORY = PlacementHistory()
+
+
+def _apply_history_placements(placements):
+	backend = get_window_backend()
+	if backend is None or not placements:
+		return 0
+	try:
+		return backend.apply_placements(placements)
+	except Exception:
+		return 0
+
+
+def undo_placement():
+	"""Move the windows changed by the last layout pass back where they were."""
+	return _apply_history_placements(PLACEMENT_HISTORY.undo())
+
+
+def redo_placement():
+	return _apply_history_placements(PLACEMENT_HISTORY.redo())
+
+
+def restore_pre_layout_positions():
+	"""
+	Put every tracked window back where it was before any layout pass, in one batched move.
+	Recorded as a step of its own so it can be undone.
+	"""
+	origin = PLACEMENT_HISTORY.origin()
+	if not origin:
+		return 0
+	before = snapshot_placements(origin.keys())
+	applied = _apply_history_placements(origin)
+	PLACEMENT_HISTORY.record(before, {hwnd: origin[hwnd] for hwnd in before})
+	return applied
+
+
+# --- Layout pinning ------------------------------------------------------------
+
+class DriftEnforcer:
+	"""
+	Keeps windows at the placement the app last gave them (their slot).
+	Location-change events only mark a window dirty; once it has been quiet for `debounce`
+	seconds (so a drag or a teleport's resize burst is over) it is compared with its slot,
+	and every drifted window due at that moment is put back in one apply_placements batch.
+	The corrections raise events of their own, but by then the windows match their slots
+	and nothing more is sent. If the OS won't let a window take its slot (a minimum size,
+	say), it would be corrected forever; after max_attempts corrections in a row the rect
+	it actually has is adopted as its slot instead. Minimized and maximized windows are
+	left alone: that was done on purpose (by the user or the hidden-client throttle).
+	"""
+
+	def __init__(self, backend, debounce=0.5, clock=time.monotonic, max_attempts=3):
+		self.backend = backend
+		self.debounce = float(debounce)
+		self.clock = clock
+		self.max_attempts = max(1, int(max_attempts))
+		self.targets = {}
+		self._owners = {}
+		self._attempts = {}
+		self._dirty = {}
+		self._lock = threading.Lock()
+		self._wake = threading.Event()
+		self._stop = threading.Event()
+		self._thread = None
+		self._watcher = None
+		self.events = 0
+		self.batches = 0
+		self.corrected = 0
+
+	def _pid(self, hwnd):
 		try:
-			monitor_combo.configure(bg=CURRENT_BG)
-			if is_dark_hex(CURRENT_BG):
-				monitor_combo.configure(fg="white")
-			else:
-				monitor_combo.configure(fg="black")
+			return self.backend.get_window_pid(hwnd)
 		except Exception:
-			pass
-	monitor_combo.pack(side=tk.LEFT, padx=2)
-
-	bounds_var = tk.BooleanVar(value=settings.get('keep_in_bounds', False))
+			return None
 
-	def _on_bounds_changed(*args):
+	def set_targets(self, placements):
+		"""Adopt {hwnd: (rect, show_state)} as the slots of those windows."""
+		# The owning PID tells a reused HWND apart from the window that was pinned
+		owners = {hwnd: self._pid(hwnd) for hwnd in placements}
+		with self._lock:
+			self.targets.update(placements)
+			self._owners.update(owners)
+			for hwnd in placements:
+				self._dirty.pop(hwnd, None)
+				self._attempts.pop(hwnd, None)
+
+	def forget(self, hwnds):
+		"""Stop pinning windows that have closed (their HWNDs may be reused)."""
+		with self._lock:
+			for hwnd in hwnds:
+				self.targets.pop(hwnd, None)
+				self._owners.pop(hwnd, None)
+				self._dirty.pop(hwnd, None)
+				self._attempts.pop(hwnd, None)
+
+	def on_location_change(self, hwnd, now=None):
+		"""Event hook: note that `hwnd` moved; cheap, runs on the event thread."""
+		if hwnd not in self.targets:
+			return
+		self.events += 1
+		with self._lock:
+			self._dirty[hwnd] = self.clock() if now is None else now
+		self._wake.set()
+
+	def next_deadline(self):
+		with self._lock:
+			if not self._dirty:
+				return None
+			return min(self._dirty.values()) + self.debounce
+
+	def due(self, now):
+		"""
+		Pop the windows that have been quiet for the debounce time. Once one is due, those
+		within the last quarter of theirs come along, so one burst makes one batch.
+		"""
+		with self._lock:
+			if not any(now - t >= self.debounce for t in self._dirty.values()):
+				return []
+			threshold = self.debounce * 0.75
+			ready = [h for h, t in self._dirty.items() if now - t >= threshold]
+			for hwnd in ready:
+				del self._dirty[hwnd]
+			return ready
+
+	def correct(self, hwnds):
+		"""Put drifted windows among `hwnds` back in one batch; returns how many moved."""
+		with self._lock:
+			targets = {h: self.targets[h] for h in hwnds if h in self.targets}
+			owners = {h: self._owners.get(h) for h in targets}
+		reused = [h for h in targets if owners[h] is not None and self._pid(h) != owners[h]]
+		if reused:
+			self.forget(reused)
+			for hwnd in reused:
+				del targets[hwnd]
+		current = {}
+		for hwnd in targets:
+			try:
+				rect = self.backend.get_window_rect(hwnd)
+				if rect:
+					current[hwnd] = (tuple(rect), self.backend.get_show_state(hwnd))
+			except Exception:
+				pass
+		changed, in_place = placement_diff(current, {h: targets[h] for h in current})
+		batch = {}
+		with self._lock:
+			for hwnd in in_place:
+				self._attempts.pop(hwnd, None)
+			for hwnd in changed:
+				if current[hwnd][1] != 'normal':
+					continue
+				attempts = self._attempts.get(hwnd, 0) + 1
+				if attempts > self.max_attempts:
+					# The window keeps ending up elsewhere: accept where it is as its slot
+					if hwnd in self.targets:
+						self.targets[hwnd] = current[hwnd]
+					self._attempts.pop(hwnd, None)
+					continue
+				self._attempts[hwnd] = attempts
+				batch[hwnd] = targets[hwnd]
+		if not batch:
+			return 0
 		try:
-			s = load_settings()
-			s['keep_in_bounds'] = bounds_var.get()
-			save_settings(s)
+			moved = self.backend.apply_placements(batch)
 		except Exception:
-			pass
+			return 0
+		self.batches += 1
+		self.corrected += moved
+		return moved
+
+	def run_pending(self, now=None):
+		ready = self.due(self.clock() if now is None else now)
+		return self.correct(ready) if ready else 0
+
+	def _run(self):
+		# Sleeps until the earliest dirty window comes due; with no events it just waits
+		while not self._stop.is_set():
+			deadline = self.next_deadline()
+			timeout = None if deadline is None else max(0.0, deadline - self.clock())
+			self._wake.wait(timeout)
+			self._wake.clear()
+			if not self._stop.is_set():
+				self.run_pending()
+
+	def start(self):
+		if self._thread is not None:
+			return
+		self._stop.clear()
+		self._thread = threading.Thread(target=self._run, name='drift-enforcer', daemon=True)
+		self._thread.start()
+		try:
+			self._watcher = self.backend.watch_locations(self.on_location_change)
+		except Exception:
+			self._watcher = None
 
-	bounds_var.trace('w', _on_bounds_changed)
+	def stop(self):
+		watcher = self._watcher
+		self._watcher = None
+		if watcher is not None:
+			try:
+				watcher.stop()
+			except Exception:
+				pass
+		self._stop.set()
+		self._wake.set()
+		thread = self._thread
+		self._thread = None
+		if thread is not None:
+			thread.join(timeout=2.0)
 
-	chk_bounds = tk.Checkbutton(monitor_frame, text="Keep in bounds", variable=bounds_var, font=("Arial", 10, "bold"))
-	if CURRENT_BG:
+
+DRIFT_ENFORCER = None
+
+
+def start_drift_enforcer():
+	"""Pin windows to the slots of the layout passes that follow (and the last one, if any)."""
+	global DRIFT_ENFORCER
+	backend = get_window_backend()
+	if backend is None or DRIFT_ENFORCER is not None:
+		return DRIFT_ENFORCER
+	try:
+		debounce = int(load_settings().get('drift_debounce_ms', 500)) / 1000.0
+	except Exception:
+		debounce = 0.5
+	enforcer = DriftEnforcer(backend, debounce=debounce)
+	enforcer.set_targets(PLACEMENT_HISTORY.current())
+	PLACEMENT_HISTORY.add_listener(enforcer.set_targets)
+	enforcer.start()
+	DRIFT_ENFORCER = enforcer
+	return enforcer
+
+
+def stop_drift_enforcer():
+	global DRIFT_ENFORCER
+	enforcer = DRIFT_ENFORCER
+	DRIFT_ENFORCER = None
+	if enforcer is not None:
+		PLACEMENT_HISTORY.remove_listener(enforcer.set_targets)
+		enforcer.stop()
+
+
+# --- Client resource governor ----------------------------------------------
+
+PRIORITY_LEVELS = ('normal', 'below_normal', 'idle')
+
+
+class Win32ProcessControl:
+	"""Priority class and CPU affinity control through kernel32."""
+
+	PROCESS_SET_QUOTA = 0x0100
+	PROCESS_SET_INFORMATION = 0x0200
+	PROCESS_VM_READ = 0x0010
+	PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+	SYNCHRONIZE = 0x00100000
+	STILL_ACTIVE = 259
+	PRIORITY_CLASSES = {
+		'normal': 0x00000020,
+		'below_normal': 0x00004000,
+		'idle': 0x00000040,
+	}
+
+	def __init__(self):
+		self.kernel32 = _require_win32_api().kernel32
+		self._exit_handles = {}
+
+	def cpu_count(self):
+		return os.cpu_count() or 1
+
+	def can_raise_priority(self):
+		# Any process we may lower we may also put back to normal
+		return True
+
+	def _open(self, pid):
+		return self.kernel32.OpenProcess(self.PROCESS_SET_INFORMATION | self.PROCESS_QUERY_LIMITED_INFORMATION, False, int(pid))
+
+	def set_priority(self, pid, level):
+		h = self._open(pid)
+		if not h:
+			return False
 		try:
-			chk_bounds.configure(bg=CURRENT_BG)
-			if is_dark_hex(CURRENT_BG):
+			return bool(self.kernel32.SetPriorityClass(h, self.PRIORITY_CLASSES[level]))
+		finally:
+			self.kernel32.CloseHandle(h)
+
+	def set_affinity(self, pid, cpus):
+		"""Pin a process to the given CPU indices (an empty list means all CPUs)."""
+		cpus = list(cpus) or list(range(self.cpu_count()))
+		mask = 0
+		for c in cpus:
+			mask |= 1 << int(c)
+		h = self._open(pid)
+		if not h:
+			return False
+		try:
+			return bool(self.kernel32.SetProcessAffinityMask(h, mask))
+		finally:
+			self.kernel32.CloseHandle(h)
+
+	def get_memory(self, pid):
+		"""Working set size in bytes, or None."""
+		h = self.kernel32.OpenProcess(self.PROCESS_QUERY_LIMITED_INFORMATION | self.PROCESS_VM_READ, False, int(pid))
+		if not h:
+			return None
+		try:
+			pmc = PROCESS_MEMORY_COUNTERS()
+			pmc.cb = ctypes.sizeof(pmc)
+			if self.kernel32.K32GetProcessMemoryInfo(h, ctypes.byref(pmc), pmc.cb):
+				return int(pmc.WorkingSetSize)
+			return None
+		finally:
+			self.kernel32.CloseHandle(h)
+
+	def trim_working_set(self, pid):
+		"""Ask Windows to page out as much of the process as it can."""
+		h = self.kernel32.OpenProcess(self.PROCESS_QUERY_LIMITED_INFORMATION | self.PROCESS_SET_QUOTA, False, int(pid))
+		if not h:
+			return False
+		try:
+			return bool(self.kernel32.K32EmptyWorkingSet(h))
+		finally:
+			self.kernel32.CloseHandle(h)
+
+	def track_exit(self, pid):
+		"""Hold a handle to the process so its exit code can still be read after it exits."""
+		pid = int(pid)
+		if pid in self._exit_handles:
+			return
+		h = self.kernel32.OpenProcess(self.SYNCHRONIZE | self.PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+		if h:
+			self._exit_handles[pid] = h
+
+	def untrack_exit(self, pid):
+		h = self._exit_handles.pop(int(pid), None)
+		if h:
+			self.kernel32.CloseHandle(h)
+
+	def exit_code(self, pid):
+		"""Exit code of a tracked process, or None if it's still running or wasn't tracked."""
+		h = self._exit_handles.get(int(pid))
+		if not h:
+			return None
+		code = wintypes.DWORD()
+		if not self.kernel32.GetExitCodeProcess(h, ctypes.byref(code)) or code.value == self.STILL_ACTIVE:
+			return None
+		self.untrack_exit(pid)
+		return int(code.value)
+
+
+class PsutilProcessControl:
+	"""Same operations through psutil, for platforms without kernel32."""
+
+	def __init__(self):
+		import psutil
+		self.psutil = psutil
+		if hasattr(psutil, 'BELOW_NORMAL_PRIORITY_CLASS'):
+			self.priorities = {
+				'normal': psutil.NORMAL_PRIORITY_CLASS,
+				'below_normal': psutil.BELOW_NORMAL_PRIORITY_CLASS,
+				'idle': psutil.IDLE_PRIORITY_CLASS,
+			}
+		else:
+			self.priorities = {'normal': 0, 'below_normal': 10, 'idle': 19}
+
+	def cpu_count(self):
+		return self.psutil.cpu_count() or 1
+
+	def can_raise_priority(self):
+		"""
+		Whether a lowered priority can be put back to normal. Without root, POSIX only lets a
+		process raise its nice value; Linux allows lowering it again only as far as RLIMIT_NICE.
+		"""
+		if not hasattr(os, 'geteuid') or os.geteuid() == 0:
+			return True
+		try:
+			import resource
+			soft = resource.getrlimit(resource.RLIMIT_NICE)[0]
+		except Exception:
+			return False
+		# The limit allows nice values down to 20 - soft
+		return soft == resource.RLIM_INFINITY or soft >= 20
+
+	def set_priority(self, pid, level):
+		try:
+			self.psutil.Process(int(pid)).nice(self.priorities[level])
+			return True
+		except Exception:
+			return False
+
+	def set_affinity(self, pid, cpus):
+		try:
+			self.psutil.Process(int(pid)).cpu_affinity(list(cpus))
+			return True
+		except Exception:
+			return False
+
+	def get_memory(self, pid):
+		try:
+			return int(self.psutil.Process(int(pid)).memory_info().rss)
+		except Exception:
+			return None
+
+	def trim_working_set(self, pid):
+		# No portable way to ask another process to release its working set
+		return False
+
+	def track_exit(self, pid):
+		pass
+
+	def untrack_exit(self, pid):
+		pass
+
+	def exit_code(self, pid):
+		# Only our own children report one; for anything else psutil returns None
+		try:
+			return self.psutil.Process(int(pid)).wait(timeout=0)
+		except Exception:
+			return None
+
+
+_PROCESS_CONTROL = None
+
+
+def get_process_control():
+	"""
+	Return the active process-control layer: kernel32 on Windows, psutil elsewhere when installed.
+	Returns None when neither is available.
+	"""
+	global _PROCESS_CONTROL
+	if _PROCESS_CONTROL is None:
+		try:
+			if sys.platform == 'win32':
+				_PROCESS_CONTROL = Win32ProcessControl()
+			else:
+				_PROCESS_CONTROL = PsutilProcessControl()
+		except Exception:
+			_PROCESS_CONTROL = None
+	return _PROCESS_CONTROL
+
+
+def set_process_control(control):
+	"""Replace the process-control layer (e.g. with a fake one); returns the previous one."""
+	global _PROCESS_CONTROL
+	prev = _PROCESS_CONTROL
+	_PROCESS_CONTROL = control
+	return prev
+
+
+class ResourceGovernor:
+	"""
+	Lowers the priority of unfocused Roblox clients and keeps the focused one at normal priority.
+	With pin_affinity, background clients are spread over the CPUs round-robin (one CPU each,
+	assigned in the order clients are first seen) and the focused client may use every CPU.
+	The last state applied to each PID is remembered, so sync() only issues OS calls for
+	clients whose desired state changed, which on a focus change is the old and new focus.
+	Priorities are only lowered when they can be raised again: an unprivileged Linux user
+	usually can't renice back to 0, and a client stuck in the background would stay slow.
+	"""
+
+	def __init__(self, control, background_priority='below_normal', pin_affinity=False):
+		self.control = control
+		self.background_priority = background_priority if background_priority in PRIORITY_LEVELS else 'below_normal'
+		self.pin_affinity = bool(pin_affinity)
+		try:
+			self.lower_priority = bool(control.can_raise_priority())
+		except Exception:
+			self.lower_priority = True
+		self.focused_hwnd = None
+		self._applied = {}
+		self._cores = {}
+		self._next_core = 0
+
+	def _core_for(self, pid):
+		if pid not in self._cores:
+			self._cores[pid] = self._next_core % max(1, self.control.cpu_count())
+			self._next_core += 1
+		return self._cores[pid]
+
+	def desired_state(self, pid, focused):
+		if focused:
+			return ('normal', ())
+		cpus = (self._core_for(pid),) if self.pin_affinity else ()
+		return (self.background_priority if self.lower_priority else 'normal', cpus)
+
+	def sync(self, clients, focused_hwnd):
+		"""
+		Bring every client to its desired state.
+		clients: {hwnd: pid}; focused_hwnd: the foreground window (may not be a client).
+		Returns the number of processes that were changed.
+		"""
+		self.focused_hwnd = focused_hwnd
+		focused_pid = clients.get(focused_hwnd)
+		live = set(clients.values())
+		for pid in list(self._applied):
+			if pid not in live:
+				del self._applied[pid]
+				self._cores.pop(pid, None)
+		changed = 0
+		for pid in dict.fromkeys(clients.values()):
+			state = self.desired_state(pid, pid == focused_pid)
+			if self._applied.get(pid) == state:
+				continue
+			self._apply(pid, state)
+			changed += 1
+		return changed
+
+	def _apply(self, pid, state):
+		priority, cpus = state
+		# Untouched processes run at normal priority on every CPU
+		prev_priority, prev_cpus = self._applied.get(pid, ('normal', ()))
+		try:
+			if prev_priority != priority:
+				ok = self.control.set_priority(pid, priority)
+				if not ok and priority == 'normal':
+					# Raising was refused (e.g. EPERM): stop lowering anyone else
+					self.lower_priority = False
+			if prev_cpus != cpus:
+				self.control.set_affinity(pid, cpus)
+		except Exception:
+			pass
+		self._applied[pid] = state
+
+	def restore_all(self):
+		"""Put every governed client back to normal priority on all CPUs."""
+		for pid, (priority, cpus) in list(self._applied.items()):
+			try:
+				if priority != 'normal':
+					self.control.set_priority(pid, 'normal')
+				if cpus:
+					self.control.set_affinity(pid, ())
+			except Exception:
+				pass
+		self._applied = {}
+		self._cores = {}
+		self._next_core = 0
+
+
+RESOURCE_GOVERNOR = None
+GOVERNOR_POLL_MS = 250
+
+
+def start_resource_governor():
+	"""
+	Start governing client priorities from the settings.
+	The foreground window is polled cheaply on the Tk loop; clients are only enumerated
+	and re-governed when it changes.
+	"""
+	global RESOURCE_GOVERNOR
+	control = get_process_control()
+	if control is None:
+		return None
+	s = load_settings()
+	if RESOURCE_GOVERNOR is not None:
+		RESOURCE_GOVERNOR.restore_all()
+	RESOURCE_GOVERNOR = ResourceGovernor(
+		control,
+		background_priority=s.get('governor_background_priority', 'below_normal'),
+		pin_affinity=s.get('governor_pin_affinity', False),
+	)
+	gov = RESOURCE_GOVERNOR
+	last_fg = [object()]
+
+	def _tick():
+		if RESOURCE_GOVERNOR is not gov:
+			return
+		try:
+			backend = get_window_backend()
+			fg = backend.get_foreground_window() if backend else None
+			if fg != last_fg[0]:
+				last_fg[0] = fg
+				gov.sync(get_roblox_window_pids(), fg)
+		except Exception:
+			pass
+		try:
+			root.after(GOVERNOR_POLL_MS, _tick)
+		except Exception:
+			pass
+
+	_tick()
+	return gov
+
+
+def stop_resource_governor():
+	global RESOURCE_GOVERNOR
+	gov = RESOURCE_GOVERNOR
+	RESOURCE_GOVERNOR = None
+	if gov is not None:
+		gov.restore_all()
+
+
+# --- Idle client memory manager --------------------------------------------
+
+def format_bytes(n):
+	if n is None:
+		return '?'
+	if n >= 1024 ** 3:
+		return f"{n / 1024 ** 3:.1f} GB"
+	return f"{n / 1024 ** 2:.0f} MB"
+
+
+class MemoryManager:
+	"""
+	Trims the working set of clients that have been unfocused for a while.
+	- A client is idle once it hasn't had focus for idle_seconds; an idle client is trimmed once,
+	  then again every retrim_seconds while it stays idle.
+	- If budget_bytes is set and the clients use more than that in total, the longest-idle
+	  unfocused clients are trimmed too, until the projected total fits.
+	run_once() does one whole cycle (read usage, decide, trim) and takes the current time,
+	so the policy can be driven with a fake clock; start() runs it on a background thread.
+	"""
+
+	def __init__(self, control, idle_seconds=120, budget_bytes=0, retrim_seconds=300, interval=15):
+		self.control = control
+		self.idle_seconds = idle_seconds
+		self.budget_bytes = budget_bytes
+		self.retrim_seconds = retrim_seconds
+		self.interval = interval
+		self.last_focus = {}
+		self.last_trim = {}
+		self.report = ([], 0)
+		self._lock = threading.Lock()
+		self._stop = threading.Event()
+		self._thread = None
+
+	def plan(self, clients, focused_pid, usage, now):
+		"""
+		Decide which PIDs to trim.
+		clients: {hwnd: pid}; usage: {pid: bytes or None}
+		Returns a list of PIDs, longest-idle first.
+		"""
+		pids = list(dict.fromkeys(clients.values()))
+		for pid in pids:
+			self.last_focus.setdefault(pid, now)
+		if focused_pid is not None:
+			self.last_focus[focused_pid] = now
+		live = set(pids)
+		for d in (self.last_focus, self.last_trim):
+			for pid in list(d):
+				if pid not in live:
+					del d[pid]
+
+		def _due(pid):
+			last = self.last_trim.get(pid)
+			# Trimmed since it last had focus: wait retrim_seconds before doing it again
+			if last is not None and last >= self.last_focus[pid]:
+				return now - last >= self.retrim_seconds
+			return True
+
+		candidates = sorted((pid for pid in pids if pid != focused_pid), key=lambda p: self.last_focus[p])
+		trims = [pid for pid in candidates if now - self.last_focus[pid] >= self.idle_seconds and _due(pid)]
+		if self.budget_bytes:
+			total = sum(usage.get(pid) or 0 for pid in pids)
+			# Assume a trim frees most of a client's working set
+			projected = total - sum(usage.get(pid) or 0 for pid in trims)
+			for pid in candidates:
+				if projected <= self.budget_bytes:
+					break
+				if pid in trims or not _due(pid):
+					continue
+				trims.append(pid)
+				projected -= usage.get(pid) or 0
+		return trims
+
+	def run_once(self, clients, focused_hwnd, now):
+		"""One cycle: read usage, trim what plan() picks, update the report. Returns trimmed PIDs."""
+		usage = {}
+		for pid in dict.fromkeys(clients.values()):
+			try:
+				usage[pid] = self.control.get_memory(pid)
+			except Exception:
+				usage[pid] = None
+		trims = self.plan(clients, clients.get(focused_hwnd), usage, now)
+		for pid in trims:
+			try:
+				if self.control.trim_working_set(pid):
+					usage[pid] = self.control.get_memory(pid)
+			except Exception:
+				pass
+			self.last_trim[pid] = now
+		rows = [(hwnd, pid, usage.get(pid)) for hwnd, pid in clients.items()]
+		total = sum(b or 0 for b in usage.values())
+		with self._lock:
+			self.report = (rows, total)
+		return trims
+
+	def get_report(self):
+		"""([(hwnd, pid, bytes), ...], total_bytes) from the latest cycle; safe from any thread."""
+		with self._lock:
+			return self.report
+
+	def start(self):
+		if self._thread is not None:
+			return
+
+		def _loop():
+			while not self._stop.is_set():
+				try:
+					backend = get_window_backend()
+					if backend is not None:
+						self.run_once(get_roblox_window_pids(), backend.get_foreground_window(), time.monotonic())
+				except Exception:
+					pass
+				self._stop.wait(self.interval)
+
+		self._thread = threading.Thread(target=_loop, name='memory-manager', daemon=True)
+		self._thread.start()
+
+	def stop(self):
+		self._stop.set()
+		self._thread = None
+
+
+MEMORY_MANAGER = None
+
+
+def start_memory_manager():
+	"""(Re)start the memory manager from the settings; trims happen on its own thread."""
+	global MEMORY_MANAGER
+	control = get_process_control()
+	if control is None:
+		return None
+	stop_memory_manager()
+	s = load_settings()
+	try:
+		budget = int(s.get('memory_budget_mb', 0)) * 1024 * 1024
+	except Exception:
+		budget = 0
+	MEMORY_MANAGER = MemoryManager(
+		control,
+		idle_seconds=s.get('memory_trim_idle_seconds', 120),
+		budget_bytes=budget,
+		interval=s.get('memory_check_seconds', 15),
+	)
+	MEMORY_MANAGER.start()
+	return MEMORY_MANAGER
+
+
+def stop_memory_manager():
+	global MEMORY_MANAGER
+	mgr = MEMORY_MANAGER
+	MEMORY_MANAGER = None
+	if mgr is not None:
+		mgr.stop()
+
+
+def memory_report_text():
+	"""One-line summary of the latest memory report for the Stacker window."""
+	mgr = MEMORY_MANAGER
+	if mgr is None:
+		return ''
+	rows, total = mgr.get_report()
+	if not rows:
+		return 'Memory: no clients'
+	parts = [f"#{i} {format_bytes(b)}" for i, (hwnd, pid, b) in enumerate(rows, start=1)]
+	return f"Memory {format_bytes(total)}: " + ', '.join(parts)
+
+
+# --- Client registry ---------------------------------------------------------
+
+class ClientRegistry:
+	"""
+	Live table of Roblox clients keyed by HWND.
+	Each row is a dict (pid, title, rect, state, responsive, memory). Every change bumps a version
+	and stamps the row with it, so views ask changes_since(version) and redraw only what changed.
+	Safe to update from a background thread and read from the Tk thread.
+	"""
+
+	def __init__(self):
+		self.rows = {}
+		self.version = 0
+		self._stamps = {}
+		self._removed = {}
+		self._lock = threading.Lock()
+
+	def update(self, hwnd, **fields):
+		"""Merge fields into a row (creating it); returns True if anything changed."""
+		with self._lock:
+			row = self.rows.get(hwnd)
+			if row is None:
+				row = self.rows[hwnd] = {}
+				self._removed.pop(hwnd, None)
+			changed = False
+			for k, v in fields.items():
+				if row.get(k, object()) != v:
+					row[k] = v
+					changed = True
+			if changed:
+				self.version += 1
+				self._stamps[hwnd] = self.version
+			return changed
+
+	def remove(self, hwnd):
+		with self._lock:
+			if self.rows.pop(hwnd, None) is not None:
+				self.version += 1
+				self._stamps.pop(hwnd, None)
+				self._removed[hwnd] = self.version
+
+	def sync(self, clients):
+		"""Add/remove rows so they match {hwnd: pid}; returns (added, removed) HWNDs."""
+		with self._lock:
+			known = set(self.rows)
+		added = [hwnd for hwnd in clients if hwnd not in known]
+		removed = [hwnd for hwnd in known if hwnd not in clients]
+		for hwnd in removed:
+			self.remove(hwnd)
+		for hwnd in added:
+			self.update(hwnd, pid=clients[hwnd])
+		return added, removed
+
+	def changes_since(self, version):
+		"""Return (current_version, {hwnd: row copy} changed after `version`, set of removed HWNDs)."""
+		with self._lock:
+			changed = {hwnd: dict(self.rows[hwnd]) for hwnd, v in self._stamps.items() if v > version}
+			removed = {hwnd for hwnd, v in self._removed.items() if v > version}
+			return self.version, changed, removed
+
+	def snapshot(self):
+		with self._lock:
+			return {hwnd: dict(row) for hwnd, row in self.rows.items()}
+
+
+CLIENT_REGISTRY = ClientRegistry()
+_REGISTRY_THREAD = None
+_REGISTRY_STOP = threading.Event()
+_REGISTRY_LOCK = threading.Lock()
+REGISTRY_REFRESH_SECONDS = 1.0
+
+
+def refresh_client_registry(registry=None, backend=None):
+	"""One background refresh: match the client set, then update each client's live fields."""
+	registry = registry or CLIENT_REGISTRY
+	backend = backend or get_window_backend()
+	if backend is None:
+		return
+	clients = dict(sorted(backend.enum_roblox_window_pids()))
+	added, removed = registry.sync(clients)
+	PLACEMENT_HISTORY.forget(removed)
+	enforcer = DRIFT_ENFORCER
+	if enforcer is not None:
+		enforcer.forget(removed)
+	mem = {}
+	mgr = MEMORY_MANAGER
+	if mgr is not None:
+		mem = {pid: b for hwnd, pid, b in mgr.get_report()[0]}
+	control = get_process_control() if mgr is None else None
+	for hwnd, pid in clients.items():
+		try:
+			fields = {
+				'rect': backend.get_window_rect(hwnd),
+				'state': backend.get_show_state(hwnd),
+				'responsive': backend.is_responsive(hwnd),
+				'title': backend.get_window_title(hwnd),
+			}
+			if pid in mem:
+				fields['memory'] = mem[pid]
+			elif control is not None:
+				fields['memory'] = control.get_memory(pid)
+			registry.update(hwnd, **fields)
+		except Exception:
+			pass
+
+
+def start_client_registry():
+	"""Keep CLIENT_REGISTRY fresh from a background thread (idempotent)."""
+	global _REGISTRY_THREAD, _REGISTRY_STOP
+	with _REGISTRY_LOCK:
+		if _REGISTRY_THREAD is not None and _REGISTRY_THREAD.is_alive() and not _REGISTRY_STOP.is_set():
+			return
+		# Each thread gets its own stop event, so a stopping thread can't be revived by a restart
+		stop = _REGISTRY_STOP = threading.Event()
+
+		def _loop():
+			while not stop.is_set():
+				try:
+					refresh_client_registry()
+				except Exception:
+					pass
+				stop.wait(REGISTRY_REFRESH_SECONDS)
+
+		_REGISTRY_THREAD = threading.Thread(target=_loop, name='client-registry', daemon=True)
+		_REGISTRY_THREAD.start()
+
+
+def stop_client_registry():
+	global _REGISTRY_THREAD
+	with _REGISTRY_LOCK:
+		_REGISTRY_STOP.set()
+		_REGISTRY_THREAD = None
+
+
+def move_clients_to_monitor(hwnds, monitor_index):
+	"""
+	Stair the given clients down from the top-left of a monitor's work area (using the
+	saved dX/dY) in one batched move; recorded in the placement history.
+	"""
+	backend = get_window_backend()
+	if backend is None or not hwnds:
+		return 0
+	s = load_settings()
+	dx = s.get('load_stair_dx', 24)
+	dy = s.get('load_stair_dy', 24)
+	work = get_monitor_work_area(monitor_index) or (0, 0, 1920, 1080)
+	before = snapshot_placements(hwnds)
+	after = {}
+	for i, hwnd in enumerate(h for h in hwnds if h in before):
+		after[hwnd] = moved_placement(before[hwnd], work[0] + i * dx, work[1] + i * dy)
+	try:
+		# Only staired down: sizes stay whatever they are
+		backend.apply_placements(after, resize=False)
+	except Exception:
+		return 0
+	PLACEMENT_HISTORY.record(before, after)
+	return len(after)
+
+
+def apply_client_action(hwnds, op):
+	"""Restore, minimize or close each of the given clients; returns how many it was done to."""
+	backend = get_window_backend()
+	if backend is None:
+		return 0
+	done = 0
+	for hwnd in hwnds:
+		try:
+			if op == 'restore':
+				backend.restore_window(hwnd)
+			elif op == 'minimize':
+				backend.minimize_window(hwnd)
+			elif op == 'close':
+				# Closed on purpose: the watchdog must not relaunch it
+				if WATCHDOG is not None:
+					WATCHDOG.release([hwnd])
+				backend.close_window(hwnd)
+			else:
+				continue
+			done += 1
+		except Exception:
+			pass
+	return done
+
+
+# --- Hidden client throttling ----------------------------------------------
+
+def _rect_area(r):
+	return max(0, r[2] - r[0]) * max(0, r[3] - r[1])
+
+
+def _rects_intersect(a, b):
+	return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def _subtract_rect(a, b):
+	"""Return the parts of rect a not covered by rect b, as up to four disjoint rects."""
+	if not _rects_intersect(a, b):
+		return [a]
+	left, top, right, bottom = a
+	out = []
+	if b[1] > top:
+		out.append((left, top, right, b[1]))
+	if b[3] < bottom:
+		out.append((left, b[3], right, bottom))
+	mid_top, mid_bottom = max(top, b[1]), min(bottom, b[3])
+	if b[0] > left:
+		out.append((left, mid_top, b[0], mid_bottom))
+	if b[2] < right:
+		out.append((b[2], mid_top, right, mid_bottom))
+	return out
+
+
+def find_hidden_windows(rects_in_zorder, screens):
+	"""
+	Work out which windows can't be seen.
+	rects_in_zorder: [(key, (left, top, right, bottom)), ...] top-most first
+	screens: monitor rects; a window with no visible part on any of them counts as hidden
+	Returns the set of keys that are fully covered by windows above them or off-screen.
+	The covered region is kept as a list of disjoint rects: each window's visible parts are
+	what is left after subtracting that region, and those parts are then added to it, so the
+	region never needs re-merging and each window only splits against pieces it touches.
+	"""
+	covered = []
+	hidden = set()
+	for key, rect in rects_in_zorder:
+		rect = tuple(int(v) for v in rect)
+		if _rect_area(rect) == 0:
+			hidden.add(key)
+			continue
+		visible = [rect]
+		for piece in covered:
+			if not visible:
+				break
+			if not _rects_intersect(rect, piece):
+				continue
+			nxt = []
+			for v in visible:
+				nxt.extend(_subtract_rect(v, piece))
+			visible = nxt
+		covered.extend(visible)
+		on_screen = any(_rects_intersect(v, scr) for v in visible for scr in screens) if screens else bool(visible)
+		if not on_screen:
+			hidden.add(key)
+	return hidden
+
+
+class HiddenClientThrottler:
+	"""
+	Minimizes clients nobody can see (fully covered by other clients or off every monitor)
+	so they stop rendering, and brings them back on demand.
+	"""
+
+	def __init__(self):
+		self.minimized = set()
+
+	def apply(self, backend, screens):
+		"""Run one pass over the current clients; returns the HWNDs minimized by this pass."""
+		order = [hwnd for hwnd, pid in backend.enum_roblox_window_pids()]
+		rects = []
+		for hwnd in order:
+			try:
+				if backend.get_show_state(hwnd) == 'minimized':
+					continue
+				# Shown again (focused from the taskbar, restored by hand): no longer ours to restore
+				self.minimized.discard(hwnd)
+				rect = backend.get_window_rect(hwnd)
+				if rect:
+					rects.append((hwnd, rect))
+			except Exception:
+				pass
+		live = set(order)
+		self.minimized &= live
+		newly = []
+		for hwnd in find_hidden_windows(rects, screens):
+			try:
+				backend.minimize_window(hwnd)
+				self.minimized.add(hwnd)
+				newly.append(hwnd)
+			except Exception:
+				pass
+		return newly
+
+	def restore_all(self, backend):
+		restored = 0
+		for hwnd in list(self.minimized):
+			try:
+				if backend.get_show_state(hwnd) == 'minimized':
+					backend.restore_window(hwnd)
+					restored += 1
+			except Exception:
+				pass
+		self.minimized = set()
+		return restored
+
+
+HIDDEN_THROTTLER = HiddenClientThrottler()
+
+
+def throttle_hidden_clients():
+	"""Minimize every client that is fully covered or off-screen."""
+	backend = get_window_backend()
+	if backend is None:
+		return []
+	try:
+		screens = [m['rcMonitor'] for m in list_monitors()]
+	except Exception:
+		screens = []
+	return HIDDEN_THROTTLER.apply(backend, screens)
+
+
+def restore_hidden_clients():
+	"""Bring back every client minimized by throttle_hidden_clients (F4)."""
+	backend = get_window_backend()
+	if backend is None:
+		return 0
+	return HIDDEN_THROTTLER.restore_all(backend)
+
+
+def after_layout_pass():
+	# Hook run at the end of every layout pass (Top Left, Next, Load)
+	try:
+		if load_settings().get('throttle_hidden_enabled', False):
+			throttle_hidden_clients()
+	except Exception:
+		pass
+	try:
+		refresh_broadcast_layout()
+	except Exception:
+		pass
+
+
+def apply_saved_layout(notify=True):
+	"""
+	Move open Roblox windows into the saved layout (stair from the chosen corner, per-slot sizes).
+	Returns the number of windows now in the layout, including ones that were already in
+	place and so weren't touched (see LAST_PLACEMENT_REPORT). With notify=False problems
+	are not shown in a message box (for callers off the Tk thread).
+	"""
+	moved = 0
+	skipped = 0
+	try:
+		s = load_settings()
+		mapping = s.get('roblox_windows', {})
+		if not mapping:
+			if notify:
+				messagebox.showinfo('No saved', 'No saved windows found in Settings.json')
+			return 0
+		backend = get_window_backend()
+		if backend is None:
+			if notify:
+				messagebox.showerror('Unsupported', 'This feature needs Windows or an X11 desktop.')
+			return 0
+
+		# Use system helper to enumerate Roblox windows
+		found = get_roblox_windows()
+		items = sorted(mapping.items(), key=lambda kv: int(kv[0].lstrip('#')) if kv[0].lstrip('#').isdigit() else 0)
+		count = min(len(items), len(found))
+		if count == 0:
+			if notify:
+				messagebox.showinfo('No windows', 'No open Roblox windows to move')
+			return 0
+		# Get selected monitor's work area
+		monitor_index = s.get('selected_monitor_index', -1)
+		keep_in_bounds = s.get('keep_in_bounds', False)
+		monitor_work = get_monitor_work_area(monitor_index)
+		
+		# Get placement mode and stair spacing
+		corner_mode = s.get('load_start_corner', 'top_left')
+		dx = s.get('load_stair_dx', 24)
+		dy = s.get('load_stair_dy', 24)
+		
+		if not monitor_work:
+			monitor_left, monitor_top, monitor_right, monitor_bottom = 0, 0, 1920, 1080
+		else:
+			monitor_left, monitor_top, monitor_right, monitor_bottom = monitor_work
+		
+		# Sizes: per-slot [x, y, w, h] entries override the uniform size unless it is forced;
+		# None keeps the current size
+		uniform_size = get_uniform_load_size(s)
+		force_uniform = get_force_uniform_size(s)
+		slot_sizes = [resolve_slot_size(items[i][1], uniform_size, force_uniform) for i in range(count)]
+		before = snapshot_placements(found[:count])
+
+		if corner_mode == 'top_right':
+			# For top-right, get first window's width to offset properly
+			try:
+				first_hwnd = found[0]
+				if slot_sizes[0]:
+					win_w, win_h = slot_sizes[0]
+				elif first_hwnd in before:
+					left, top, right, bottom = before[first_hwnd][0]
+					win_w, win_h = right - left, bottom - top
+				else:
+					win_w, win_h = get_window_size(first_hwnd)
+				base_x = monitor_right - win_w
+				base_y = monitor_top
+			except Exception:
+				base_x = monitor_right - 800
+				base_y = monitor_top
+		else:
+			# top_left mode (default)
+			base_x = monitor_left
+			base_y = monitor_top
+		
+		positions = []
+		sizes = []
+		for i in range(count):
+			if corner_mode == 'top_right':
+				# Down-left stairway: start at top-right, move left and down
+				x = base_x - i * dx
+			else:
+				# Down-right stairway: start at top-left, move right and down
+				x = base_x + i * dx
+			y = base_y + i * dy
+			if corner_mode == 'saved':
+				# Positions exactly as recorded (e.g. by Capture Layout)
+				parsed = parse_layout_entry(items[i][1])
+				if parsed:
+					x, y = parsed[0], parsed[1]
+			# Known size (layout or snapshot) so clamping needs no extra window query
+			left, top, right, bottom = moved_placement(before.get(found[i]), x, y, slot_sizes[i])[0]
+			positions.append((x, y))
+			sizes.append((right - left, bottom - top))
+		if keep_in_bounds:
+			positions = clamp_layout_to_work_area(
+				positions, sizes, monitor_work,
+				reflow=s.get('reflow_in_bounds', False),
+				direction=-1 if corner_mode == 'top_right' else 1)
+
+		after = {}
+		for i in range(count):
+			try:
+				x, y = positions[i]
+				hwnd = found[i]
+				target = moved_placement(before.get(hwnd), x, y, slot_sizes[i])
+				after[hwnd] = target
+				if hwnd in before and not placement_diff(before, {hwnd: target})[0]:
+					skipped += 1
+					continue
+				if before.get(hwnd, (None, None))[1] != 'normal':
+					backend.restore_window(hwnd)
+				if slot_sizes[i]:
+					backend.move_window(hwnd, x, y, slot_sizes[i][0], slot_sizes[i][1])
+				else:
+					backend.move_window(hwnd, x, y)
+				moved += 1
+			except Exception:
+				pass
+		PLACEMENT_HISTORY.record(before, after)
+		report_placement_pass(moved, skipped)
+		after_layout_pass()
+	except Exception:
+		pass
+	return moved + skipped
+
+
+def layout_mapping_from(found, placements, previous=None):
+	"""
+	Build a `roblox_windows` mapping for the clients in `found` (slot order) from their
+	current placements. Minimized or unknown windows keep their previously saved entry,
+	then the spot the app last put them, so their slot isn't lost.
+	"""
+	previous = previous or {}
+	last_set = PLACEMENT_HISTORY.current()
+	mapping = {}
+	for i, hwnd in enumerate(found, start=1):
+		placement = placements.get(hwnd)
+		if placement is None or placement[1] != 'normal':
+			if f'#{i}' in previous:
+				mapping[f'#{i}'] = previous[f'#{i}']
+				continue
+			placement = last_set.get(hwnd)
+			if placement is None:
+				continue
+		left, top, right, bottom = placement[0]
+		mapping[f'#{i}'] = layout_entry(left, top, right - left, bottom - top)
+	return mapping
+
+
+def capture_current_layout():
+	"""
+	Save where every client is right now as the layout: one enumeration, one settings write.
+	Switches Load to 'saved' positions so loading puts them back exactly. Returns the
+	number of slots saved.
+	"""
+	if get_window_backend() is None:
+		return 0
+	found = get_roblox_windows()
+	if not found:
+		return 0
+	placements = snapshot_placements(found)
+	s = load_settings()
+	mapping = layout_mapping_from(found, placements, s.get('roblox_windows'))
+	s['roblox_windows'] = mapping
+	s['load_start_corner'] = 'saved'
+	save_settings(s)
+	return len(mapping)
+
+
+class LayoutRecorder:
+	"""
+	Live layout recording: move events mark clients dirty, and `flush_delay` seconds after
+	the first one the saved layout is rebuilt with one enumeration and written once, so a
+	drag of many windows costs one settings write rather than one per event. Moves of
+	windows that aren't known clients trigger (at most once per flush_delay) a new
+	enumeration, so clients opened after recording started are picked up.
+	The settings write goes through `post` (e.g. onto the Tk thread, where every other
+	settings write happens); by default it runs in place.
+	"""
+
+	def __init__(self, backend, flush_delay=1.0, clock=time.monotonic, post=None):
+		self.backend = backend
+		self.flush_delay = float(flush_delay)
+		self.clock = clock
+		self.post = post
+		self._dirty_since = None
+		self._probe_since = None
+		self._lock = threading.Lock()
+		self._wake = threading.Event()
+		self._stop = threading.Event()
+		self._thread = None
+		self._watcher = None
+		self._clients = set()
+		self.events = 0
+		self.flushes = 0
+
+	def on_location_change(self, hwnd, now=None):
+		now = self.clock() if now is None else now
+		with self._lock:
+			if hwnd in self._clients:
+				self.events += 1
+				if self._dirty_since is None:
+					self._dirty_since = now
+			elif self._probe_since is None:
+				self._probe_since = now
+			else:
+				return
+		self._wake.set()
+
+	def flush_due(self, now):
+		with self._lock:
+			return self._dirty_since is not None and now - self._dirty_since >= self.flush_delay
+
+	def probe_due(self, now):
+		with self._lock:
+			return self._probe_since is not None and now - self._probe_since >= self.flush_delay
+
+	def probe(self):
+		"""Re-enumerate the clients; returns True if new ones appeared (they count as moved)."""
+		with self._lock:
+			self._probe_since = None
+		found = set(get_roblox_windows())
+		new = found - self._clients
+		self._clients = found
+		if new:
+			with self._lock:
+				if self._dirty_since is None:
+					self._dirty_since = self.clock() - self.flush_delay
+		return bool(new)
+
+	def flush(self, post=True):
+		"""Rebuild the layout from the clients' current placements and save it if it changed."""
+		with self._lock:
+			self._dirty_since = None
+		found = get_roblox_windows()
+		self._clients = set(found)
+		if not found:
+			return 0
+		placements = snapshot_placements(found)
+
+		def _write():
+			s = load_settings()
+			mapping = layout_mapping_from(found, placements, s.get('roblox_windows'))
+			if mapping == s.get('roblox_windows') and s.get('load_start_corner') == 'saved':
+				return
+			s['roblox_windows'] = mapping
+			s['load_start_corner'] = 'saved'
+			save_settings(s)
+			self.flushes += 1
+
+		if post and self.post is not None:
+			self.post(_write)
+		else:
+			_write()
+		return len(found)
+
+	def _next_timeout(self):
+		with self._lock:
+			deadlines = [t + self.flush_delay for t in (self._dirty_since, self._probe_since) if t is not None]
+		return None if not deadlines else max(0.0, min(deadlines) - self.clock())
+
+	def _run(self):
+		while not self._stop.is_set():
+			self._wake.wait(self._next_timeout())
+			self._wake.clear()
+			if self._stop.is_set():
+				break
+			try:
+				now = self.clock()
+				if self.probe_due(now):
+					self.probe()
+				if self.flush_due(self.clock()):
+					self.flush()
+			except Exception:
+				pass
+
+	def start(self):
+		if self._thread is not None:
+			return
+		self._clients = set(get_roblox_windows())
+		self._stop.clear()
+		self._thread = threading.Thread(target=self._run, name='layout-recorder', daemon=True)
+		self._thread.start()
+		try:
+			self._watcher = self.backend.watch_locations(self.on_location_change)
+		except Exception:
+			self._watcher = None
+
+	def stop(self):
+		"""Stop listening; pending changes are written out first."""
+		watcher = self._watcher
+		self._watcher = None
+		if watcher is not None:
+			try:
+				watcher.stop()
+			except Exception:
+				pass
+		self._stop.set()
+		self._wake.set()
+		thread = self._thread
+		self._thread = None
+		if thread is not None:
+			thread.join(timeout=2.0)
+		if self._dirty_since is not None:
+			# Written in place: on shutdown the Tk loop may already be gone
+			try:
+				self.flush(post=False)
+			except Exception:
+				pass
+
+
+LAYOUT_RECORDER = None
+
+
+def start_layout_recording():
+	global LAYOUT_RECORDER
+	backend = get_window_backend()
+	if backend is None or LAYOUT_RECORDER is not None:
+		return LAYOUT_RECORDER
+	LAYOUT_RECORDER = LayoutRecorder(backend, post=lambda fn: root.after(0, fn))
+	LAYOUT_RECORDER.start()
+	return LAYOUT_RECORDER
+
+
+def stop_layout_recording():
+	global LAYOUT_RECORDER
+	recorder = LAYOUT_RECORDER
+	LAYOUT_RECORDER = None
+	if recorder is not None:
+		recorder.stop()
+
+
+# --- Crash watchdog --------------------------------------------------------------
+
+class ClientWatchdog:
+	"""
+	Tracks one slot per client and notices when a slot's client exits (its window is gone).
+	If a launcher is set, vacated slots are relaunched with exponential backoff
+	(base_delay * 2**attempts, capped at max_delay), at most `max_concurrent` at a time;
+	a launch that shows no window within launch_timeout counts as a failed attempt.
+	Whichever new client window appears next fills the oldest vacated slot and is moved
+	back to that slot's placement; no other window is touched. Slots also define the
+	client order (see order), so a new HWND doesn't reshuffle everyone else's slot.
+	With a process-control layer, a client whose process exited with code 0 was closed
+	normally: its slot is dropped instead of relaunched. When the exit code can't be read
+	the exit counts as a crash.
+	Everything happens in tick(), which reads the client list once; window moves go
+	through `post` (e.g. onto the Tk thread) after the watchdog lock is released.
+	"""
+
+	def __init__(self, list_clients, launcher=None, backend=None, base_delay=5.0, max_delay=300.0,
+			max_concurrent=2, launch_timeout=120.0, clock=time.monotonic, process_control=None, post=None):
+		self.list_clients = list_clients
+		self.launcher = launcher
+		self.backend = backend
+		self.process_control = process_control
+		self.post = post
+		self.base_delay = float(base_delay)
+		self.max_delay = float(max_delay)
+		self.max_concurrent = max(1, int(max_concurrent))
+		self.launch_timeout = float(launch_timeout)
+		self.clock = clock
+		self.slots = []
+		self._lock = threading.Lock()
+		self.relaunches = 0
+		self.restored = 0
+
+	def backoff(self, attempts):
+		return min(self.max_delay, self.base_delay * (2 ** attempts))
+
+	def _track(self, pid):
+		if self.process_control is not None and pid:
+			try:
+				self.process_control.track_exit(pid)
+			except Exception:
+				pass
+
+	def _clean_exit(self, pid):
+		if self.process_control is None or not pid:
+			return False
+		try:
+			return self.process_control.exit_code(pid) == 0
+		except Exception:
+			return False
+
+	def _new_slot(self, hwnd, pid):
+		self._track(pid)
+		return {'state': 'running', 'hwnd': hwnd, 'pid': pid, 'placement': self._read_placement(hwnd),
+			'attempts': 0, 'next_try': None, 'launched_at': None, 'vacated_at': None}
+
+	def _read_placement(self, hwnd):
+		if self.backend is None:
+			return None
+		try:
+			rect = self.backend.get_window_rect(hwnd)
+			return (tuple(rect), 'normal') if rect else None
+		except Exception:
+			return None
+
+	def adopt(self, clients):
+		"""Start tracking {hwnd: pid} (in slot order) as slots 1..n."""
+		with self._lock:
+			self.slots = [self._new_slot(hwnd, pid) for hwnd, pid in clients.items()]
+
+	def release(self, hwnds):
+		"""Forget the slots of clients closed on purpose, so they aren't relaunched."""
+		gone = set(hwnds)
+		with self._lock:
+			for s in self.slots:
+				if s['hwnd'] in gone and s['state'] == 'running' and self.process_control is not None:
+					try:
+						self.process_control.untrack_exit(s['pid'])
+					except Exception:
+						pass
+			self.slots = [s for s in self.slots if s['hwnd'] not in gone or s['state'] != 'running']
+
+	def order(self, hwnds):
+		"""Order HWNDs by slot; windows without a slot follow in their given order."""
+		# Called from enumeration on any thread while tick() may be rewriting the slots
+		with self._lock:
+			index = {s['hwnd']: i for i, s in enumerate(self.slots) if s['state'] == 'running'}
+		return sorted(hwnds, key=lambda h: index.get(h, len(index)))
+
+	def _slot_placement(self, slot):
+		# Prefer where the app last put the slot's old window, else where it was when adopted
+		placed = PLACEMENT_HISTORY.current().get(slot['hwnd'])
+		return placed or slot['placement']
+
+	def _restore(self, slot, hwnd, pid):
+		"""Give the slot to a new window; returns the placement to move it to, or None."""
+		placement = self._slot_placement(slot)
+		slot.update(state='running', hwnd=hwnd, pid=pid, attempts=0, next_try=None, launched_at=None, vacated_at=None)
+		self._track(pid)
+		if placement is None or self.backend is None:
+			slot['placement'] = self._read_placement(hwnd)
+			return None
+		slot['placement'] = placement
+		return placement
+
+	def _apply_restores(self, moves):
+		try:
+			before = snapshot_placements(list(moves))
+			self.backend.apply_placements(moves)
+			PLACEMENT_HISTORY.record(before, moves)
+			self.restored += len(moves)
+		except Exception:
+			pass
+
+	def tick(self, now=None):
+		"""One watchdog step; returns a list of (event, slot_number) for logging/tests."""
+		now = self.clock() if now is None else now
+		events = []
+		moves = {}
+		clients = self.list_clients()
+		with self._lock:
+			# Exits; clean ones give up their slot
+			closed = []
+			for i, slot in enumerate(self.slots):
+				if slot['state'] == 'running' and slot['hwnd'] not in clients:
+					if self._clean_exit(slot['pid']):
+						closed.append(slot)
+						events.append(('closed', i + 1))
+						continue
+					slot['placement'] = self._slot_placement(slot)
+					slot.update(state='vacant', attempts=0, next_try=now + self.base_delay, vacated_at=now)
+					events.append(('exited', i + 1))
+			if closed:
+				self.slots = [s for s in self.slots if s not in closed]
+			# New windows fill vacated slots: launched ones first, then the longest vacant
+			known = {s['hwnd'] for s in self.slots if s['state'] == 'running'}
+			waiting = [s for s in self.slots if s['state'] in ('launching', 'vacant')]
+			waiting.sort(key=lambda s: (s['state'] != 'launching', s['launched_at'] or 0, s['vacated_at'] or 0))
+			for hwnd, pid in clients.items():
+				if hwnd in known:
+					continue
+				if waiting:
+					slot = waiting.pop(0)
+					placement = self._restore(slot, hwnd, pid)
+					if placement is not None:
+						moves[hwnd] = placement
+					events.append(('restored', self.slots.index(slot) + 1))
+				else:
+					self.slots.append(self._new_slot(hwnd, pid))
+					events.append(('added', len(self.slots)))
+			# Launches that never produced a window
+			for i, slot in enumerate(self.slots):
+				if slot['state'] == 'launching' and now - slot['launched_at'] >= self.launch_timeout:
+					slot['attempts'] += 1
+					slot.update(state='vacant', next_try=now + self.backoff(slot['attempts']))
+					events.append(('timeout', i + 1))
+			# Relaunch, oldest due first, within the concurrency cap
+			if self.launcher is not None:
+				busy = sum(1 for s in self.slots if s['state'] == 'launching')
+				due = [(s['next_try'], i) for i, s in enumerate(self.slots)
+					if s['state'] == 'vacant' and s['next_try'] is not None and now >= s['next_try']]
+				for _t, i in sorted(due):
+					if busy >= self.max_concurrent:
+						break
+					slot = self.slots[i]
+					try:
+						self.launcher(i + 1)
+					except Exception:
+						slot['attempts'] += 1
+						slot['next_try'] = now + self.backoff(slot['attempts'])
+						events.append(('launch_failed', i + 1))
+						continue
+					slot.update(state='launching', launched_at=now)
+					busy += 1
+					self.relaunches += 1
+					events.append(('launched', i + 1))
+		if moves:
+			if self.post is not None:
+				self.post(lambda: self._apply_restores(moves))
+			else:
+				self._apply_restores(moves)
+		return events
+
+	def status(self):
+		with self._lock:
+			return [(i + 1, s['state'], s['hwnd'], s['attempts']) for i, s in enumerate(self.slots)]
+
+
+def make_client_launcher(command):
+	"""
+	Launcher for ClientWatchdog from the 'watchdog_launch_command' setting: a command line
+	or a URI (e.g. a roblox:// link); '{slot}' is replaced with the slot number.
+	"""
+	def _launch(slot):
+		cmd = str(command).replace('{slot}', str(slot))
+		if sys.platform == 'win32' and '://' in cmd.split(' ', 1)[0]:
+			os.startfile(cmd)
+			return None
+		import subprocess
+		if sys.platform == 'win32':
+			# CreateProcess parses the command line itself; splitting it would re-quote quoted paths
+			return subprocess.Popen(cmd)
+		import shlex
+		return subprocess.Popen(shlex.split(cmd))
+	return _launch
+
+
+WATCHDOG = None
+WATCHDOG_POLL_SECONDS = 2.0
+
+
+def _watchdog_clients():
+	backend = get_window_backend()
+	if backend is None:
+		return {}
+	return dict(sorted(backend.enum_roblox_window_pids()))
+
+
+def start_watchdog():
+	"""Track the current clients as slots and watch them from a background thread."""
+	global WATCHDOG
+	backend = get_window_backend()
+	if backend is None or WATCHDOG is not None:
+		return WATCHDOG
+	s = load_settings()
+	command = s.get('watchdog_launch_command')
+	watchdog = ClientWatchdog(
+		_watchdog_clients,
+		launcher=make_client_launcher(command) if command else None,
+		backend=backend,
+		base_delay=s.get('watchdog_base_delay', 5),
+		max_delay=s.get('watchdog_max_delay', 300),
+		max_concurrent=s.get('watchdog_max_concurrent', 2),
+		process_control=get_process_control(),
+		post=lambda fn: root.after(0, fn),
+	)
+	watchdog.adopt(_watchdog_clients())
+	watchdog.stop_event = threading.Event()
+	WATCHDOG = watchdog
+
+	def _loop():
+		while not watchdog.stop_event.wait(WATCHDOG_POLL_SECONDS):
+			try:
+				watchdog.tick()
+			except Exception:
+				pass
+
+	threading.Thread(target=_loop, name='watchdog', daemon=True).start()
+	return watchdog
+
+
+def stop_watchdog():
+	global WATCHDOG
+	watchdog = WATCHDOG
+	WATCHDOG = None
+	if watchdog is not None:
+		watchdog.stop_event.set()
+
+
+# --- UI responsiveness -------------------------------------------------------------
+
+class LoopLagMonitor:
+	"""
+	Measures how long the Tk event loop is blocked: a heartbeat is scheduled every
+	`interval` seconds with after(), and how late each one runs is added to a histogram
+	of fixed millisecond buckets, so memory stays constant however long it runs.
+	"""
+
+	BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 250, 500, 1000, 2500)
+
+	def __init__(self, widget, interval=0.1, clock=time.perf_counter):
+		self.widget = widget
+		self.interval = max(0.001, float(interval))
+		self.clock = clock
+		self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+		self.samples = 0
+		self.total_ms = 0.0
+		self.max_ms = 0.0
+		self._due = None
+		self._job = None
+		self._lock = threading.Lock()
+
+	def record(self, lag_ms):
+		lag_ms = max(0.0, float(lag_ms))
+		i = 0
+		while i < len(self.BUCKETS_MS) and lag_ms > self.BUCKETS_MS[i]:
+			i += 1
+		with self._lock:
+			self.counts[i] += 1
+			self.samples += 1
+			self.total_ms += lag_ms
+			self.max_ms = max(self.max_ms, lag_ms)
+
+	def percentile(self, q):
+		"""Upper bound (ms) of the bucket holding the q-th percentile, capped at the worst lag seen."""
+		with self._lock:
+			if not self.samples:
+				return 0.0
+			rank = q / 100.0 * self.samples
+			seen = 0
+			for i, n in enumerate(self.counts):
+				seen += n
+				if n and seen >= rank:
+					bound = float(self.BUCKETS_MS[i]) if i < len(self.BUCKETS_MS) else self.max_ms
+					return round(min(bound, self.max_ms), 2)
+			return round(self.max_ms, 2)
+
+	def stats(self):
+		with self._lock:
+			samples, total, worst = self.samples, self.total_ms, self.max_ms
+			buckets = {f'<={b}ms': n for b, n in zip(self.BUCKETS_MS, self.counts)}
+			buckets[f'>{self.BUCKETS_MS[-1]}ms'] = self.counts[-1]
+		return {
+			'samples': samples,
+			'mean_ms': round(total / samples, 2) if samples else 0.0,
+			'p50_ms': self.percentile(50),
+			'p99_ms': self.percentile(99),
+			'max_ms': round(worst, 2),
+			'buckets': buckets,
+		}
+
+	def _beat(self):
+		now = self.clock()
+		if self._due is not None:
+			self.record((now - self._due) * 1000.0)
+		self._due = now + self.interval
+		self._job = self.widget.after(int(self.interval * 1000), self._beat)
+
+	def start(self):
+		if self._job is None:
+			self._due = None
+			self._job = self.widget.after(0, self._beat)
+
+	def stop(self):
+		job = self._job
+		self._job = None
+		if job is not None:
+			try:
+				self.widget.after_cancel(job)
+			except Exception:
+				pass
+
+
+LOOP_LAG_MONITOR = None
+
+
+def start_loop_lag_monitor():
+	"""Start the heartbeat on the main window (setting loop_lag_interval_ms); Tk thread only."""
+	global LOOP_LAG_MONITOR
+	if LOOP_LAG_MONITOR is not None:
+		return LOOP_LAG_MONITOR
+	try:
+		interval = int(load_settings().get('loop_lag_interval_ms', 100)) / 1000.0
+	except Exception:
+		interval = 0.1
+	LOOP_LAG_MONITOR = LoopLagMonitor(root, interval=interval)
+	LOOP_LAG_MONITOR.start()
+	return LOOP_LAG_MONITOR
+
+
+def stop_loop_lag_monitor():
+	global LOOP_LAG_MONITOR
+	monitor = LOOP_LAG_MONITOR
+	LOOP_LAG_MONITOR = None
+	if monitor is not None:
+		monitor.stop()
+
+
+def describe_loop_lag():
+	"""One-line summary of the UI lag histogram for the dashboard."""
+	monitor = LOOP_LAG_MONITOR
+	if monitor is None:
+		return 'UI lag: not measured (enable it in Settings)'
+	st = monitor.stats()
+	if not st['samples']:
+		return 'UI lag: measuring...'
+	return f"UI lag: p50 {st['p50_ms']:g} ms, p99 {st['p99_ms']:g} ms, max {st['max_ms']:g} ms ({st['samples']} samples)"
+
+
+# --- Local control server ----------------------------------------------------
+
+class ControlServer:
+	"""
+	Opt-in local automation endpoint speaking JSON lines.
+	Each request is one line like {"id": 1, "cmd": "stack_next"}; each reply is one line
+	{"id": 1, "ok": true, "result": ...} or {"id": 1, "ok": false, "error": "..."}.
+	The asyncio loop runs on its own thread and serves any number of connections at once;
+	the commands themselves run one at a time on a single worker thread, so window operations
+	from different scripts never interleave. Listens on 127.0.0.1:port, or on a Unix socket
+	when `path` is given and the platform has them.
+	"""
+
+	def __init__(self, commands, host='127.0.0.1', port=0, path=None, token=None):
+		import concurrent.futures
+		self.commands = commands
+		self.host = host
+		self.port = port
+		self.path = path
+		self.token = token
+		self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='window-ops')
+		self.requests_served = 0
+		self.address = None
+		self._loop = None
+		self._server = None
+		self._thread = None
+		self._ready = threading.Event()
+
+	HTTP_METHODS = (b'GET ', b'POST ', b'PUT ', b'HEAD ', b'OPTIONS ', b'DELETE ', b'PATCH ', b'CONNECT ')
+
+	@classmethod
+	def looks_like_http(cls, line):
+		# A web page can POST to localhost; its request line must not be answered line by line
+		return line.startswith(cls.HTTP_METHODS) or b' HTTP/1.' in line
+
+	def handle(self, request):
+		"""Run one decoded request and build its reply (called on the worker thread)."""
+		reply = {'id': request.get('id')}
+		try:
+			if self.token and request.get('token') != self.token:
+				raise PermissionError('bad token')
+			func = self.commands.get(request.get('cmd'))
+			if func is None:
+				raise ValueError(f"unknown command: {request.get('cmd')!r}")
+			reply['ok'] = True
+			reply['result'] = func(request)
+		except Exception as e:
+			reply['ok'] = False
+			reply['error'] = str(e) or e.__class__.__name__
+		return reply
+
+	async def _serve_client(self, reader, writer):
+		import asyncio
+		loop = asyncio.get_running_loop()
+		try:
+			while True:
+				line = await reader.readline()
+				if not line:
+					break
+				line = line.strip()
+				if not line:
+					continue
+				if self.looks_like_http(line):
+					break
+				try:
+					request = json.loads(line)
+					if not isinstance(request, dict):
+						raise ValueError('request must be a JSON object')
+				except Exception as e:
+					reply = {'id': None, 'ok': False, 'error': f'bad request: {e}'}
+				else:
+					reply = await loop.run_in_executor(self.executor, self.handle, request)
+				self.requests_served += 1
+				writer.write(json.dumps(reply).encode('utf-8') + b'\n')
+				await writer.drain()
+		except (Exception, asyncio.CancelledError):
+			# Server shutting down or client went away
+			pass
+		finally:
+			try:
+				writer.close()
+			except Exception:
+				pass
+
+	def start(self):
+		"""Start serving on a background thread; returns the bound address once listening."""
+		import asyncio
+
+		async def _main():
+			if self.path and hasattr(asyncio, 'start_unix_server'):
+				try:
+					os.unlink(self.path)
+				except OSError:
+					pass
+				self._server = await asyncio.start_unix_server(self._serve_client, path=self.path)
+				self.address = self.path
+			else:
+				self._server = await asyncio.start_server(self._serve_client, self.host, self.port)
+				self.address = self._server.sockets[0].getsockname()[:2]
+			self._ready.set()
+
+		def _run():
+			self._loop = asyncio.new_event_loop()
+			asyncio.set_event_loop(self._loop)
+			try:
+				self._loop.run_until_complete(_main())
+				self._loop.run_forever()
+			except Exception:
+				self._ready.set()
+			finally:
+				try:
+					if self._server is not None:
+						self._server.close()
+					# Drop connections still waiting for their next line
+					pending = asyncio.all_tasks(self._loop)
+					for task in pending:
+						task.cancel()
+					self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+				except Exception:
+					pass
+				self._loop.close()
+
+		self._thread = threading.Thread(target=_run, name='control-server', daemon=True)
+		self._thread.start()
+		self._ready.wait(5)
+		return self.address
+
+	def stop(self):
+		loop = self._loop
+		if loop is not None:
+			try:
+				loop.call_soon_threadsafe(loop.stop)
+			except Exception:
+				pass
+		if self._thread is not None:
+			self._thread.join(5)
+		self.executor.shutdown(wait=False)
+		if self.path:
+			try:
+				os.unlink(self.path)
+			except OSError:
+				pass
+
+
+class _ControlStackState:
+	# Stand-in for the Stacker window's recording attributes when "stack_next" comes over IPC
+	def __init__(self):
+		self._moved_order = []
+		self._last_moved_pos = None
+		self._stack_next_index = 0
+		self._placement_index = None
+
+
+_CONTROL_STACK_STATE = _ControlStackState()
+
+
+def _cmd_list_clients(request):
+	backend = get_window_backend()
+	clients = get_roblox_window_pids()
+	snap = snapshot_placements(clients)
+	out = []
+	for slot, (hwnd, pid) in enumerate(clients.items(), start=1):
+		rect, state = snap.get(hwnd, (None, None))
+		out.append({
+			'slot': slot,
+			'hwnd': hwnd,
+			'pid': pid,
+			'rect': list(rect) if rect else None,
+			'state': state,
+			'title': backend.get_window_title(hwnd) if backend else '',
+		})
+	return out
+
+
+def _cmd_apply_profile(request):
+	# "Profiles" are the saved layout in Settings.json for now
+	placed = apply_saved_layout(notify=False)
+	return {'placed': placed, 'moved': LAST_PLACEMENT_REPORT['moved'], 'skipped': LAST_PLACEMENT_REPORT['skipped']}
+
+
+def _cmd_top_left(request):
+	placed = len(move_roblox_windows_top_left(notify=False))
+	return {'placed': placed, 'moved': LAST_PLACEMENT_REPORT['moved'], 'skipped': LAST_PLACEMENT_REPORT['skipped']}
+
+
+def _cmd_stack_next(request):
+	pos = stack_next_roblox(_CONTROL_STACK_STATE, notify=False)
+	if pos is None:
+		raise RuntimeError('need at least two Roblox windows')
+	return {'x': pos[0], 'y': pos[1]}
+
+
+def _cmd_move_client(request):
+	"""Move slot N (1-based, HWND order) to x, y; optional w, h resize it."""
+	backend = get_window_backend()
+	if backend is None:
+		raise RuntimeError('no window backend on this platform')
+	found = get_roblox_windows()
+	n = int(request['slot'])
+	if not 1 <= n <= len(found):
+		raise ValueError(f'no client in slot {n}')
+	hwnd = found[n - 1]
+	x, y = int(request['x']), int(request['y'])
+	w, h = request.get('w'), request.get('h')
+	size = (int(w), int(h)) if w and h else None
+	before = snapshot_placements([hwnd])
+	backend.restore_window(hwnd)
+	if size:
+		backend.move_window(hwnd, x, y, size[0], size[1])
+	else:
+		backend.move_window(hwnd, x, y)
+	PLACEMENT_HISTORY.record(before, {hwnd: moved_placement(before.get(hwnd), x, y, size)})
+	return {'hwnd': hwnd, 'x': x, 'y': y}
+
+
+def _cmd_undo(request):
+	return {'moved': undo_placement()}
+
+
+def _cmd_get_stats(request):
+	stats = {
+		'clients': len(get_roblox_windows()),
+		'history_steps': PLACEMENT_HISTORY.step_count(),
+		'history_bytes': PLACEMENT_HISTORY.memory_estimate(),
+		'governor': RESOURCE_GOVERNOR is not None,
+		'hidden_minimized': len(HIDDEN_THROTTLER.minimized),
+		'last_layout': dict(LAST_PLACEMENT_REPORT),
+	}
+	if MEMORY_MANAGER is not None:
+		stats['memory_total'] = MEMORY_MANAGER.get_report()[1]
+	if CONTROL_SERVER is not None:
+		stats['requests_served'] = CONTROL_SERVER.requests_served
+	matcher = getattr(get_window_backend(), 'last_matcher', None)
+	if matcher is not None:
+		stats['window_match'] = matcher.stats()
+	if WINDOW_MATCH_ERROR:
+		stats['window_match_error'] = WINDOW_MATCH_ERROR
+	if LOOP_LAG_MONITOR is not None:
+		stats['ui_lag'] = LOOP_LAG_MONITOR.stats()
+	return stats
+
+
+CONTROL_COMMANDS = {
+	'ping': lambda request: 'pong',
+	'list_clients': _cmd_list_clients,
+	'apply_profile': _cmd_apply_profile,
+	'top_left': _cmd_top_left,
+	'stack_next': _cmd_stack_next,
+	'move_client': _cmd_move_client,
+	'undo': _cmd_undo,
+	'get_stats': _cmd_get_stats,
+}
+
+CONTROL_SERVER = None
+DEFAULT_CONTROL_PORT = 47800
+
+
+def control_server_token(settings):
+	"""
+	The token clients must send; a random one is generated and saved on first use, so
+	the server is never open to every local process (or web page) by default.
+	"""
+	token = settings.get('control_server_token')
+	if not token:
+		import secrets
+		token = secrets.token_urlsafe(24)
+		settings['control_server_token'] = token
+		save_settings(settings)
+	return token
+
+
+def start_control_server():
+	"""Start the control server from the settings (control_server_port / _path / _token)."""
+	global CONTROL_SERVER
+	stop_control_server()
+	s = load_settings()
+	try:
+		server = ControlServer(
+			CONTROL_COMMANDS,
+			port=int(s.get('control_server_port', DEFAULT_CONTROL_PORT)),
+			path=s.get('control_server_path') or None,
+			token=control_server_token(s),
+		)
+		if server.start() is None:
+			server.stop()
+			return None
+		CONTROL_SERVER = server
+	except Exception:
+		CONTROL_SERVER = None
+	return CONTROL_SERVER
+
+
+def stop_control_server():
+	global CONTROL_SERVER
+	server = CONTROL_SERVER
+	CONTROL_SERVER = None
+	if server is not None:
+		server.stop()
+
+
+# --- Single instance ---------------------------------------------------------
+
+class InstanceLock:
+	"""
+	Exclusive lock on a file in the app data folder, held for the life of the process.
+	The OS drops it when the process exits, so a crashed instance never leaves it stuck.
+	"""
+
+	def __init__(self, path):
+		self.path = path
+		self._fh = None
+
+	def acquire(self):
+		"""Try to take the lock without waiting; returns True if this process now holds it."""
+		try:
+			os.makedirs(os.path.dirname(self.path), exist_ok=True)
+			fh = open(self.path, 'a+')
+		except Exception:
+			# Can't even create the lock file: don't block startup over it
+			return True
+		try:
+			if sys.platform == 'win32':
+				import msvcrt
+				fh.seek(0)
+				msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+			else:
+				import fcntl
+				fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+		except (OSError, IOError):
+			fh.close()
+			return False
+		self._fh = fh
+		return True
+
+	def release(self):
+		fh = self._fh
+		self._fh = None
+		if fh is None:
+			return
+		try:
+			if sys.platform == 'win32':
+				import msvcrt
+				fh.seek(0)
+				msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+			else:
+				import fcntl
+				fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+		except Exception:
+			pass
+		try:
+			fh.close()
+		except Exception:
+			pass
+
+
+def get_instance_lock_path():
+	return os.path.join(get_appdata_dir(), 'instance.lock')
+
+
+def get_instance_info_path():
+	return os.path.join(get_appdata_dir(), 'instance.json')
+
+
+CLI_COMMANDS = {
+	'--stacker': 'stacker',
+	'--load-layout': 'apply_profile',
+	'--top-left': 'top_left',
+	'--stack-next': 'stack_next',
+}
+
+
+def parse_cli_command(argv):
+	"""Map command-line flags to an instance command; a plain launch means 'show'."""
+	import argparse
+	parser = argparse.ArgumentParser(prog=APP_NAME)
+	group = parser.add_mutually_exclusive_group()
+	for flag, cmd in CLI_COMMANDS.items():
+		group.add_argument(flag, dest='command', action='store_const', const=cmd)
+	args, _unknown = parser.parse_known_args(argv)
+	return args.command or 'show'
+
+
+def _cmd_show(request):
+	# Tk isn't thread-safe; hand the work to the main loop like the hotkeys do
+	def _show():
+		try:
+			root.deiconify()
+			root.lift()
+			root.focus_force()
+		except Exception:
+			pass
+	root.after(0, _show)
+	return 'ok'
+
+
+def _cmd_open_stacker(request):
+	root.after(0, open_stacker)
+	return 'ok'
+
+
+INSTANCE_COMMANDS = dict(CONTROL_COMMANDS, show=_cmd_show, stacker=_cmd_open_stacker)
+INSTANCE_SERVER = None
+
+
+def start_instance_server():
+	"""
+	Listen for commands forwarded by later launches: an ephemeral localhost port plus a
+	random token, both published in instance.json next to the lock.
+	"""
+	global INSTANCE_SERVER
+	import secrets
+	token = secrets.token_hex(16)
+	server = ControlServer(INSTANCE_COMMANDS, port=0, token=token)
+	address = server.start()
+	if address is None:
+		server.stop()
+		return None
+	INSTANCE_SERVER = server
+	try:
+		with open(get_instance_info_path(), 'w', encoding='utf-8') as f:
+			json.dump({'pid': os.getpid(), 'host': address[0], 'port': address[1], 'token': token}, f)
+	except Exception:
+		pass
+	return server
+
+
+def stop_instance_server():
+	global INSTANCE_SERVER
+	server = INSTANCE_SERVER
+	INSTANCE_SERVER = None
+	if server is not None:
+		server.stop()
+		try:
+			os.remove(get_instance_info_path())
+		except Exception:
+			pass
+
+
+def forward_to_running_instance(command, timeout=3.0):
+	"""
+	Send one command to the instance holding the lock. Retries briefly in case it is still
+	starting up. Returns its reply dict, or None if it couldn't be reached.
+	"""
+	import socket
+	deadline = time.monotonic() + timeout
+	while True:
+		try:
+			with open(get_instance_info_path(), 'r', encoding='utf-8') as f:
+				info = json.load(f)
+			with socket.create_connection((info['host'], int(info['port'])), timeout=timeout) as sock:
+				sock.sendall(json.dumps({'cmd': command, 'token': info.get('token')}).encode('utf-8') + b'\n')
+				data = b''
+				while not data.endswith(b'\n'):
+					chunk = sock.recv(65536)
+					if not chunk:
+						break
+					data += chunk
+			return json.loads(data)
+		except Exception:
+			if time.monotonic() >= deadline:
+				return None
+			time.sleep(0.1)
+
+
+def open_stacker():
+	# One Stacker only: F1 again just brings it back
+	if show_cached_dialog('stacker'):
+		return
+	win = tk.Toplevel(root)
+	win.title("Stacker")
+	_g = load_window_geometry_settings('stacker')
+	if _g:
+		try:
+			_w, _h, _x, _y = _g
+			# Enforce minimum size of 450x260
+			_w = max(_w, 450)
+			_h = max(_h, 260)
+			win.geometry(f'{_w}x{_h}+{_x}+{_y}')
+		except Exception:
+			win.geometry("450x260")
+	else:
+		win.geometry("450x260")
+	if CURRENT_BG:
+		try:
+			win.configure(bg=CURRENT_BG)
+		except Exception:
+			pass
+	# removed label to keep only the controls as requested
+
+	win._moved_order = []
+	win._last_moved_pos = None
+	win._stack_next_index = 0
+	win._placement_index = None
+
+	# Monitor selection controls
+	monitor_frame = tk.Frame(win)
+	if CURRENT_BG:
+		try:
+			monitor_frame.configure(bg=CURRENT_BG)
+		except Exception:
+			pass
+	monitor_frame.pack(pady=4)
+
+	lbl_monitor = tk.Label(monitor_frame, text="Monitor:", font=("Arial", 10, "bold"))
+	if CURRENT_BG:
+		try:
+			lbl_monitor.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
+				lbl_monitor.configure(fg="white")
+			else:
+				lbl_monitor.configure(fg="black")
+		except Exception:
+			pass
+	lbl_monitor.pack(side=tk.LEFT, padx=(4, 2))
+
+	monitors = list_monitors()
+	monitor_names = [m['name'] for m in monitors]  # ["Primary", "Monitor #2", "Monitor #3", ...]
+
+	settings = load_settings()
+	saved_idx = settings.get('selected_monitor_index', -1)
+	
+	# Map saved_idx back to display name
+	if saved_idx == -1:
+		selected_name = "Primary"
+	else:
+		# saved_idx N corresponds to "Monitor #(N+1)"
+		target_name = f"Monitor #{saved_idx + 1}"
+		selected_name = target_name if target_name in monitor_names else "Primary"
+
+	monitor_var = tk.StringVar(value=selected_name)
+
+	def _on_monitor_changed(*args):
+		try:
+			sel = monitor_var.get()
+			s = load_settings()
+			
+			if sel == "Primary":
+				s['selected_monitor_index'] = -1
+			else:
+				# Extract number from "Monitor #X": save X-1
+				parts = sel.split('#')
+				if len(parts) == 2:
+					try:
+						monitor_num = int(parts[1])
+						s['selected_monitor_index'] = monitor_num - 1
+					except Exception:
+						s['selected_monitor_index'] = -1
+				else:
+					s['selected_monitor_index'] = -1
+			
+			save_settings(s)
+		except Exception:
+			pass
+
+	monitor_var.trace('w', _on_monitor_changed)
+
+	monitor_combo = tk.OptionMenu(monitor_frame, monitor_var, *monitor_names)
+	if CURRENT_BG:
+		try:
+			monitor_combo.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
+				monitor_combo.configure(fg="white")
+			else:
+				monitor_combo.configure(fg="black")
+		except Exception:
+			pass
+	monitor_combo.pack(side=tk.LEFT, padx=2)
+
+	bounds_var = tk.BooleanVar(value=settings.get('keep_in_bounds', False))
+
+	def _on_bounds_changed(*args):
+		try:
+			s = load_settings()
+			s['keep_in_bounds'] = bounds_var.get()
+			save_settings(s)
+		except Exception:
+			pass
+
+	bounds_var.trace('w', _on_bounds_changed)
+
+	chk_bounds = tk.Checkbutton(monitor_frame, text="Keep in bounds", variable=bounds_var, font=("Arial", 10, "bold"))
+	if CURRENT_BG:
+		try:
+			chk_bounds.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
 				chk_bounds.configure(fg="white")
 			else:
-				chk_bounds.configure(fg="black")
+				chk_bounds.configure(fg="black")
+		except Exception:
+			pass
+	chk_bounds.pack(side=tk.LEFT, padx=2)
+
+	reflow_var = tk.BooleanVar(value=settings.get('reflow_in_bounds', False))
+
+	def _on_reflow_changed(*args):
+		try:
+			s = load_settings()
+			s['reflow_in_bounds'] = reflow_var.get()
+			save_settings(s)
+		except Exception:
+			pass
+
+	reflow_var.trace('w', _on_reflow_changed)
+
+	chk_reflow = tk.Checkbutton(monitor_frame, text="Wrap to columns", variable=reflow_var, font=("Arial", 10, "bold"))
+	if CURRENT_BG:
+		try:
+			chk_reflow.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
+				chk_reflow.configure(fg="white")
+			else:
+				chk_reflow.configure(fg="black")
+		except Exception:
+			pass
+	chk_reflow.pack(side=tk.LEFT, padx=2)
+
+	# (Move Count removed)
+
+	# Load placement controls (corner and stair spacing)
+	load_frame = tk.Frame(win)
+	if CURRENT_BG:
+		try:
+			load_frame.configure(bg=CURRENT_BG)
+		except Exception:
+			pass
+	load_frame.pack(pady=4)
+
+	lbl_corner = tk.Label(load_frame, text="Load corner:", font=("Arial", 10, "bold"))
+	if CURRENT_BG:
+		try:
+			lbl_corner.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
+				lbl_corner.configure(fg="white")
+			else:
+				lbl_corner.configure(fg="black")
+		except Exception:
+			pass
+	lbl_corner.pack(side=tk.LEFT, padx=(4, 2))
+
+	settings_load = load_settings()
+	corner_mode = settings_load.get('load_start_corner', 'top_left')
+	corner_labels = {'top_left': "Top Left", 'top_right': "Top Right", 'saved': "As Saved"}
+	corner_var = tk.StringVar(value=corner_labels.get(corner_mode, "Top Left"))
+
+	def _on_corner_changed(*args):
+		if is_quiet(corner_var):
+			return
+		try:
+			s = load_settings()
+			for mode, label in corner_labels.items():
+				if corner_var.get() == label:
+					s['load_start_corner'] = mode
+			save_settings(s)
+		except Exception:
+			pass
+
+	corner_var.trace('w', _on_corner_changed)
+
+	corner_menu = tk.OptionMenu(load_frame, corner_var, *corner_labels.values())
+	if CURRENT_BG:
+		try:
+			corner_menu.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
+				corner_menu.configure(fg="white")
+			else:
+				corner_menu.configure(fg="black")
+		except Exception:
+			pass
+	corner_menu.pack(side=tk.LEFT, padx=2)
+
+	# Stair spacing controls
+	lbl_dx = tk.Label(load_frame, text="dX:", font=("Arial", 9, "bold"))
+	if CURRENT_BG:
+		try:
+			lbl_dx.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
+				lbl_dx.configure(fg="white")
+			else:
+				lbl_dx.configure(fg="black")
+		except Exception:
+			pass
+	lbl_dx.pack(side=tk.LEFT, padx=(8, 2))
+
+	dx_val = settings_load.get('load_stair_dx', 24)
+	dx_var = tk.StringVar(value=str(dx_val))
+
+	def _on_dx_changed(*args):
+		try:
+			s = load_settings()
+			try:
+				val = int(dx_var.get())
+			except Exception:
+				val = 24
+			s['load_stair_dx'] = val
+			save_settings(s)
+		except Exception:
+			pass
+
+	dx_var.trace('w', _on_dx_changed)
+
+	dx_entry = tk.Entry(load_frame, textvariable=dx_var, width=3, font=("Arial", 9))
+	dx_entry.pack(side=tk.LEFT, padx=(0, 8))
+
+	lbl_dy = tk.Label(load_frame, text="dY:", font=("Arial", 9, "bold"))
+	if CURRENT_BG:
+		try:
+			lbl_dy.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
+				lbl_dy.configure(fg="white")
+			else:
+				lbl_dy.configure(fg="black")
+		except Exception:
+			pass
+	lbl_dy.pack(side=tk.LEFT, padx=(0, 2))
+
+	dy_val = settings_load.get('load_stair_dy', 24)
+	dy_var = tk.StringVar(value=str(dy_val))
+
+	def _on_dy_changed(*args):
+		try:
+			s = load_settings()
+			try:
+				val = int(dy_var.get())
+			except Exception:
+				val = 24
+			s['load_stair_dy'] = val
+			save_settings(s)
+		except Exception:
+			pass
+
+	dy_var.trace('w', _on_dy_changed)
+
+	dy_entry = tk.Entry(load_frame, textvariable=dy_var, width=3, font=("Arial", 9))
+	dy_entry.pack(side=tk.LEFT, padx=0)
+
+	# Uniform client size applied on load (per-slot sizes in the saved layout win unless forced)
+	size_frame = tk.Frame(win)
+	if CURRENT_BG:
+		try:
+			size_frame.configure(bg=CURRENT_BG)
+		except Exception:
+			pass
+	size_frame.pack(pady=(0, 4))
+
+	lbl_size = tk.Label(size_frame, text="Load size:", font=("Arial", 10, "bold"))
+	if CURRENT_BG:
+		try:
+			lbl_size.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
+				lbl_size.configure(fg="white")
+			else:
+				lbl_size.configure(fg="black")
+		except Exception:
+			pass
+	lbl_size.pack(side=tk.LEFT, padx=(4, 2))
+
+	_uniform = get_uniform_load_size(settings_load)
+	size_choices = list(LOAD_SIZE_PRESETS)
+	size_label = f"{_uniform[0]}x{_uniform[1]}" if _uniform else "Keep size"
+	if size_label not in size_choices:
+		size_choices.append(size_label)
+	size_var = tk.StringVar(value=size_label)
+
+	def _on_size_changed(*args):
+		try:
+			s = load_settings()
+			sel = size_var.get()
+			if sel == "Keep size":
+				s.pop('load_uniform_size', None)
+			else:
+				w, h = sel.split('x')
+				s['load_uniform_size'] = [int(w), int(h)]
+			save_settings(s)
+		except Exception:
+			pass
+
+	size_var.trace('w', _on_size_changed)
+
+	size_menu = tk.OptionMenu(size_frame, size_var, *size_choices)
+	if CURRENT_BG:
+		try:
+			size_menu.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
+				size_menu.configure(fg="white")
+			else:
+				size_menu.configure(fg="black")
+		except Exception:
+			pass
+	size_menu.pack(side=tk.LEFT, padx=2)
+
+	force_var = tk.BooleanVar(value=bool(settings_load.get('load_force_uniform', False)))
+
+	def _on_force_changed(*args):
+		try:
+			s = load_settings()
+			s['load_force_uniform'] = force_var.get()
+			save_settings(s)
+		except Exception:
+			pass
+
+	force_var.trace('w', _on_force_changed)
+	chk_force = tk.Checkbutton(size_frame, text="Force", variable=force_var, font=("Arial", 9))
+	if CURRENT_BG:
+		try:
+			chk_force.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
+				chk_force.configure(fg="white")
+			else:
+				chk_force.configure(fg="black")
+		except Exception:
+			pass
+	chk_force.pack(side=tk.LEFT, padx=(0, 4))
+
+	lbl_next_mode = tk.Label(size_frame, text="Next:", font=("Arial", 10, "bold"))
+	if CURRENT_BG:
+		try:
+			lbl_next_mode.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
+				lbl_next_mode.configure(fg="white")
+			else:
+				lbl_next_mode.configure(fg="black")
+		except Exception:
+			pass
+	lbl_next_mode.pack(side=tk.LEFT, padx=(8, 2))
+
+	next_mode_var = tk.StringVar(value="Smart" if settings_load.get('next_placement_mode') == 'smart' else "Stair")
+
+	def _on_next_mode_changed(*args):
+		try:
+			s = load_settings()
+			s['next_placement_mode'] = 'smart' if next_mode_var.get() == "Smart" else 'stair'
+			save_settings(s)
+			win._placement_index = None
+		except Exception:
+			pass
+
+	next_mode_var.trace('w', _on_next_mode_changed)
+
+	next_mode_menu = tk.OptionMenu(size_frame, next_mode_var, "Stair", "Smart")
+	if CURRENT_BG:
+		try:
+			next_mode_menu.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
+				next_mode_menu.configure(fg="white")
+			else:
+				next_mode_menu.configure(fg="black")
+		except Exception:
+			pass
+	next_mode_menu.pack(side=tk.LEFT, padx=2)
+
+	def _load_saved_windows():
+		apply_saved_layout()
+		win._placement_index = None
+
+	btn_load = mk_button(win, text='Load Saved Windows', width=20, command=_load_saved_windows, cursor='hand2')
+	btn_load.pack(pady=(4, 6))
+
+	def _top_left_and_record():
+		# The move already reports where each window landed; no second scan needed.
+		placements = move_roblox_windows_top_left()
+		win._placement_index = None
+		if placements:
+			try:
+				left, top, right, bottom = next(iter(placements.values()))
+				win._moved_order.append((left, top, right - left, bottom - top))
+				win._last_moved_pos = (left, top)
+			except Exception:
+				pass
+
+	btn_top_left = mk_button(win, text='Top Left', width=20, command=_top_left_and_record, cursor='hand2')
+	btn_top_left.pack(pady=8)
+
+	btn_next = mk_button(win, text='Next', width=20, command=lambda: stack_next_roblox(win), cursor='hand2')
+	btn_next.pack(pady=6)
+
+	history_frame = tk.Frame(win)
+	if CURRENT_BG:
+		try:
+			history_frame.configure(bg=CURRENT_BG)
+		except Exception:
+			pass
+	history_frame.pack(pady=(0, 6))
+
+	btn_undo = mk_button(history_frame, text='Undo', width=8, command=undo_placement, cursor='hand2')
+	btn_undo.pack(side=tk.LEFT, padx=2)
+	btn_redo = mk_button(history_frame, text='Redo', width=8, command=redo_placement, cursor='hand2')
+	btn_redo.pack(side=tk.LEFT, padx=2)
+	btn_restore = mk_button(history_frame, text='Restore Original', width=16, command=restore_pre_layout_positions, cursor='hand2')
+	btn_restore.pack(side=tk.LEFT, padx=2)
+
+	pin_layout_var = tk.BooleanVar(value=settings.get('drift_enforce_enabled', False))
+
+	def _on_pin_layout_changed(*args):
+		if is_quiet(pin_layout_var):
+			return
+		try:
+			s = load_settings()
+			s['drift_enforce_enabled'] = pin_layout_var.get()
+			save_settings(s)
+			if pin_layout_var.get():
+				start_drift_enforcer()
+			else:
+				stop_drift_enforcer()
+		except Exception:
+			pass
+
+	pin_layout_var.trace('w', _on_pin_layout_changed)
+	chk_pin_layout = tk.Checkbutton(history_frame, text="Keep pinned", variable=pin_layout_var, font=("Arial", 10, "bold"))
+	if CURRENT_BG:
+		try:
+			chk_pin_layout.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
+				chk_pin_layout.configure(fg="white")
+			else:
+				chk_pin_layout.configure(fg="black")
+		except Exception:
+			pass
+	chk_pin_layout.pack(side=tk.LEFT, padx=2)
+
+	governor_frame = tk.Frame(win)
+	if CURRENT_BG:
+		try:
+			governor_frame.configure(bg=CURRENT_BG)
+		except Exception:
+			pass
+	governor_frame.pack(pady=(0, 6))
+
+	governor_var = tk.BooleanVar(value=settings.get('governor_enabled', False))
+	pin_var = tk.BooleanVar(value=settings.get('governor_pin_affinity', False))
+
+	def _on_governor_changed(*args):
+		try:
+			s = load_settings()
+			s['governor_enabled'] = governor_var.get()
+			s['governor_pin_affinity'] = pin_var.get()
+			save_settings(s)
+			if governor_var.get():
+				start_resource_governor()
+			else:
+				stop_resource_governor()
+		except Exception:
+			pass
+
+	governor_var.trace('w', _on_governor_changed)
+	pin_var.trace('w', _on_governor_changed)
+
+	throttle_var = tk.BooleanVar(value=settings.get('throttle_hidden_enabled', False))
+
+	def _on_throttle_changed(*args):
+		try:
+			s = load_settings()
+			s['throttle_hidden_enabled'] = throttle_var.get()
+			save_settings(s)
+			if throttle_var.get():
+				throttle_hidden_clients()
+			else:
+				restore_hidden_clients()
+		except Exception:
+			pass
+
+	throttle_var.trace('w', _on_throttle_changed)
+
+	chk_governor = tk.Checkbutton(governor_frame, text="Lower background clients", variable=governor_var, font=("Arial", 10, "bold"))
+	chk_pin = tk.Checkbutton(governor_frame, text="Spread over cores", variable=pin_var, font=("Arial", 10, "bold"))
+	chk_throttle = tk.Checkbutton(governor_frame, text="Minimize hidden (F4 restores)", variable=throttle_var, font=("Arial", 10, "bold"))
+
+	memory_frame = tk.Frame(win)
+	if CURRENT_BG:
+		try:
+			memory_frame.configure(bg=CURRENT_BG)
+		except Exception:
+			pass
+	memory_frame.pack(pady=(0, 6), fill='x')
+
+	memory_var = tk.BooleanVar(value=settings.get('memory_manager_enabled', False))
+	lbl_memory = tk.Label(memory_frame, text='', font=("Arial", 9), justify=tk.LEFT, wraplength=420)
+
+	def _on_memory_changed(*args):
+		try:
+			s = load_settings()
+			s['memory_manager_enabled'] = memory_var.get()
+			save_settings(s)
+			if memory_var.get():
+				start_memory_manager()
+			else:
+				stop_memory_manager()
+		except Exception:
+			pass
+
+	memory_var.trace('w', _on_memory_changed)
+
+	chk_memory = tk.Checkbutton(memory_frame, text="Trim idle clients' memory", variable=memory_var, font=("Arial", 10, "bold"))
+
+	memory_job = {'id': None}
+
+	def _refresh_memory_label():
+		# Only reads the report the background thread left behind; never queries processes here
+		try:
+			memory_job['id'] = None
+			if not win.winfo_exists() or win.state() == 'withdrawn':
+				return
+			lbl_memory.configure(text=memory_report_text())
+			memory_job['id'] = win.after(1000, _refresh_memory_label)
+		except Exception:
+			pass
+
+	for chk in (chk_governor, chk_pin, chk_throttle, chk_memory, lbl_memory):
+		if CURRENT_BG:
+			try:
+				chk.configure(bg=CURRENT_BG)
+				if is_dark_hex(CURRENT_BG):
+					chk.configure(fg="white")
+				else:
+					chk.configure(fg="black")
+			except Exception:
+				pass
+	for chk in (chk_governor, chk_pin, chk_throttle):
+		chk.pack(side=tk.LEFT, padx=2)
+	chk_memory.pack()
+	lbl_memory.pack()
+	_refresh_memory_label()
+
+	# Overview: live thumbnails of every client; click one to bring it to the front
+	overview = {'capturer': None, 'photos': {}, 'cells': []}
+	overview_var = tk.BooleanVar(value=False)
+	overview_canvas = tk.Canvas(win, height=0, highlightthickness=0)
+	if CURRENT_BG:
+		try:
+			overview_canvas.configure(bg=CURRENT_BG)
+		except Exception:
+			pass
+
+	def _draw_overview():
+		capturer = overview['capturer']
+		if capturer is None:
+			return
+		try:
+			if not win.winfo_exists():
+				return
+		except Exception:
+			return
+		thumbs = capturer.latest()
+		photos = overview['photos']
+		cell_w = capturer.thumb_width + 8
+		cell_h = max([im.size[1] for _h, im in thumbs] or [0]) + 8
+		cols = max(1, overview_canvas.winfo_width() // cell_w)
+		overview_canvas.delete('thumb')
+		cells = []
+		for i, (hwnd, im) in enumerate(thumbs):
+			photo = photos.get(hwnd)
+			if photo is None or (photo.width(), photo.height()) != im.size:
+				photo = ImageTk.PhotoImage(im)
+				photos[hwnd] = photo
+			else:
+				photo.paste(im)
+			x0, y0 = (i % cols) * cell_w + 4, (i // cols) * cell_h + 4
+			overview_canvas.create_image(x0, y0, image=photo, anchor='nw', tags='thumb')
+			overview_canvas.create_text(x0 + 3, y0 + 2, text=f'#{i + 1}', anchor='nw', fill='yellow', tags='thumb')
+			cells.append((x0, y0, x0 + im.size[0], y0 + im.size[1], hwnd))
+		for gone in set(photos) - {h for h, _im in thumbs}:
+			del photos[gone]
+		overview['cells'] = cells
+		rows = (len(thumbs) + cols - 1) // cols
+		overview_canvas.configure(height=min(rows * cell_h, 480))
+		win.after(max(50, int(capturer.interval * 1000)), _draw_overview)
+
+	def _on_overview_click(event):
+		backend = get_window_backend()
+		for x0, y0, x1, y1, hwnd in overview['cells']:
+			if x0 <= event.x < x1 and y0 <= event.y < y1 and backend is not None:
+				try:
+					backend.focus_window(hwnd)
+				except Exception:
+					pass
+				break
+
+	def _stop_overview():
+		capturer = overview['capturer']
+		overview['capturer'] = None
+		if capturer is not None:
+			capturer.stop()
+		overview['photos'].clear()
+
+	def _on_overview_changed(*args):
+		if overview_var.get():
+			capturer = make_thumbnail_capturer()
+			if capturer is None:
+				messagebox.showinfo('Overview', 'The overview needs Pillow and Windows.', parent=win)
+				overview_var.set(False)
+				return
+			overview['capturer'] = capturer
+			capturer.start()
+			overview_canvas.pack(fill='x', padx=6, pady=(0, 6))
+			win.after(100, _draw_overview)
+		else:
+			_stop_overview()
+			overview_canvas.delete('thumb')
+			overview_canvas.pack_forget()
+
+	overview_var.trace('w', _on_overview_changed)
+	overview_canvas.bind('<Button-1>', _on_overview_click)
+	chk_overview = tk.Checkbutton(win, text="Show overview", variable=overview_var, font=("Arial", 10, "bold"))
+	if CURRENT_BG:
+		try:
+			chk_overview.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
+				chk_overview.configure(fg="white")
+			else:
+				chk_overview.configure(fg="black")
+		except Exception:
+			pass
+	chk_overview.pack()
+
+	def _on_done():
+		_stop_overview()
+		order = getattr(win, '_moved_order', [])
+		# Only a Stack Next session is saved here; a captured or recorded layout is already saved
+		if order and LAYOUT_RECORDER is None and not getattr(win, '_layout_captured', False):
+			try:
+				mapping = {}
+				s = load_settings()
+				for i, placed in enumerate(order, start=1):
+					mapping[f"#{i}"] = layout_entry(*placed)
+				s['roblox_windows'] = mapping
+				save_settings(s)
+			except Exception:
+				pass
+		hide_dialog(win)
+
+	btn_done = mk_button(win, text='Done', width=20, command=_on_done, cursor='hand2')
+	btn_done.pack(pady=(4, 8))
+
+	btn_clients = mk_button(win, text='Clients', width=20, command=open_dashboard, cursor='hand2')
+	btn_clients.pack(pady=(0, 8))
+
+	capture_frame = tk.Frame(win)
+	if CURRENT_BG:
+		try:
+			capture_frame.configure(bg=CURRENT_BG)
+		except Exception:
+			pass
+	capture_frame.pack(pady=(0, 8))
+
+	def _capture_layout():
+		n = capture_current_layout()
+		if n:
+			# capture_current_layout already saved the corner with the layout
+			win._layout_captured = True
+			set_var_quietly(corner_var, corner_labels['saved'])
+			messagebox.showinfo('Layout captured', f'Saved the current position of {n} windows.', parent=win)
+		else:
+			messagebox.showinfo('No windows', 'No open Roblox windows to capture.', parent=win)
+
+	btn_capture = mk_button(capture_frame, text='Capture Layout', width=16, command=_capture_layout, cursor='hand2')
+	btn_capture.pack(side=tk.LEFT, padx=2)
+
+	record_var = tk.BooleanVar(value=LAYOUT_RECORDER is not None)
+
+	def _on_record_changed(*args):
+		if is_quiet(record_var):
+			return
+		if record_var.get():
+			if start_layout_recording() is not None:
+				win._layout_captured = True
+				corner_var.set(corner_labels['saved'])
+		else:
+			stop_layout_recording()
+
+	record_var.trace('w', _on_record_changed)
+	chk_record = tk.Checkbutton(capture_frame, text="Record moves", variable=record_var, font=("Arial", 10, "bold"))
+	if CURRENT_BG:
+		try:
+			chk_record.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
+				chk_record.configure(fg="white")
+			else:
+				chk_record.configure(fg="black")
+		except Exception:
+			pass
+	chk_record.pack(side=tk.LEFT, padx=2)
+
+	def _on_close_stacker():
+		try:
+			w = win.winfo_width()
+			h = win.winfo_height()
+			x = win.winfo_x()
+			y = win.winfo_y()
+			save_window_geometry_settings('stacker', w, h, x, y)
+		except Exception:
+			pass
+		_stop_overview()
+		hide_dialog(win)
+
+	def _on_reopen_stacker():
+		# A fresh recording session, as a newly opened Stacker would start
+		win._moved_order = []
+		win._last_moved_pos = None
+		win._stack_next_index = 0
+		win._placement_index = None
+		win._layout_captured = False
+		if overview_var.get():
+			overview_var.set(False)
+		# Only reflect the services' state; the traces would save it as a setting
+		set_var_quietly(record_var, LAYOUT_RECORDER is not None)
+		set_var_quietly(pin_layout_var, DRIFT_ENFORCER is not None)
+		if memory_job['id'] is not None:
+			win.after_cancel(memory_job['id'])
+		memory_job['id'] = win.after(0, _refresh_memory_label)
+
+	try:
+		win.protocol('WM_DELETE_WINDOW', _on_close_stacker)
+	except Exception:
+		pass
+	cache_dialog('stacker', win, _on_reopen_stacker)
+
+
+def format_client_row(slot, row):
+	"""One fixed-width dashboard line for a registry row."""
+	rect = row.get('rect')
+	if rect:
+		pos = f"{rect[0]:>5},{rect[1]:<5} {rect[2] - rect[0]}x{rect[3] - rect[1]}"
+	else:
+		pos = '?'
+	state = row.get('state', '')
+	if row.get('responsive') is False:
+		status = 'hung'
+	else:
+		status = 'min' if state == 'minimized' else 'ok'
+	title = (row.get('title') or '')[:22]
+	return f"#{slot:<3} {row.get('pid', ''):>6}  {title:<22}  {pos:<22} {status:<6} {format_bytes(row.get('memory'))}"
+
+
+def open_dashboard():
+	"""
+	Client dashboard: one row per Roblox client plus bulk actions on the selection.
+	The list is a single Listbox (Tk only draws the visible lines) and is patched row by row
+	from CLIENT_REGISTRY.changes_since(), so 200 clients don't mean 200 widgets or full redraws.
+	"""
+	win = tk.Toplevel(root)
+	win.title('Clients')
+	_g = load_window_geometry_settings('dashboard')
+	if _g:
+		try:
+			_w, _h, _x, _y = _g
+			win.geometry(f'{_w}x{_h}+{_x}+{_y}')
+		except Exception:
+			win.geometry('760x420')
+	else:
+		win.geometry('760x420')
+	if CURRENT_BG:
+		try:
+			win.configure(bg=CURRENT_BG)
+		except Exception:
+			pass
+
+	list_frame = tk.Frame(win)
+	list_frame.pack(fill=tk.BOTH, expand=True, padx=8, pady=(8, 4))
+	scrollbar = tk.Scrollbar(list_frame)
+	scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+	lb = tk.Listbox(list_frame, selectmode=tk.EXTENDED, font=("Courier New", 9), yscrollcommand=scrollbar.set, activestyle='none')
+	lb.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+	scrollbar.config(command=lb.yview)
+
+	order = []
+	rows = {}
+	version = [-1]
+
+	def _selected():
+		return [order[i] for i in lb.curselection() if i < len(order)]
+
+	def _set_line(i, text):
+		selected = lb.selection_includes(i)
+		lb.delete(i)
+		lb.insert(i, text)
+		if selected:
+			lb.selection_set(i)
+
+	def _poll():
+		try:
+			if not win.winfo_exists():
+				return
+		except Exception:
+			return
+		try:
+			v, changed, removed = CLIENT_REGISTRY.changes_since(version[0])
+			if v != version[0]:
+				version[0] = v
+				for hwnd in removed:
+					rows.pop(hwnd, None)
+				rows.update(changed)
+				new_order = sorted(rows)
+				if new_order != order:
+					# Membership changed: drop/insert lines in place; slots after the first difference shift
+					first = next((i for i, (a, b) in enumerate(zip(order, new_order)) if a != b), min(len(order), len(new_order)))
+					keep = set(new_order)
+					for i in range(len(order) - 1, -1, -1):
+						if order[i] not in keep:
+							lb.delete(i)
+							del order[i]
+					for i, hwnd in enumerate(new_order):
+						if i >= len(order) or order[i] != hwnd:
+							order.insert(i, hwnd)
+							lb.insert(i, format_client_row(i + 1, rows[hwnd]))
+					for i, hwnd in enumerate(order):
+						if i >= first or hwnd in changed:
+							_set_line(i, format_client_row(i + 1, rows[hwnd]))
+				else:
+					for i, hwnd in enumerate(order):
+						if hwnd in changed:
+							_set_line(i, format_client_row(i + 1, rows[hwnd]))
+		except Exception:
+			pass
+		try:
+			win.after(500, _poll)
+		except Exception:
+			pass
+
+	actions = tk.Frame(win)
+	if CURRENT_BG:
+		try:
+			actions.configure(bg=CURRENT_BG)
+		except Exception:
+			pass
+	actions.pack(pady=(0, 8))
+
+	monitors = list_monitors()
+	monitor_names = [m['name'] for m in monitors] or ["Primary"]
+	target_var = tk.StringVar(value=monitor_names[0])
+
+	def _monitor_index(name):
+		if name == "Primary":
+			return -1
+		try:
+			return int(name.split('#')[1]) - 1
+		except Exception:
+			return -1
+
+	def _bulk(op):
+		hwnds = _selected()
+		if not hwnds:
+			return
+		if op == 'close':
+			if not messagebox.askyesno('Close clients', f'Close {len(hwnds)} Roblox client(s)?', parent=win):
+				return
+		apply_client_action(hwnds, op)
+
+	btn_move = mk_button(actions, text='Move to', width=10, command=lambda: move_clients_to_monitor(_selected(), _monitor_index(target_var.get())), cursor='hand2')
+	btn_move.pack(side=tk.LEFT, padx=2)
+	target_menu = tk.OptionMenu(actions, target_var, *monitor_names)
+	target_menu.pack(side=tk.LEFT, padx=(0, 8))
+	for text, op in (('Restore', 'restore'), ('Minimize', 'minimize'), ('Close', 'close')):
+		b = mk_button(actions, text=text, width=10, command=lambda op=op: _bulk(op), cursor='hand2')
+		b.pack(side=tk.LEFT, padx=2)
+	btn_all = mk_button(actions, text='Select All', width=10, command=lambda: lb.selection_set(0, tk.END), cursor='hand2')
+	btn_all.pack(side=tk.LEFT, padx=2)
+
+	lag_var = tk.StringVar(value=describe_loop_lag())
+	lbl_lag = tk.Label(win, textvariable=lag_var, font=("Arial", 9))
+	if CURRENT_BG:
+		try:
+			lbl_lag.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
+				lbl_lag.configure(fg="white")
+			else:
+				lbl_lag.configure(fg="black")
+		except Exception:
+			pass
+	lbl_lag.pack(pady=(0, 6))
+
+	def _poll_lag():
+		try:
+			if not win.winfo_exists():
+				return
+			lag_var.set(describe_loop_lag())
+			win.after(1000, _poll_lag)
+		except Exception:
+			pass
+
+	start_client_registry()
+	_poll()
+	_poll_lag()
+
+	def _on_close_dashboard():
+		try:
+			save_window_geometry_settings('dashboard', win.winfo_width(), win.winfo_height(), win.winfo_x(), win.winfo_y())
+		except Exception:
+			pass
+		stop_client_registry()
+		try:
+			win.destroy()
+		except Exception:
+			pass
+
+	try:
+		win.protocol('WM_DELETE_WINDOW', _on_close_dashboard)
+	except Exception:
+		pass
+
+
+TINYTASK_NAMES = ('tinytask.exe', 'TinyTask.exe')
+TINYTASK_DOWNLOAD_URL = 'https://tinytask.net/download.html'
+
+
+class TinyTaskLocator:
+	"""
+	Finds TinyTask.exe. A press first checks the remembered path with a single stat;
+	only when that misses does find() run the full search:
+	PATH, the working directory, the usual install/download folders, any extra folders
+	from the settings, then (if scan_depth > 0) a shallow recursive scan of those folders.
+	The filesystem calls are injectable so the search can be exercised on a fake tree.
+	"""
+
+	def __init__(self, extra_dirs=(), scan_depth=0, isfile=os.path.isfile, scandir=os.scandir, which=None):
+		import shutil
+		if isinstance(extra_dirs, str):
+			# A single folder typed into Settings.json, not a list of characters
+			extra_dirs = [extra_dirs]
+		self.extra_dirs = [d for d in extra_dirs if d]
+		self.scan_depth = max(0, int(scan_depth))
+		self.isfile = isfile
+		self.scandir = scandir
+		self.which = which or shutil.which
+
+	def base_dirs(self):
+		dirs = [
+			os.environ.get('ProgramFiles'),
+			os.environ.get('ProgramFiles(x86)'),
+			os.path.expanduser('~\\AppData\\Local'),
+			os.path.expanduser('~\\Downloads'),
+		]
+		return [d for d in dirs if d] + self.extra_dirs
+
+	def find(self):
+		for name in TINYTASK_NAMES:
+			p = self.which(name)
+			if p:
+				return p
+		candidates = [os.path.join(os.getcwd(), name) for name in TINYTASK_NAMES]
+		for base in self.base_dirs():
+			candidates.extend([
+				os.path.join(base, 'TinyTask.exe'),
+				os.path.join(base, 'tinytask.exe'),
+				os.path.join(base, 'TinyTask', 'TinyTask.exe'),
+				os.path.join(base, 'TinyTask', 'tinytask.exe'),
+			])
+		for c in candidates:
+			try:
+				if self.isfile(c):
+					return c
+			except Exception:
+				continue
+		if self.scan_depth:
+			for base in self.base_dirs():
+				found = self._scan(base, self.scan_depth)
+				if found:
+					return found
+		return None
+
+	def _scan(self, folder, depth):
+		subdirs = []
+		try:
+			with self.scandir(folder) as it:
+				for entry in it:
+					try:
+						if entry.name.lower() == 'tinytask.exe' and entry.is_file():
+							return entry.path
+						if depth > 1 and entry.is_dir(follow_symlinks=False):
+							subdirs.append(entry.path)
+					except OSError:
+						continue
+		except OSError:
+			return None
+		for sub in subdirs:
+			found = self._scan(sub, depth - 1)
+			if found:
+				return found
+		return None
+
+
+_TINYTASK_PATH = None
+_TINYTASK_SEARCHING = threading.Event()
+
+
+def _launch_tinytask(path):
+	if path:
+		try:
+			os.startfile(path)
+			return
+		except Exception:
+			try:
+				import subprocess
+				subprocess.Popen([path])
+				return
+			except Exception:
+				pass
+	webbrowser.open(TINYTASK_DOWNLOAD_URL, new=2)
+
+
+def resolve_cached_tinytask(isfile=os.path.isfile):
+	"""Return the remembered TinyTask path if it still exists (one stat), else None."""
+	global _TINYTASK_PATH
+	path = _TINYTASK_PATH
+	if path is None:
+		try:
+			path = load_settings().get('tinytask_path')
+		except Exception:
+			path = None
+	if path and isfile(path):
+		_TINYTASK_PATH = path
+		return path
+	_TINYTASK_PATH = None
+	return None
+
+
+def open_tinytask():
+	path = resolve_cached_tinytask()
+	if path:
+		_launch_tinytask(path)
+		return
+	if _TINYTASK_SEARCHING.is_set():
+		return
+	# Set up first: a bad setting must not leave the search flag stuck
+	s = load_settings()
+	try:
+		locator = TinyTaskLocator(s.get('tinytask_search_dirs', []), s.get('tinytask_scan_depth', 2))
+	except Exception:
+		locator = TinyTaskLocator([], 2)
+
+	def _finish(found):
+		global _TINYTASK_PATH
+		_TINYTASK_SEARCHING.clear()
+		if found:
+			_TINYTASK_PATH = found
+			try:
+				s = load_settings()
+				s['tinytask_path'] = found
+				save_settings(s)
+			except Exception:
+				pass
+		_launch_tinytask(found)
+
+	def _search():
+		# The full search can hit slow or network profile folders; keep it off the Tk thread
+		try:
+			found = locator.find()
+		except Exception:
+			found = None
+		try:
+			root.after(0, lambda: _finish(found))
+		except Exception:
+			_TINYTASK_SEARCHING.clear()
+
+	_TINYTASK_SEARCHING.set()
+	try:
+		threading.Thread(target=_search, name='tinytask-search', daemon=True).start()
+	except Exception:
+		_TINYTASK_SEARCHING.clear()
+
+
+# --- Input macros --------------------------------------------------------------
+
+# Event kinds. Mouse events carry client-relative (x, y) in a/b; c is the button
+# (0 left, 1 right, 2 middle) or the wheel delta. Key events carry the scan code in a
+# and the virtual-key code (0 if unknown) in b.
+EV_MOVE = 0
+EV_DOWN = 1
+EV_UP = 2
+EV_WHEEL = 3
+EV_KEY_DOWN = 4
+EV_KEY_UP = 5
+
+MACRO_MAGIC = b'RWSM'
+MACRO_VERSION = 1
+MACRO_HEADER = '<4sHHIii'
+
+
+class Macro:
+	"""
+	Recorded input, stored column-wise: times (microseconds from the start) and the
+	kind/a/b/c fields each live in their own array, so a file loads with a few frombytes calls.
+	Mouse positions are relative to the client area of the slot it was recorded on, and
+	client_size is that area's size, so a macro can be replayed on any slot.
+	"""
+
+	def __init__(self, client_size=(0, 0)):
+		from array import array
+		self.client_size = (int(client_size[0]), int(client_size[1]))
+		self.times = array('Q')
+		self.kinds = array('B')
+		self.a = array('i')
+		self.b = array('i')
+		self.c = array('i')
+
+	def __len__(self):
+		return len(self.kinds)
+
+	def add(self, t_us, kind, a=0, b=0, c=0):
+		self.times.append(int(t_us))
+		self.kinds.append(kind)
+		self.a.append(int(a))
+		self.b.append(int(b))
+		self.c.append(int(c))
+
+	def duration(self):
+		return self.times[-1] / 1e6 if self.times else 0.0
+
+	def columns(self):
+		return (self.times, self.kinds, self.a, self.b, self.c)
+
+	def to_bytes(self):
+		import struct
+		header = struct.pack(MACRO_HEADER, MACRO_MAGIC, MACRO_VERSION, 0, len(self), self.client_size[0], self.client_size[1])
+		parts = [header]
+		for col in self.columns():
+			if sys.byteorder != 'little':
+				col = col.__copy__()
+				col.byteswap()
+			parts.append(col.tobytes())
+		return b''.join(parts)
+
+	@classmethod
+	def from_bytes(cls, data):
+		import struct
+		magic, version, _reserved, count, w, h = struct.unpack_from(MACRO_HEADER, data)
+		if magic != MACRO_MAGIC or version != MACRO_VERSION:
+			raise ValueError('not a macro file')
+		macro = cls((w, h))
+		offset = struct.calcsize(MACRO_HEADER)
+		for col in macro.columns():
+			size = count * col.itemsize
+			col.frombytes(data[offset:offset + size])
+			if sys.byteorder != 'little':
+				col.byteswap()
+			offset += size
+		if len(macro.times) != count or len(macro.c) != count:
+			raise ValueError('truncated macro file')
+		return macro
+
+	def save(self, path):
+		with open(path, 'wb') as f:
+			f.write(self.to_bytes())
+
+	@classmethod
+	def load(cls, path):
+		with open(path, 'rb') as f:
+			return cls.from_bytes(f.read())
+
+
+class MacroRecorder:
+	"""
+	Turns global input into a Macro relative to one client slot.
+	client_rect is the slot's client area in screen coordinates when recording starts;
+	mouse events outside it (e.g. clicking Stop in this app) are dropped. With
+	`is_focused`, input is only kept while it returns True (the recorded client is the
+	foreground window), so typing into other apps is never captured.
+	Input hooks call on_mouse/on_key; `clock` is injectable for tests.
+	"""
+
+	def __init__(self, client_rect, clock=time.perf_counter, is_focused=None):
+		self.rect = tuple(client_rect)
+		self.clock = clock
+		self.is_focused = is_focused
+		self.macro = Macro((self.rect[2] - self.rect[0], self.rect[3] - self.rect[1]))
+		self._t0 = clock()
+		self._lock = threading.Lock()
+
+	def _now_us(self):
+		return max(0, int((self.clock() - self._t0) * 1e6))
+
+	def _focused(self):
+		if self.is_focused is None:
+			return True
+		try:
+			return bool(self.is_focused())
+		except Exception:
+			return False
+
+	def on_mouse(self, kind, x, y, c=0):
+		left, top, right, bottom = self.rect
+		if not (left <= x < right and top <= y < bottom) or not self._focused():
+			return False
+		with self._lock:
+			self.macro.add(self._now_us(), kind, x - left, y - top, c)
+		return True
+
+	def on_key(self, down, scan_code, vk=0):
+		if not self._focused():
+			return False
+		with self._lock:
+			self.macro.add(self._now_us(), EV_KEY_DOWN if down else EV_KEY_UP, scan_code, vk or 0)
+		return True
+
+	def stop(self):
+		return self.macro
+
+
+class HighResolutionTimer:
+	"""
+	Waits for absolute perf_counter deadlines: sleeps until about `spin` seconds before the
+	deadline, then spins. Sleeps shorter than a millisecond would overshoot on most
+	schedulers, so those are spun through instead. Deadlines are absolute, so errors don't add up over
+	a long macro the way chained sleep() calls do. On Windows the system timer is raised to
+	1 ms (timeBeginPeriod) while the timer is in use, so the coarse sleep is accurate too.
+	"""
+
+	MIN_SLEEP = 0.001
+
+	def __init__(self, spin=0.0015, clock=time.perf_counter, sleep=time.sleep):
+		self.spin = spin
+		self.clock = clock
+		self.sleep = sleep
+		self._winmm = None
+
+	def __enter__(self):
+		if sys.platform == 'win32':
+			try:
+				self._winmm = _require_win32_api().winmm
+				self._winmm.timeBeginPeriod(1)
+			except Exception:
+				self._winmm = None
+		return self
+
+	def __exit__(self, *exc):
+		if self._winmm is not None:
+			try:
+				self._winmm.timeEndPeriod(1)
+			except Exception:
+				pass
+		return False
+
+	def wait_until(self, deadline, stop=None):
+		"""Return True once `deadline` is reached, or False if `stop` (an Event) was set first."""
+		while True:
+			if stop is not None and stop.is_set():
+				return False
+			remaining = deadline - self.clock()
+			if remaining <= 0:
+				return True
+			nap = min(remaining - self.spin, 0.05)
+			if nap >= self.MIN_SLEEP:
+				self.sleep(nap)
+
+
+class Win32WindowInputSink:
+	"""Delivers macro events to one window by posting mouse/keyboard messages to it."""
+
+	WM_KEYDOWN = 0x0100
+	WM_KEYUP = 0x0101
+	WM_MOUSEMOVE = 0x0200
+	WM_MOUSEWHEEL = 0x020A
+	BUTTON_MESSAGES = {0: (0x0201, 0x0202, 0x0001), 1: (0x0204, 0x0205, 0x0002), 2: (0x0207, 0x0208, 0x0010)}
+
+	def __init__(self, hwnd, client_rect):
+		self.hwnd = hwnd
+		self.client_rect = tuple(client_rect)
+		self.user32 = _require_win32_api().user32
+		self._buttons = 0
+
+	def send(self, kind, a, b, c):
+		post = self.user32.PostMessageW
+		if kind in (EV_MOVE, EV_DOWN, EV_UP, EV_WHEEL):
+			lparam = (int(b) & 0xFFFF) << 16 | (int(a) & 0xFFFF)
+			if kind == EV_MOVE:
+				post(self.hwnd, self.WM_MOUSEMOVE, self._buttons, lparam)
+			elif kind == EV_WHEEL:
+				# Wheel messages take screen coordinates
+				sx, sy = self.client_rect[0] + a, self.client_rect[1] + b
+				post(self.hwnd, self.WM_MOUSEWHEEL, (int(c) & 0xFFFF) << 16 | self._buttons, (sy & 0xFFFF) << 16 | (sx & 0xFFFF))
+			else:
+				down_msg, up_msg, flag = self.BUTTON_MESSAGES.get(c, self.BUTTON_MESSAGES[0])
+				if kind == EV_DOWN:
+					self._buttons |= flag
+					post(self.hwnd, down_msg, self._buttons, lparam)
+				else:
+					self._buttons &= ~flag
+					post(self.hwnd, up_msg, self._buttons, lparam)
+		elif kind in (EV_KEY_DOWN, EV_KEY_UP):
+			vk = b or self.user32.MapVirtualKeyW(a, 1)
+			if kind == EV_KEY_DOWN:
+				post(self.hwnd, self.WM_KEYDOWN, vk, 1 | (a & 0xFF) << 16)
+			else:
+				post(self.hwnd, self.WM_KEYUP, vk, 1 | (a & 0xFF) << 16 | 0xC0000000)
+
+
+class MacroPlayer:
+	"""
+	Replays a Macro to one or more targets at the recorded times.
+	targets: [(sink, (client_width, client_height)), ...]; each target's mouse positions are
+	scaled from the recorded client size to its own, so one macro can be broadcast to every
+	slot of a layout. All targets receive an event at the same deadline.
+	How late each event went out is kept for the last LATENESS_SAMPLES events only (plus
+	the worst seen), so a long or looping macro doesn't grow memory.
+	"""
+
+	LATENESS_SAMPLES = 4096
+
+	def __init__(self, macro, targets, timer=None):
+		self.macro = macro
+		self.targets = []
+		rw, rh = macro.client_size
+		for sink, (w, h) in targets:
+			sx = (w / rw) if rw and w else 1.0
+			sy = (h / rh) if rh and h else 1.0
+			self.targets.append((sink, sx, sy))
+		self.timer = timer or HighResolutionTimer()
+		self.stop_event = threading.Event()
+		self.lateness = collections.deque(maxlen=self.LATENESS_SAMPLES)
+		self.max_lateness = 0.0
+
+	def play(self):
+		"""Play to the end (or until stop()); returns the number of events sent."""
+		times, kinds, a_col, b_col, c_col = self.macro.columns()
+		clock = self.timer.clock
+		sent = 0
+		with self.timer:
+			start = clock()
+			for i in range(len(kinds)):
+				deadline = start + times[i] / 1e6
+				if not self.timer.wait_until(deadline, self.stop_event):
+					break
+				late = clock() - deadline
+				self.lateness.append(late)
+				if late > self.max_lateness:
+					self.max_lateness = late
+				kind, a, b, c = kinds[i], a_col[i], b_col[i], c_col[i]
+				for sink, sx, sy in self.targets:
+					try:
+						if kind <= EV_WHEEL:
+							sink.send(kind, int(a * sx), int(b * sy), c)
+						else:
+							sink.send(kind, a, b, c)
+					except Exception:
+						pass
+				sent += 1
+		return sent
+
+	def start(self):
+		t = threading.Thread(target=self.play, name='macro-player', daemon=True)
+		t.start()
+		return t
+
+	def stop(self):
+		self.stop_event.set()
+
+
+def macro_targets_for_slots(slots):
+	"""
+	Build MacroPlayer targets for the given 1-based client slots, reading each client
+	area once up front (nothing is queried per event). Input is posted as window
+	messages, so this needs Win32.
+	"""
+	backend = get_window_backend()
+	if backend is None or win32_api() is None:
+		return []
+	found = get_roblox_windows()
+	targets = []
+	for n in slots:
+		if not 1 <= n <= len(found):
+			continue
+		hwnd = found[n - 1]
+		rect = backend.get_client_rect(hwnd)
+		if rect:
+			targets.append((Win32WindowInputSink(hwnd, rect), (rect[2] - rect[0], rect[3] - rect[1])))
+	return targets
+
+
+class InputBroadcaster:
+	"""
+	Mirrors input made on the focused client to the other clients in `targets` (every
+	client in the layout when targets is None; see set_targets).
+	Hooks only translate and enqueue; a dedicated thread fans each event out to the sinks
+	through a bounded queue (events are dropped, and counted, if it ever fills up).
+	Mouse positions are translated with the client rects handed to set_layout(), so no
+	window geometry is queried per event; call set_layout() again after a layout pass.
+	"""
+
+	def __init__(self, sink_factory=None, queue_size=1024, clock=time.perf_counter):
+		self.sink_factory = sink_factory or Win32WindowInputSink
+		self.queue = queue.Queue(maxsize=queue_size)
+		self.clock = clock
+		self.rects = {}
+		self.sinks = {}
+		self.targets = None
+		self.source = None
+		self._routes = []
+		self._lock = threading.Lock()
+		self._thread = None
+		self.sent = 0
+		self.dropped = 0
+		self.latency_total = 0.0
+		self.latency_max = 0.0
+
+	def set_layout(self, rects):
+		"""rects: {hwnd: client (left, top, right, bottom) in screen coordinates}."""
+		with self._lock:
+			self.rects = dict(rects)
+			self.sinks = {h: self.sinks.get(h) or self.sink_factory(h, r) for h, r in self.rects.items()}
+			for h, sink in self.sinks.items():
+				try:
+					sink.client_rect = self.rects[h]
+				except Exception:
+					pass
+			self._build_routes(self.source)
+
+	def set_targets(self, hwnds):
+		"""Mirror only to these clients; None mirrors to all of them."""
+		with self._lock:
+			self.targets = None if hwnds is None else set(hwnds)
+			self._build_routes(self.source)
+
+	def _build_routes(self, source):
+		# Precompute (sink, scale_x, scale_y) for every target but the source
+		self.source = source
+		self._routes = []
+		src = self.rects.get(source)
+		if src is None:
+			return
+		sw, sh = src[2] - src[0], src[3] - src[1]
+		for h, r in self.rects.items():
+			if h == source or (self.targets is not None and h not in self.targets):
+				continue
+			w, hh = r[2] - r[0], r[3] - r[1]
+			self._routes.append((self.sinks[h], (w / sw) if sw else 1.0, (hh / sh) if sh else 1.0))
+
+	def set_source(self, hwnd):
+		"""Make `hwnd` the client being mirrored (a no-op if it is already)."""
+		if hwnd != self.source:
+			with self._lock:
+				self._build_routes(hwnd)
+
+	def _put(self, item):
+		try:
+			self.queue.put_nowait(item)
+			return True
+		except Exception:
+			self.dropped += 1
+			return False
+
+	def submit_mouse(self, kind, x, y, c=0):
+		"""Queue a mouse event at screen position (x, y); ignored unless it is inside the source client."""
+		src = self.rects.get(self.source)
+		if src is None or not (src[0] <= x < src[2] and src[1] <= y < src[3]):
+			return False
+		return self._put((self.clock(), kind, x - src[0], y - src[1], c))
+
+	def submit_key(self, down, scan_code, vk=0):
+		if self.source not in self.rects:
+			return False
+		return self._put((self.clock(), EV_KEY_DOWN if down else EV_KEY_UP, scan_code, vk or 0, 0))
+
+	def _run(self):
+		q = self.queue
+		while True:
+			item = q.get()
+			if item is None:
+				break
+			t0, kind, a, b, c = item
+			with self._lock:
+				routes = self._routes
+			for sink, sx, sy in routes:
+				try:
+					if kind <= EV_WHEEL:
+						sink.send(kind, int(a * sx), int(b * sy), c)
+					else:
+						sink.send(kind, a, b, c)
+				except Exception:
+					pass
+			latency = self.clock() - t0
+			self.sent += 1
+			self.latency_total += latency
+			if latency > self.latency_max:
+				self.latency_max = latency
+
+	def start(self):
+		if self._thread is None:
+			self._thread = threading.Thread(target=self._run, name='input-broadcast', daemon=True)
+			self._thread.start()
+
+	def stop(self):
+		thread = self._thread
+		self._thread = None
+		if thread is not None:
+			self.queue.put(None)
+			thread.join(timeout=2.0)
+
+	def stats(self):
+		return {
+			'sent': self.sent,
+			'dropped': self.dropped,
+			'targets': len(self._routes),
+			'avg_latency_ms': (self.latency_total / self.sent * 1000.0) if self.sent else 0.0,
+			'max_latency_ms': self.latency_max * 1000.0,
+		}
+
+
+INPUT_BROADCASTER = None
+_BROADCAST_HOOKS = []
+
+
+def parse_slot_list(text):
+	"""'2, 3,5' -> [2, 3, 5]; anything that isn't a positive number is ignored."""
+	slots = []
+	for part in str(text or '').replace(';', ',').split(','):
+		part = part.strip()
+		if part.isdigit() and int(part) > 0 and int(part) not in slots:
+			slots.append(int(part))
+	return slots
+
+
+def refresh_broadcast_layout():
+	"""
+	Re-read the clients' client rects once (after a layout pass) for the running broadcaster,
+	and map the 'broadcast_slots' setting (empty = every client) to the target windows.
+	"""
+	broadcaster = INPUT_BROADCASTER
+	backend = get_window_backend()
+	if broadcaster is None or backend is None:
+		return
+	found = get_roblox_windows()
+	rects = {}
+	for hwnd in found:
+		r = backend.get_client_rect(hwnd)
+		if r:
+			rects[hwnd] = r
+	slots = parse_slot_list(','.join(str(n) for n in load_settings().get('broadcast_slots', [])))
+	broadcaster.set_layout(rects)
+	broadcaster.set_targets([found[n - 1] for n in slots if n <= len(found)] if slots else None)
+
+
+def start_input_broadcast():
+	"""Start mirroring input from the focused client to the chosen clients; needs keyboard/mouse."""
+	global INPUT_BROADCASTER
+	backend = get_window_backend()
+	if INPUT_BROADCASTER is not None or backend is None or win32_api() is None or (keyboard is None and mouse is None):
+		return INPUT_BROADCASTER
+	broadcaster = InputBroadcaster()
+	INPUT_BROADCASTER = broadcaster
+	refresh_broadcast_layout()
+	broadcaster.start()
+
+	def _follow_focus():
+		# Only mirror while one of the clients is in front; the focus lookup is one cheap call
+		fg = backend.get_foreground_window()
+		broadcaster.set_source(fg if fg in broadcaster.rects else None)
+
+	if keyboard:
+		def _on_key(event):
+			_follow_focus()
+			broadcaster.submit_key(event.event_type == 'down', event.scan_code)
+		_BROADCAST_HOOKS.append(('keyboard', keyboard.hook(_on_key)))
+	if mouse:
+		buttons = {'left': 0, 'right': 1, 'middle': 2}
+
+		def _on_mouse(event):
+			name = event.__class__.__name__
+			if name == 'MoveEvent':
+				broadcaster.submit_mouse(EV_MOVE, event.x, event.y)
+				return
+			_follow_focus()
+			x, y = mouse.get_position()
+			if name == 'ButtonEvent':
+				kind = EV_UP if event.event_type == 'up' else EV_DOWN
+				broadcaster.submit_mouse(kind, x, y, buttons.get(event.button, 0))
+			elif name == 'WheelEvent':
+				broadcaster.submit_mouse(EV_WHEEL, x, y, int(event.delta * 120))
+		_BROADCAST_HOOKS.append(('mouse', mouse.hook(_on_mouse)))
+	return broadcaster
+
+
+def stop_input_broadcast():
+	global INPUT_BROADCASTER
+	for kind, hook in _BROADCAST_HOOKS:
+		try:
+			if kind == 'keyboard':
+				keyboard.unhook(hook)
+			else:
+				mouse.unhook(hook)
+		except Exception:
+			pass
+	del _BROADCAST_HOOKS[:]
+	broadcaster = INPUT_BROADCASTER
+	INPUT_BROADCASTER = None
+	if broadcaster is not None:
+		broadcaster.stop()
+
+
+class _MacroSession:
+	# Module-level state behind the Macros window
+	def __init__(self):
+		self.macro = None
+		self.recorder = None
+		self.player = None
+		self.hooks = []
+
+
+MACRO_SESSION = _MacroSession()
+
+
+def start_macro_recording(slot):
+	"""Start recording input relative to client `slot`; needs the keyboard (and optionally mouse) module."""
+	session = MACRO_SESSION
+	stop_macro_recording()
+	backend = get_window_backend()
+	found = get_roblox_windows()
+	if backend is None or not 1 <= slot <= len(found):
+		return False
+	hwnd = found[slot - 1]
+	rect = backend.get_client_rect(hwnd)
+	if not rect:
+		return False
+	recorder = MacroRecorder(rect, is_focused=lambda: backend.get_foreground_window() == hwnd)
+	session.recorder = recorder
+	if keyboard:
+		def _on_key(event):
+			recorder.on_key(event.event_type == 'down', event.scan_code)
+		session.hooks.append(('keyboard', keyboard.hook(_on_key)))
+	if mouse:
+		buttons = {'left': 0, 'right': 1, 'middle': 2}
+
+		def _on_mouse(event):
+			name = event.__class__.__name__
+			if name == 'MoveEvent':
+				recorder.on_mouse(EV_MOVE, event.x, event.y)
+			elif name == 'ButtonEvent':
+				x, y = mouse.get_position()
+				kind = EV_UP if event.event_type == 'up' else EV_DOWN
+				recorder.on_mouse(kind, x, y, buttons.get(event.button, 0))
+			elif name == 'WheelEvent':
+				x, y = mouse.get_position()
+				recorder.on_mouse(EV_WHEEL, x, y, int(event.delta * 120))
+		session.hooks.append(('mouse', mouse.hook(_on_mouse)))
+	return True
+
+
+def stop_macro_recording():
+	session = MACRO_SESSION
+	for kind, hook in session.hooks:
+		try:
+			if kind == 'keyboard':
+				keyboard.unhook(hook)
+			else:
+				mouse.unhook(hook)
+		except Exception:
+			pass
+	session.hooks = []
+	if session.recorder is not None:
+		session.macro = session.recorder.stop()
+		session.recorder = None
+	return session.macro
+
+
+def play_macro(slots):
+	"""Play the current macro on the given slots (broadcast when more than one) in the background."""
+	session = MACRO_SESSION
+	if session.macro is None or not len(session.macro):
+		return None
+	if session.player is not None:
+		session.player.stop()
+	targets = macro_targets_for_slots(slots)
+	if not targets:
+		return None
+	session.player = MacroPlayer(session.macro, targets)
+	session.player.start()
+	return session.player
+
+
+def open_macros():
+	if show_cached_dialog('macros'):
+		return
+	win = tk.Toplevel(root)
+	win.title('Macros')
+	_g = load_window_geometry_settings('macros')
+	if _g:
+		try:
+			_w, _h, _x, _y = _g
+			win.geometry(f'{_w}x{_h}+{_x}+{_y}')
+		except Exception:
+			win.geometry('360x290')
+	else:
+		win.geometry('360x290')
+	if CURRENT_BG:
+		try:
+			win.configure(bg=CURRENT_BG)
 		except Exception:
 			pass
-	chk_bounds.pack(side=tk.LEFT, padx=2)
-
-	# (Move Count removed)
 
-	# Load placement controls (corner and stair spacing)
-	load_frame = tk.Frame(win)
+	slot_frame = tk.Frame(win)
 	if CURRENT_BG:
 		try:
-			load_frame.configure(bg=CURRENT_BG)
+			slot_frame.configure(bg=CURRENT_BG)
 		except Exception:
 			pass
-	load_frame.pack(pady=4)
+	slot_frame.pack(pady=(10, 4))
 
-	lbl_corner = tk.Label(load_frame, text="Load corner:", font=("Arial", 10, "bold"))
+	lbl_slot = tk.Label(slot_frame, text="Slot:", font=("Arial", 10, "bold"))
 	if CURRENT_BG:
 		try:
-			lbl_corner.configure(bg=CURRENT_BG)
+			lbl_slot.configure(bg=CURRENT_BG)
 			if is_dark_hex(CURRENT_BG):
-				lbl_corner.configure(fg="white")
+				lbl_slot.configure(fg="white")
 			else:
-				lbl_corner.configure(fg="black")
+				lbl_slot.configure(fg="black")
 		except Exception:
 			pass
-	lbl_corner.pack(side=tk.LEFT, padx=(4, 2))
-
-	settings_load = load_settings()
-	corner_mode = settings_load.get('load_start_corner', 'top_left')
-	corner_var = tk.StringVar(value="Top Left" if corner_mode == 'top_left' else "Top Right")
+	lbl_slot.pack(side=tk.LEFT, padx=(4, 2))
+	slot_var = tk.StringVar(value="1")
+	slot_entry = tk.Entry(slot_frame, textvariable=slot_var, width=3, font=("Arial", 9))
+	slot_entry.pack(side=tk.LEFT)
 
-	def _on_corner_changed(*args):
+	status_var = tk.StringVar(value='')
+	lbl_status = tk.Label(win, textvariable=status_var, font=("Arial", 9))
+	if CURRENT_BG:
 		try:
-			s = load_settings()
-			if corner_var.get() == "Top Left":
-				s['load_start_corner'] = 'top_left'
+			lbl_status.configure(bg=CURRENT_BG)
+			if is_dark_hex(CURRENT_BG):
+				lbl_status.configure(fg="white")
 			else:
-				s['load_start_corner'] = 'top_right'
-			save_settings(s)
+				lbl_status.configure(fg="black")
 		except Exception:
 			pass
 
-	corner_var.trace('w', _on_corner_changed)
+	def _slot():
+		try:
+			return max(1, int(slot_var.get()))
+		except Exception:
+			return 1
+
+	def _describe():
+		m = MACRO_SESSION.macro
+		if m is None:
+			return 'No macro'
+		return f'{len(m)} events, {m.duration():.1f}s'
+
+	def _record():
+		if keyboard is None and mouse is None:
+			messagebox.showerror('Macros', 'Recording needs the keyboard or mouse module.', parent=win)
+			return
+		if start_macro_recording(_slot()):
+			status_var.set(f'Recording slot #{_slot()}...')
+		else:
+			status_var.set('No client in that slot')
+
+	def _stop():
+		stop_macro_recording()
+		if MACRO_SESSION.player is not None:
+			MACRO_SESSION.player.stop()
+		status_var.set(_describe())
+
+	def _play():
+		if play_macro([_slot()]):
+			status_var.set(f'Playing on slot #{_slot()}')
+
+	def _broadcast():
+		slots = list(range(1, len(get_roblox_windows()) + 1))
+		if play_macro(slots):
+			status_var.set(f'Playing on {len(slots)} clients')
+
+	def _save():
+		from tkinter import filedialog
+		if MACRO_SESSION.macro is None:
+			return
+		path = filedialog.asksaveasfilename(parent=win, defaultextension='.rwsm', filetypes=[('Macro', '*.rwsm')])
+		if path:
+			try:
+				MACRO_SESSION.macro.save(path)
+			except Exception as e:
+				messagebox.showerror('Macros', f'Could not save: {e}', parent=win)
+
+	def _load():
+		from tkinter import filedialog
+		path = filedialog.askopenfilename(parent=win, filetypes=[('Macro', '*.rwsm')])
+		if path:
+			try:
+				MACRO_SESSION.macro = Macro.load(path)
+				status_var.set(_describe())
+			except Exception as e:
+				messagebox.showerror('Macros', f'Could not load: {e}', parent=win)
 
-	corner_menu = tk.OptionMenu(load_frame, corner_var, "Top Left", "Top Right")
+	btn_frame = tk.Frame(win)
 	if CURRENT_BG:
 		try:
-			corner_menu.configure(bg=CURRENT_BG)
-			if is_dark_hex(CURRENT_BG):
-				corner_menu.configure(fg="white")
-			else:
-				corner_menu.configure(fg="black")
+			btn_frame.configure(bg=CURRENT_BG)
 		except Exception:
 			pass
-	corner_menu.pack(side=tk.LEFT, padx=2)
-
-	# Stair spacing controls
-	lbl_dx = tk.Label(load_frame, text="dX:", font=("Arial", 9, "bold"))
+	btn_frame.pack(pady=4)
+	buttons = [
+		('Record', _record), ('Stop', _stop), ('Play', _play),
+		('Broadcast', _broadcast), ('Save...', _save), ('Load...', _load),
+	]
+	for i, (text, cmd) in enumerate(buttons):
+		b = mk_button(btn_frame, text=text, width=10, command=cmd, cursor='hand2')
+		b.grid(row=i // 3, column=i % 3, padx=4, pady=3)
+
+	mirror_var = tk.BooleanVar(value=INPUT_BROADCASTER is not None)
+
+	def _on_mirror_changed(*args):
+		if is_quiet(mirror_var):
+			return
+		if mirror_var.get():
+			if start_input_broadcast() is None:
+				status_var.set('Mirroring needs the keyboard or mouse module')
+			else:
+				status_var.set('Mirroring the focused client')
+		else:
+			broadcaster = INPUT_BROADCASTER
+			stop_input_broadcast()
+			if broadcaster is not None:
+				st = broadcaster.stats()
+				status_var.set(f"Mirrored {st['sent']} events, avg {st['avg_latency_ms']:.2f} ms")
+
+	mirror_var.trace('w', _on_mirror_changed)
+	chk_mirror = tk.Checkbutton(win, text="Mirror input to all clients", variable=mirror_var, font=("Arial", 10, "bold"))
 	if CURRENT_BG:
 		try:
-			lbl_dx.configure(bg=CURRENT_BG)
+			chk_mirror.configure(bg=CURRENT_BG)
 			if is_dark_hex(CURRENT_BG):
-				lbl_dx.configure(fg="white")
+				chk_mirror.configure(fg="white")
 			else:
-				lbl_dx.configure(fg="black")
+				chk_mirror.configure(fg="black")
 		except Exception:
 			pass
-	lbl_dx.pack(side=tk.LEFT, padx=(8, 2))
-
-	dx_val = settings_load.get('load_stair_dx', 24)
-	dx_var = tk.StringVar(value=str(dx_val))
+	chk_mirror.pack()
 
-	def _on_dx_changed(*args):
+	targets_frame = tk.Frame(win)
+	if CURRENT_BG:
 		try:
-			s = load_settings()
-			try:
-				val = int(dx_var.get())
-			except Exception:
-				val = 24
-			s['load_stair_dx'] = val
-			save_settings(s)
+			targets_frame.configure(bg=CURRENT_BG)
 		except Exception:
 			pass
-
-	dx_var.trace('w', _on_dx_changed)
-
-	dx_entry = tk.Entry(load_frame, textvariable=dx_var, width=3, font=("Arial", 9))
-	dx_entry.pack(side=tk.LEFT, padx=(0, 8))
-
-	lbl_dy = tk.Label(load_frame, text="dY:", font=("Arial", 9, "bold"))
+	targets_frame.pack()
+	lbl_targets = tk.Label(targets_frame, text="Mirror to slots:", font=("Arial", 9))
 	if CURRENT_BG:
 		try:
-			lbl_dy.configure(bg=CURRENT_BG)
+			lbl_targets.configure(bg=CURRENT_BG)
 			if is_dark_hex(CURRENT_BG):
-				lbl_dy.configure(fg="white")
+				lbl_targets.configure(fg="white")
 			else:
-				lbl_dy.configure(fg="black")
+				lbl_targets.configure(fg="black")
 		except Exception:
 			pass
-	lbl_dy.pack(side=tk.LEFT, padx=(0, 2))
-
-	dy_val = settings_load.get('load_stair_dy', 24)
-	dy_var = tk.StringVar(value=str(dy_val))
+	lbl_targets.pack(side=tk.LEFT, padx=(4, 2))
+	# Empty means every client
+	targets_var = tk.StringVar(value=', '.join(str(n) for n in load_settings().get('broadcast_slots', [])))
+	targets_entry = tk.Entry(targets_frame, textvariable=targets_var, width=12, font=("Arial", 9))
+	targets_entry.pack(side=tk.LEFT)
 
-	def _on_dy_changed(*args):
+	def _on_targets_changed(*args):
 		try:
 			s = load_settings()
-			try:
-				val = int(dy_var.get())
-			except Exception:
-				val = 24
-			s['load_stair_dy'] = val
+			s['broadcast_slots'] = parse_slot_list(targets_var.get())
 			save_settings(s)
+			refresh_broadcast_layout()
 		except Exception:
 			pass
 
-	dy_var.trace('w', _on_dy_changed)
+	targets_entry.bind('<Return>', _on_targets_changed)
+	targets_entry.bind('<FocusOut>', _on_targets_changed)
 
-	dy_entry = tk.Entry(load_frame, textvariable=dy_var, width=3, font=("Arial", 9))
-	dy_entry.pack(side=tk.LEFT, padx=0)
+	lbl_status.pack(pady=(4, 2))
+	btn_tinytask = mk_button(win, text='Open TinyTask (F2)', width=16, command=open_tinytask, cursor='hand2')
+	btn_tinytask.pack(pady=(2, 8))
+	status_var.set(_describe())
 
-	def _load_saved_windows():
+	def _on_close_macros():
 		try:
-			s = load_settings()
-			mapping = s.get('roblox_windows', {})
-			if not mapping:
-				messagebox.showinfo('No saved', 'No saved windows found in Settings.json')
-				return
-			user32 = ctypes.windll.user32
-			kernel32 = ctypes.windll.kernel32
-			found = []
-
-			# Use system helper to enumerate Roblox windows
-			found = get_roblox_windows()
-			items = sorted(mapping.items(), key=lambda kv: int(kv[0].lstrip('#')) if kv[0].lstrip('#').isdigit() else 0)
-			count = min(len(items), len(found))
-			if count == 0:
-				messagebox.showinfo('No windows', 'No open Roblox windows to move')
-				return
-			HWND_TOP = 0
-			SWP_NOSIZE = 0x0001
-			SWP_NOZORDER = 0x0004
-			SW_RESTORE = 9
-			
-			# Get selected monitor's work area
-			monitor_index = s.get('selected_monitor_index', -1)
-			keep_in_bounds = s.get('keep_in_bounds', False)
-			monitor_work = get_monitor_work_area(monitor_index)
-			
-			# Get placement mode and stair spacing
-			corner_mode = s.get('load_start_corner', 'top_left')
-			dx = s.get('load_stair_dx', 24)
-			dy = s.get('load_stair_dy', 24)
-			
-			if not monitor_work:
-				monitor_left, monitor_top, monitor_right, monitor_bottom = 0, 0, 1920, 1080
-			else:
-				monitor_left, monitor_top, monitor_right, monitor_bottom = monitor_work
-			
-			if corner_mode == 'top_right':
-				# For top-right, get first window's width to offset properly
-				try:
-					first_hwnd = found[0]
-					win_w, win_h = get_window_size(first_hwnd)
-					base_x = monitor_right - win_w
-					base_y = monitor_top
-				except Exception:
-					base_x = monitor_right - 800
-					base_y = monitor_top
-			else:
-				# top_left mode (default)
-				base_x = monitor_left
-				base_y = monitor_top
-			
-			for i in range(count):
-				label, coord = items[i]
-				try:
-					if corner_mode == 'top_right':
-						# Down-left stairway: start at top-right, move left and down
-						x = base_x - i * dx
-					else:
-						# Down-right stairway: start at top-left, move right and down
-						x = base_x + i * dx
-					y = base_y + i * dy
-					hwnd = found[i]
-					user32.ShowWindow(hwnd, SW_RESTORE)
-					if keep_in_bounds:
-						x, y = clamp_to_monitor(hwnd, x, y, monitor_work)
-					user32.SetWindowPos(hwnd, HWND_TOP, int(x), int(y), 0, 0, SWP_NOSIZE | SWP_NOZORDER)
-				except Exception:
-					pass
+			save_window_geometry_settings('macros', win.winfo_width(), win.winfo_height(), win.winfo_x(), win.winfo_y())
 		except Exception:
 			pass
+		stop_macro_recording()
+		hide_dialog(win)
 
-	btn_load = mk_button(win, text='Load Saved Windows', width=20, command=_load_saved_windows, cursor='hand2')
-	btn_load.pack(pady=(4, 6))
-
-	def _top_left_and_record():
-		move_roblox_windows_top_left()
-		try:
-			user32 = ctypes.windll.user32
-			kernel32 = ctypes.windll.kernel32
-			found = []
+	def _on_reopen_macros():
+		set_var_quietly(mirror_var, INPUT_BROADCASTER is not None)
+		status_var.set(_describe())
 
-			@ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
-			def _enum_proc(hwnd, lParam):
-				try:
-					if not user32.IsWindowVisible(hwnd):
-						return True
-				except Exception:
-					return True
-				pid = wintypes.DWORD()
-				user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-				pid_val = pid.value
-				if not pid_val:
-					return True
-				PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
-				hProcess = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid_val)
-				exe_name = None
-				if hProcess:
-					try:
-						buf = ctypes.create_unicode_buffer(260)
-						size = wintypes.DWORD(260)
-						if kernel32.QueryFullProcessImageNameW(hProcess, 0, buf, ctypes.byref(size)):
-							exe_name = os.path.basename(buf.value)
-					except Exception:
-						exe_name = None
-					try:
-						kernel32.CloseHandle(hProcess)
-					except Exception:
-						pass
-				if exe_name and exe_name.lower() == 'robloxplayerbeta.exe':
-					found.append(hwnd)
-				return True
+	try:
+		win.protocol('WM_DELETE_WINDOW', _on_close_macros)
+	except Exception:
+		pass
+	cache_dialog('macros', win, _on_reopen_macros)
 
-			user32.EnumWindows(_enum_proc, 0)
-			if found:
-				try:
-					rect = wintypes.RECT()
-					user32.GetWindowRect(found[0], ctypes.byref(rect))
-					x, y = rect.left, rect.top
-					win._moved_order.append((x, y))
-					win._last_moved_pos = (x, y)
-				except Exception:
-					pass
-		except Exception:
-			pass
 
-	btn_top_left = mk_button(win, text='Top Left', width=20, command=_top_left_and_record, cursor='hand2')
-	btn_top_left.pack(pady=8)
+# --- Client overview thumbnails -------------------------------------------------
 
-	btn_next = mk_button(win, text='Next', width=20, command=lambda: stack_next_roblox(win), cursor='hand2')
-	btn_next.pack(pady=6)
+class Win32WindowCapture:
+	"""
+	Capture source for ThumbnailCapturer: renders a window's client area with PrintWindow
+	(works for covered windows) and copies it into a caller-owned BGRA bytearray, which is
+	reused from frame to frame as long as the window size doesn't change.
+	"""
 
-	def _on_done():
-		try:
-			mapping = {}
-			order = getattr(win, '_moved_order', [])
-			for i, (x, y) in enumerate(order, start=1):
-				mapping[f"#{i}"] = [int(x), int(y)]
-			try:
-				s = load_settings()
-				s['roblox_windows'] = mapping
-				save_settings(s)
-			except Exception:
-				pass
-		except Exception:
-			pass
-		try:
-			win.destroy()
-		except Exception:
-			pass
+	PW_CLIENTONLY = 0x1
+	PW_RENDERFULLCONTENT = 0x2
 
-	btn_done = mk_button(win, text='Done', width=20, command=_on_done, cursor='hand2')
-	btn_done.pack(pady=(4, 8))
+	def __init__(self):
+		self.api = _require_win32_api()
+		self.user32 = self.api.user32
+		self.gdi32 = self.api.gdi32
 
-	def _on_close_stacker():
-		try:
-			w = win.winfo_width()
-			h = win.winfo_height()
-			x = win.winfo_x()
-			y = win.winfo_y()
-			save_window_geometry_settings('stacker', w, h, x, y)
-		except Exception:
-			pass
+	def capture(self, hwnd, buffer=None):
+		"""Return (width, height, buffer) with top-down BGRA pixels, or None."""
+		user32, gdi32 = self.user32, self.gdi32
+		rect = self.api.rect()
+		if not user32.GetClientRect(hwnd, ctypes.byref(rect)):
+			return None
+		w, h = rect.right, rect.bottom
+		if w <= 0 or h <= 0:
+			return None
+		size = w * h * 4
+		if buffer is None or len(buffer) != size:
+			buffer = bytearray(size)
+		hdc = user32.GetDC(hwnd)
+		if not hdc:
+			return None
+		mem = bmp = old = None
 		try:
-			win.destroy()
-		except Exception:
-			pass
-
-	try:
-		win.protocol('WM_DELETE_WINDOW', _on_close_stacker)
-	except Exception:
-		pass
-
+			mem = gdi32.CreateCompatibleDC(hdc)
+			bmp = gdi32.CreateCompatibleBitmap(hdc, w, h)
+			old = gdi32.SelectObject(mem, bmp)
+			user32.PrintWindow(hwnd, mem, self.PW_CLIENTONLY | self.PW_RENDERFULLCONTENT)
+			bi = BITMAPINFOHEADER()
+			bi.biSize = ctypes.sizeof(bi)
+			bi.biWidth = w
+			bi.biHeight = -h  # negative: top-down rows
+			bi.biPlanes = 1
+			bi.biBitCount = 32
+			bits = (ctypes.c_char * size).from_buffer(buffer)
+			if not gdi32.GetDIBits(mem, bmp, 0, h, bits, ctypes.byref(bi), 0):
+				return None
+		finally:
+			if old:
+				gdi32.SelectObject(mem, old)
+			if bmp:
+				gdi32.DeleteObject(bmp)
+			if mem:
+				gdi32.DeleteDC(mem)
+			user32.ReleaseDC(hwnd, hdc)
+		return (w, h, buffer)
+
+
+class SyntheticCaptureSource:
+	"""Capture source producing generated frames of a fixed size, for benchmarking the thumbnail pipeline anywhere."""
+
+	def __init__(self, width=800, height=600):
+		self.width = width
+		self.height = height
+		self.frame = 0
+
+	def capture(self, hwnd, buffer=None):
+		size = self.width * self.height * 4
+		if buffer is None or len(buffer) != size:
+			buffer = bytearray(size)
+		self.frame += 1
+		# Touch one row per frame so the content actually changes
+		row = (self.frame * 7) % self.height * self.width * 4
+		buffer[row:row + self.width * 4] = bytes([(hwnd + self.frame) & 0xFF]) * (self.width * 4)
+		return (self.width, self.height, buffer)
+
+
+class ThumbnailCapturer:
+	"""
+	Background thread that captures every client `fps` times a second and downscales each
+	frame with Pillow to `thumb_width` pixels wide. Each client keeps its capture buffer
+	between frames, and Pillow reads that buffer in place rather than copying it; only the
+	small thumbnail is allocated per frame. The Tk side picks up thumbnails with latest().
+	"""
 
-def open_tinytask():
-	import shutil
-
-	def find_tinytask():
-		p = shutil.which('tinytask.exe') or shutil.which('TinyTask.exe')
-		if p:
-			return p
-		cur = os.path.join(os.getcwd(), 'tinytask.exe')
-		if os.path.exists(cur):
-			return cur
-		cur2 = os.path.join(os.getcwd(), 'TinyTask.exe')
-		if os.path.exists(cur2):
-			return cur2
-		candidates = []
-		pf = os.environ.get('ProgramFiles')
-		pfx = os.environ.get('ProgramFiles(x86)')
-		local = os.path.expanduser('~\\AppData\\Local')
-		downloads = os.path.expanduser('~\\Downloads')
-		for base in (pf, pfx, local, downloads):
-			if not base:
-				continue
-			candidates.extend([
-				os.path.join(base, 'TinyTask.exe'),
-				os.path.join(base, 'tinytask.exe'),
-				os.path.join(base, 'TinyTask', 'TinyTask.exe'),
-				os.path.join(base, 'TinyTask', 'tinytask.exe'),
-			])
-		for c in candidates:
+	def __init__(self, source, list_windows, fps=2.0, thumb_width=160, clock=time.perf_counter):
+		self.source = source
+		self.list_windows = list_windows
+		self.interval = 1.0 / max(0.1, float(fps))
+		self.thumb_width = max(16, int(thumb_width))
+		self.clock = clock
+		self._buffers = {}
+		self._thumbs = {}
+		self._order = []
+		self._lock = threading.Lock()
+		self._stop = threading.Event()
+		self._thread = None
+		self.frames = 0
+		self.overruns = 0
+		self.last_frame_ms = 0.0
+
+	def scale(self, width, height, buffer):
+		"""Downscale one BGRA frame to an RGB thumbnail."""
+		# RGBA over the raw buffer is a zero-copy view; swap B and R on the small result instead
+		frame = Image.frombuffer('RGBA', (width, height), buffer, 'raw', 'RGBA', 0, 1)
+		th = max(1, int(height * self.thumb_width / width))
+		# Nearest-neighbour down to twice the size, then a 2x box reduce: close to a
+		# full filtered resize at a fraction of the cost
+		if width >= self.thumb_width * 2 and height >= th * 2:
+			small = frame.resize((self.thumb_width * 2, th * 2), Image.NEAREST).reduce(2)
+		else:
+			small = frame.resize((self.thumb_width, th), Image.BILINEAR)
+		b, g, r, _a = small.split()
+		return Image.merge('RGB', (r, g, b))
+
+	def capture_once(self):
+		"""Capture and scale every client once; returns the time taken in seconds."""
+		t0 = self.clock()
+		hwnds = list(self.list_windows())
+		thumbs = {}
+		for hwnd in hwnds:
 			try:
-				if c and os.path.exists(c):
-					return c
+				got = self.source.capture(hwnd, self._buffers.get(hwnd))
 			except Exception:
+				got = None
+			if not got:
 				continue
-		return None
-
-	path = find_tinytask()
-	if path:
-		try:
-			os.startfile(path)
-		except Exception:
+			w, h, buf = got
+			self._buffers[hwnd] = buf
 			try:
-				import subprocess
-				subprocess.Popen([path])
+				thumbs[hwnd] = self.scale(w, h, buf)
 			except Exception:
-				webbrowser.open('https://tinytask.net/download.html', new=2)
-	else:
-		webbrowser.open('https://tinytask.net/download.html', new=2)
- 
+				pass
+		for gone in set(self._buffers) - set(hwnds):
+			del self._buffers[gone]
+		with self._lock:
+			self._thumbs = thumbs
+			self._order = [h for h in hwnds if h in thumbs]
+		elapsed = self.clock() - t0
+		self.frames += 1
+		self.last_frame_ms = elapsed * 1000.0
+		if elapsed > self.interval:
+			self.overruns += 1
+		return elapsed
+
+	def latest(self):
+		"""[(hwnd, PIL image), ...] from the most recent pass, in client order."""
+		with self._lock:
+			return [(h, self._thumbs[h]) for h in self._order]
+
+	def _run(self):
+		while not self._stop.is_set():
+			elapsed = self.capture_once()
+			self._stop.wait(max(0.0, self.interval - elapsed))
+
+	def start(self):
+		if self._thread is None:
+			self._stop.clear()
+			self._thread = threading.Thread(target=self._run, name='thumbnails', daemon=True)
+			self._thread.start()
+
+	def stop(self):
+		self._stop.set()
+		thread = self._thread
+		self._thread = None
+		if thread is not None:
+			thread.join(timeout=2.0)
+
+
+def make_thumbnail_capturer(settings=None):
+	"""ThumbnailCapturer over the live clients, or None when Pillow or the window backend is missing."""
+	if not _PIL_AVAILABLE or get_window_backend() is None:
+		return None
+	s = settings if settings is not None else load_settings()
+	try:
+		source = Win32WindowCapture()
+	except Exception:
+		return None
+	return ThumbnailCapturer(source, get_roblox_windows, fps=s.get('overview_fps', 2), thumb_width=s.get('overview_thumb_width', 160))
 
 
 DISCORD_URL = 'https://discord.gg/KhGrvNpGjb'
@@ -1190,6 +6907,8 @@ def open_discord_link(event=None):
 
 
 def open_terms_of_service():
+	if show_cached_dialog('tos'):
+		return
 	win = tk.Toplevel(root)
 	win.title('Terms of Service')
 	win.geometry('650x550')
@@ -1292,15 +7011,13 @@ If you have questions about these Terms, contact us through the official Roblox
 			save_window_geometry_settings('tos', w, h, x, y)
 		except Exception:
 			pass
-		try:
-			win.destroy()
-		except Exception:
-			pass
+		hide_dialog(win)
 
 	try:
 		win.protocol('WM_DELETE_WINDOW', _on_close_tos)
 	except Exception:
 		pass
+	cache_dialog('tos', win)
 
 
 DONATE_URL = 'https://discord.com/channels/1444204543880462448/1453245947248119868'
@@ -1387,8 +7104,8 @@ def build_main_ui(root):
 	btn_stacker = mk_button(btn_frame, text='Stacker (F1)', width=16, command=open_stacker, cursor='hand2')
 	btn_stacker.grid(row=0, column=0, padx=6, pady=4)
 
-	btn_tinytask = mk_button(btn_frame, text='TinyTask (F2)', width=16, command=open_tinytask, cursor='hand2')
-	btn_tinytask.grid(row=0, column=1, padx=6, pady=4)
+	btn_macros = mk_button(btn_frame, text='Macros (F5)', width=16, command=open_macros, cursor='hand2')
+	btn_macros.grid(row=0, column=1, padx=6, pady=4)
 
 	btn_exit = mk_button(btn_frame, text='Exit (F3)', width=16, command=root.quit, cursor='hand2')
 	btn_exit.grid(row=0, column=2, padx=6, pady=4)
@@ -1409,6 +7126,8 @@ def build_main_ui(root):
 
 
 def open_settings():
+	if show_cached_dialog('settings'):
+		return
 	win = tk.Toplevel(root)
 	win.title('Settings')
 	_g = load_window_geometry_settings('settings')
@@ -1417,9 +7136,9 @@ def open_settings():
 			_w, _h, _x, _y = _g
 			win.geometry(f'{_w}x{_h}+{_x}+{_y}')
 		except Exception:
-			win.geometry('360x220')
+			win.geometry('360x320')
 	else:
-		win.geometry('360x220')
+		win.geometry('360x320')
 
 	s = load_settings()
 	cur_bg = s.get('bg', '#FFFFFF')
@@ -1431,7 +7150,7 @@ def open_settings():
 		pass
 
 	def choose_bg():
-		c = colorchooser.askcolor(title='Choose background color', initialcolor=cur_bg)
+		c = colorchooser.askcolor(title='Choose background color', initialcolor=load_settings().get('bg', cur_bg))
 		if c and c[1]:
 			try:
 				s = load_settings()
@@ -1442,7 +7161,7 @@ def open_settings():
 				pass
 
 	def choose_button():
-		c = colorchooser.askcolor(title='Choose button color', initialcolor=cur_btn)
+		c = colorchooser.askcolor(title='Choose button color', initialcolor=load_settings().get('button_bg', cur_btn))
 		if c and c[1]:
 			try:
 				s = load_settings()
@@ -1462,6 +7181,69 @@ def open_settings():
 	btn_btn = mk_button(win, text='Choose Button Color', command=choose_button, width=20, cursor='hand2')
 	btn_btn.pack()
 
+	server_var = tk.BooleanVar(value=s.get('control_server_enabled', False))
+
+	def _on_server_changed(*args):
+		if is_quiet(server_var):
+			return
+		try:
+			s = load_settings()
+			s['control_server_enabled'] = server_var.get()
+			save_settings(s)
+			if server_var.get():
+				start_control_server()
+			else:
+				stop_control_server()
+		except Exception:
+			pass
+
+	server_var.trace('w', _on_server_changed)
+
+	chk_server = tk.Checkbutton(win, text=f"Automation server (localhost:{s.get('control_server_port', DEFAULT_CONTROL_PORT)})", variable=server_var, bg=win.cget('bg'))
+	chk_server.pack(pady=(12, 4))
+
+	watchdog_var = tk.BooleanVar(value=s.get('watchdog_enabled', False))
+
+	def _on_watchdog_changed(*args):
+		if is_quiet(watchdog_var):
+			return
+		try:
+			s = load_settings()
+			s['watchdog_enabled'] = watchdog_var.get()
+			save_settings(s)
+			if watchdog_var.get():
+				start_watchdog()
+			else:
+				stop_watchdog()
+		except Exception:
+			pass
+
+	watchdog_var.trace('w', _on_watchdog_changed)
+
+	chk_watchdog = tk.Checkbutton(win, text="Restore crashed clients to their slot", variable=watchdog_var, bg=win.cget('bg'))
+	chk_watchdog.pack(pady=(0, 4))
+
+	lag_var = tk.BooleanVar(value=s.get('loop_lag_monitor_enabled', False))
+
+	def _on_lag_changed(*args):
+		if is_quiet(lag_var):
+			return
+		try:
+			s = load_settings()
+			s['loop_lag_monitor_enabled'] = lag_var.get()
+			save_settings(s)
+			if lag_var.get():
+				start_loop_lag_monitor()
+			else:
+				stop_loop_lag_monitor()
+		except Exception:
+			pass
+
+	lag_var.trace('w', _on_lag_changed)
+
+	chk_lag = tk.Checkbutton(win, text="Measure UI lag (shown in Clients)", variable=lag_var, bg=win.cget('bg'))
+	chk_lag.pack(pady=(0, 4))
+
 	def _on_close():
 		try:
 			w = win.winfo_width()
@@ -1471,15 +7253,19 @@ def open_settings():
 			save_window_geometry_settings('settings', w, h, x, y)
 		except Exception:
 			pass
-		try:
-			win.destroy()
-		except Exception:
-			pass
+		hide_dialog(win)
+
+	def _on_reopen_settings():
+		# Services may have been switched on or off elsewhere (Stacker, control server)
+		set_var_quietly(server_var, CONTROL_SERVER is not None)
+		set_var_quietly(watchdog_var, WATCHDOG is not None)
+		set_var_quietly(lag_var, LOOP_LAG_MONITOR is not None)
 
 	try:
 		win.protocol('WM_DELETE_WINDOW', _on_close)
 	except Exception:
 		pass
+	cache_dialog('settings', win, _on_reopen_settings)
 
 
 def setup_hotkeys():
@@ -1502,15 +7288,38 @@ def setup_hotkeys():
 			except Exception:
 				pass
 
+		def _f4():
+			try:
+				root.after(0, restore_hidden_clients)
+			except Exception:
+				pass
+
+		def _f5():
+			try:
+				root.after(0, open_macros)
+			except Exception:
+				pass
+
 		try:
 			keyboard.add_hotkey('f1', _f1)
 			keyboard.add_hotkey('f2', _f2)
 			keyboard.add_hotkey('f3', _f3)
+			keyboard.add_hotkey('f4', _f4)
+			keyboard.add_hotkey('f5', _f5)
 		except Exception:
 			pass
 
 
 if __name__ == '__main__':
+	# Only one instance may own the hotkeys and Settings.json; later launches hand over and exit
+	cli_command = parse_cli_command(sys.argv[1:])
+	instance_lock = InstanceLock(get_instance_lock_path())
+	if not instance_lock.acquire():
+		reply = forward_to_running_instance(cli_command)
+		if reply is None:
+			print(f"{APP_NAME} is already running but did not respond.")
+		sys.exit(0 if reply is not None else 1)
+
 	ensure_settings_exist()   # ← IMPORTANT
 	root = tk.Tk()
 
@@ -1572,6 +7381,8 @@ if __name__ == '__main__':
 		root.bind('<F1>', lambda e: open_stacker())
 		root.bind('<F2>', lambda e: open_tinytask())
 		root.bind('<F3>', lambda e: root.quit())
+		root.bind('<F4>', lambda e: restore_hidden_clients())
+		root.bind('<F5>', lambda e: open_macros())
 	except Exception:
 		pass
 
@@ -1582,9 +7393,40 @@ if __name__ == '__main__':
 	except Exception:
 		pass
 
+	try:
+		if settings.get('governor_enabled', False):
+			start_resource_governor()
+		if settings.get('memory_manager_enabled', False):
+			start_memory_manager()
+		if settings.get('drift_enforce_enabled', False):
+			start_drift_enforcer()
+		if settings.get('watchdog_enabled', False):
+			start_watchdog()
+		if settings.get('control_server_enabled', False):
+			start_control_server()
+		if settings.get('loop_lag_monitor_enabled', False):
+			start_loop_lag_monitor()
+	except Exception:
+		pass
+
+	try:
+		if start_instance_server() and cli_command != 'show':
+			root.after(0, lambda: INSTANCE_SERVER.executor.submit(INSTANCE_SERVER.handle, {'cmd': cli_command, 'token': INSTANCE_SERVER.token}))
+	except Exception:
+		pass
+
 	try:
 		root.mainloop()
 	finally:
+		# One failing service must not keep the others (or the instance lock) from shutting down
+		for _stop in (stop_loop_lag_monitor, stop_resource_governor, stop_memory_manager,
+				stop_drift_enforcer, stop_watchdog, stop_layout_recording, stop_input_broadcast,
+				stop_control_server, stop_instance_server):
+			try:
+				_stop()
+			except Exception:
+				pass
+		instance_lock.release()
 		try:
 			w = root.winfo_width()
 			h = root.winfo_height()
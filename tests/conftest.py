@@ -0,0 +1,159 @@
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+
+def pytest_configure(config):
+	config.addinivalue_line('markers', 'xvfb: needs an Xvfb server (skipped when Xvfb is not installed)')
+
+
+def pytest_collection_modifyitems(config, items):
+	if shutil.which('Xvfb'):
+		return
+	skip = pytest.mark.skip(reason='Xvfb is not installed')
+	for item in items:
+		if 'xvfb' in item.keywords:
+			item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True)
+def isolated_app(tmp_path, monkeypatch):
+	"""Settings go to a temporary home; the window backend and layout history start empty."""
+	monkeypatch.setenv('HOME', str(tmp_path))
+	monkeypatch.setenv('LOCALAPPDATA', str(tmp_path))
+	monkeypatch.setattr(main, 'PLACEMENT_HISTORY', main.PlacementHistory())
+	prev = main.set_window_backend(None)
+	yield
+	main.set_window_backend(prev)
+
+
+class FakeBackend:
+	"""
+	Window backend over a dict of rects. Every call is counted by method name in `calls`,
+	so tests can check how many OS calls (e.g. window scans) an operation costs.
+	"""
+
+	WORK_AREA = (0, 0, 1920, 1040)
+
+	def __init__(self, rects=None):
+		self.rects = dict(rects or {})
+		self.states = {}
+		self.pids = {}
+		self.foreground = None
+		self.calls = {}
+
+	def _count(self, name):
+		self.calls[name] = self.calls.get(name, 0) + 1
+
+	def enum_roblox_windows(self):
+		self._count('enum_roblox_windows')
+		return list(self.rects)
+
+	def enum_roblox_window_pids(self):
+		self._count('enum_roblox_window_pids')
+		return [(hwnd, self.pids.get(hwnd, hwnd * 10)) for hwnd in self.rects]
+
+	def enum_monitors(self):
+		return [{'hMonitor': 1, 'isPrimary': True, 'rcMonitor': (0, 0, 1920, 1080), 'rcWork': self.WORK_AREA}]
+
+	def get_window_rect(self, hwnd):
+		self._count('get_window_rect')
+		return self.rects.get(hwnd)
+
+	def get_client_rect(self, hwnd):
+		return self.rects.get(hwnd)
+
+	def get_show_state(self, hwnd):
+		return self.states.get(hwnd, 'normal')
+
+	def get_window_pid(self, hwnd):
+		return self.pids.get(hwnd, hwnd * 10)
+
+	def get_window_title(self, hwnd):
+		return 'Roblox'
+
+	def get_foreground_window(self):
+		return self.foreground
+
+	def is_window_visible(self, hwnd):
+		return hwnd in self.rects
+
+	def is_responsive(self, hwnd):
+		return True
+
+	def restore_window(self, hwnd):
+		self._count('restore_window')
+		self.states[hwnd] = 'normal'
+
+	def minimize_window(self, hwnd):
+		self._count('minimize_window')
+		self.states[hwnd] = 'minimized'
+
+	def close_window(self, hwnd):
+		self._count('close_window')
+		self.rects.pop(hwnd, None)
+
+	def move_window(self, hwnd, x, y, w=None, h=None):
+		self._count('move_window')
+		left, top, right, bottom = self.rects[hwnd]
+		if not (w and h):
+			w, h = right - left, bottom - top
+		self.rects[hwnd] = (int(x), int(y), int(x) + int(w), int(y) + int(h))
+
+	def apply_placements(self, placements, resize=True):
+		self._count('apply_placements')
+		for hwnd, (rect, state) in placements.items():
+			if not resize and hwnd in self.rects:
+				left, top, right, bottom = self.rects[hwnd]
+				rect = (rect[0], rect[1], rect[0] + right - left, rect[1] + bottom - top)
+			self.rects[hwnd] = tuple(rect)
+			self.states[hwnd] = state
+		return len(placements)
+
+
+@pytest.fixture
+def fake_backend():
+	backend = FakeBackend({100 + i: (i * 10, i * 10, i * 10 + 800, i * 10 + 600) for i in range(5)})
+	main.set_window_backend(backend)
+	return backend
+
+
+@pytest.fixture(scope='session')
+def xvfb_display():
+	"""DISPLAY name of a private Xvfb server for the whole session."""
+	display = ':%d' % (90 + os.getpid() % 100)
+	proc = subprocess.Popen(['Xvfb', display, '-screen', '0', '1920x1080x24', '-nolisten', 'tcp'],
+		stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+	deadline = time.monotonic() + 10
+	while not os.path.exists('/tmp/.X11-unix/X%s' % display[1:]):
+		if proc.poll() is not None or time.monotonic() > deadline:
+			proc.kill()
+			pytest.skip('Xvfb did not start')
+		time.sleep(0.05)
+	old = os.environ.get('DISPLAY')
+	os.environ['DISPLAY'] = display
+	yield display
+	if old is None:
+		os.environ.pop('DISPLAY', None)
+	else:
+		os.environ['DISPLAY'] = old
+	proc.terminate()
+	proc.wait(5)
+
+
+@pytest.fixture
+def tk_root(xvfb_display, monkeypatch):
+	"""A Tk main window on Xvfb, installed as main.root like the app's own."""
+	root = main.tk.Tk()
+	monkeypatch.setattr(main, 'root', root, raising=False)
+	monkeypatch.setattr(main, '_DIALOGS', {})
+	yield root
+	root.destroy()
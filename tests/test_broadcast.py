@@ -0,0 +1,96 @@
+import threading
+
+import main
+
+
+class FakeSink:
+	def __init__(self, hwnd, client_rect):
+		self.hwnd = hwnd
+		self.client_rect = client_rect
+		self.events = []
+		self.done = threading.Event()
+		self.expect = None
+
+	def send(self, kind, a, b, c):
+		self.events.append((kind, a, b, c))
+		if self.expect is not None and len(self.events) >= self.expect:
+			self.done.set()
+
+
+LAYOUT = {1: (0, 0, 800, 600), 2: (800, 0, 1200, 300), 3: (0, 600, 800, 1200)}
+
+
+def _broadcaster(**kwargs):
+	b = main.InputBroadcaster(sink_factory=FakeSink, **kwargs)
+	b.set_layout(LAYOUT)
+	b.set_source(1)
+	return b
+
+
+def test_translates_to_each_target_client():
+	b = _broadcaster()
+	b.start()
+	try:
+		b.sinks[2].expect = b.sinks[3].expect = 2
+		assert b.submit_mouse(main.EV_DOWN, 400, 300, 0)
+		assert not b.submit_mouse(main.EV_DOWN, 900, 100, 0)
+		assert b.submit_key(True, 30, 65)
+		assert b.sinks[2].done.wait(2) and b.sinks[3].done.wait(2)
+	finally:
+		b.stop()
+	assert b.sinks[2].events == [(main.EV_DOWN, 200, 150, 0), (main.EV_KEY_DOWN, 30, 65, 0)]
+	assert b.sinks[3].events == [(main.EV_DOWN, 400, 300, 0), (main.EV_KEY_DOWN, 30, 65, 0)]
+	assert b.sinks[1].events == []
+
+
+def test_targets_limit_the_routes():
+	b = _broadcaster()
+	b.set_targets([3])
+	assert [sink.hwnd for sink, sx, sy in b._routes] == [3]
+	b.set_targets(None)
+	assert len(b._routes) == 2
+
+
+def test_full_queue_drops_and_counts():
+	b = _broadcaster(queue_size=2)
+	for i in range(5):
+		b.submit_mouse(main.EV_MOVE, i, i)
+	assert b.dropped == 3
+
+
+def test_latency_and_throughput():
+	count = 20000
+	b = _broadcaster(queue_size=count)
+	b.sinks[2].expect = count
+	b.start()
+	try:
+		start = main.time.perf_counter()
+		for i in range(count):
+			b.submit_mouse(main.EV_MOVE, i % 800, i % 600)
+		assert b.sinks[2].done.wait(10)
+		elapsed = main.time.perf_counter() - start
+	finally:
+		b.stop()
+	stats = b.stats()
+	assert stats['sent'] == count and stats['dropped'] == 0
+	print('broadcast: %.0f events/s to %d targets, avg %.3f ms, max %.3f ms' % (
+		count / elapsed, stats['targets'], stats['avg_latency_ms'], stats['max_latency_ms']))
+	assert stats['max_latency_ms'] >= stats['avg_latency_ms'] > 0
+
+
+def test_paced_latency():
+	# One event at a time, as a player types: latency without queueing behind a burst
+	b = _broadcaster()
+	sink = b.sinks[3]
+	b.start()
+	try:
+		for i in range(200):
+			sink.expect = i + 1
+			sink.done.clear()
+			b.submit_key(i % 2 == 0, 30)
+			assert sink.done.wait(2)
+	finally:
+		b.stop()
+	stats = b.stats()
+	print('broadcast, paced: avg %.3f ms, max %.3f ms' % (stats['avg_latency_ms'], stats['max_latency_ms']))
+	assert stats['sent'] == 200
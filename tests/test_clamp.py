@@ -0,0 +1,70 @@
+import random
+import time
+
+import pytest
+
+import main
+
+WORK = (0, 0, 1920, 1040)
+
+
+def _layout(n, seed=1):
+	rng = random.Random(seed)
+	positions = [(rng.randint(-500, 2500), rng.randint(-500, 2500)) for _ in range(n)]
+	sizes = [(rng.choice([640, 800, 1024, 2000]), rng.choice([480, 600, 768, 1200])) for _ in range(n)]
+	return positions, sizes
+
+
+@pytest.fixture(params=['numpy', 'scalar'])
+def path(request, monkeypatch):
+	if request.param == 'numpy':
+		pytest.importorskip('numpy')
+	else:
+		monkeypatch.setattr(main, '_NUMPY_AVAILABLE', False)
+	return request.param
+
+
+def test_matches_clamp_to_monitor(path):
+	positions, sizes = _layout(300)
+	expected = [main.clamp_to_monitor(None, x, y, WORK, size=size) for (x, y), size in zip(positions, sizes)]
+	assert main.clamp_layout_to_work_area(positions, sizes, WORK) == expected
+
+
+def test_no_work_area_keeps_positions(path):
+	assert main.clamp_layout_to_work_area([(5.0, -3.0)], [(800, 600)], None) == [(5, -3)]
+
+
+def test_reflow_paths_agree(monkeypatch):
+	pytest.importorskip('numpy')
+	positions = [(i * 24, i * 24) for i in range(120)]
+	sizes = [(800, 600)] * 120
+	for direction in (1, -1):
+		vectorized = main.clamp_layout_to_work_area(positions, sizes, WORK, reflow=True, direction=direction)
+		monkeypatch.setattr(main, '_NUMPY_AVAILABLE', False)
+		scalar = main.clamp_layout_to_work_area(positions, sizes, WORK, reflow=True, direction=direction)
+		monkeypatch.setattr(main, '_NUMPY_AVAILABLE', True)
+		assert vectorized == scalar
+		assert all(WORK[0] <= x <= WORK[2] - 800 and WORK[1] <= y <= WORK[3] - 600 for x, y in scalar)
+
+
+def _best_of(fn, repeat=5):
+	best = None
+	for _ in range(repeat):
+		t0 = time.perf_counter()
+		fn()
+		elapsed = time.perf_counter() - t0
+		best = elapsed if best is None else min(best, elapsed)
+	return best
+
+
+@pytest.mark.parametrize('n', [10, 100, 1000])
+def test_vectorized_vs_scalar_benchmark(n, monkeypatch):
+	pytest.importorskip('numpy')
+	positions, sizes = _layout(n)
+	vectorized = _best_of(lambda: main.clamp_layout_to_work_area(positions, sizes, WORK))
+	monkeypatch.setattr(main, '_NUMPY_AVAILABLE', False)
+	scalar = _best_of(lambda: main.clamp_layout_to_work_area(positions, sizes, WORK))
+	per_window = _best_of(lambda: [main.clamp_to_monitor(None, x, y, WORK, size=s) for (x, y), s in zip(positions, sizes)])
+	print(f'clamp {n} windows: numpy {vectorized * 1e6:.0f} us, scalar {scalar * 1e6:.0f} us, per-window {per_window * 1e6:.0f} us')
+	assert main.clamp_layout_to_work_area(positions, sizes, WORK) == [
+		main.clamp_to_monitor(None, x, y, WORK, size=s) for (x, y), s in zip(positions, sizes)]
@@ -0,0 +1,144 @@
+import json
+import socket
+
+import pytest
+
+import main
+
+
+def _server(token=None):
+	commands = {
+		'echo': lambda request: request.get('value'),
+		'fail': lambda request: 1 / 0,
+	}
+	return main.ControlServer(commands, token=token)
+
+
+def test_handle_runs_command():
+	assert _server().handle({'id': 7, 'cmd': 'echo', 'value': [1, 2]}) == {'id': 7, 'ok': True, 'result': [1, 2]}
+
+
+def test_handle_unknown_command():
+	reply = _server().handle({'id': 1, 'cmd': 'nope'})
+	assert reply['ok'] is False
+	assert 'unknown command' in reply['error']
+
+
+def test_handle_reports_exceptions():
+	reply = _server().handle({'id': 2, 'cmd': 'fail'})
+	assert reply == {'id': 2, 'ok': False, 'error': 'division by zero'}
+
+
+def test_handle_checks_token():
+	server = _server(token='s3cret')
+	assert server.handle({'cmd': 'echo', 'value': 1})['error'] == 'bad token'
+	assert server.handle({'cmd': 'echo', 'value': 1, 'token': 'wrong'})['ok'] is False
+	assert server.handle({'cmd': 'echo', 'value': 1, 'token': 's3cret'})['result'] == 1
+
+
+@pytest.mark.parametrize('line,http', [
+	(b'POST / HTTP/1.1', True),
+	(b'GET /stats HTTP/1.0', True),
+	(b'OPTIONS * HTTP/1.1', True),
+	(b'{"cmd": "echo"}', False),
+])
+def test_looks_like_http(line, http):
+	assert main.ControlServer.looks_like_http(line) is http
+
+
+def _exchange(address, payload):
+	with socket.create_connection(address, timeout=5) as sock:
+		sock.sendall(payload)
+		sock.shutdown(socket.SHUT_WR)
+		data = b''
+		while True:
+			chunk = sock.recv(65536)
+			if not chunk:
+				return data
+			data += chunk
+
+
+def test_serves_json_lines_over_tcp():
+	server = _server(token='t')
+	address = server.start()
+	try:
+		data = _exchange(address, b'{"id": 1, "cmd": "echo", "value": "hi", "token": "t"}\n[1]\n{"id": 3, "cmd": "echo"}\n')
+		replies = [json.loads(line) for line in data.splitlines()]
+		assert replies[0] == {'id': 1, 'ok': True, 'result': 'hi'}
+		assert replies[1]['ok'] is False and 'bad request' in replies[1]['error']
+		assert replies[2] == {'id': 3, 'ok': False, 'error': 'bad token'}
+		assert server.requests_served == 3
+	finally:
+		server.stop()
+
+
+def test_drops_http_requests():
+	server = _server()
+	address = server.start()
+	try:
+		body = b'{"id": 1, "cmd": "echo", "value": 1}\n'
+		data = _exchange(address, b'POST / HTTP/1.1\r\nHost: 127.0.0.1\r\n\r\n' + body)
+		assert data == b''
+		assert server.requests_served == 0
+	finally:
+		server.stop()
+
+
+@pytest.fixture
+def commands_server(fake_backend, monkeypatch):
+	monkeypatch.setattr(main, '_CONTROL_STACK_STATE', main._ControlStackState())
+	return main.ControlServer(main.CONTROL_COMMANDS)
+
+
+def _call(server, cmd, **fields):
+	reply = server.handle(dict(fields, cmd=cmd))
+	assert reply['ok'], reply
+	return reply['result']
+
+
+def test_control_commands_against_fake_backend(commands_server, fake_backend):
+	assert _call(commands_server, 'ping') == 'pong'
+	clients = _call(commands_server, 'list_clients')
+	assert [c['hwnd'] for c in clients] == [100, 101, 102, 103, 104]
+	assert clients[1] == {'slot': 2, 'hwnd': 101, 'pid': 1010, 'rect': [10, 10, 810, 610], 'state': 'normal', 'title': 'Roblox'}
+
+	assert _call(commands_server, 'move_client', slot=3, x=500, y=400, w=640, h=480) == {'hwnd': 102, 'x': 500, 'y': 400}
+	assert fake_backend.rects[102] == (500, 400, 1140, 880)
+	assert _call(commands_server, 'undo') == {'moved': 1}
+	assert fake_backend.rects[102] == (20, 20, 820, 620)
+
+	result = _call(commands_server, 'top_left')
+	assert result['placed'] == 5
+	assert all(fake_backend.rects[h][:2] == (0, 0) for h in fake_backend.rects)
+
+	pos = _call(commands_server, 'stack_next')
+	assert pos == {'x': 24, 'y': 24}
+
+	stats = _call(commands_server, 'get_stats')
+	assert stats['clients'] == 5
+	assert stats['history_steps'] >= 2
+
+
+def test_control_command_errors_are_replies(commands_server, fake_backend):
+	reply = commands_server.handle({'cmd': 'move_client', 'slot': 9, 'x': 0, 'y': 0})
+	assert reply == {'id': None, 'ok': False, 'error': 'no client in slot 9'}
+	fake_backend.rects = {100: (0, 0, 800, 600)}
+	reply = commands_server.handle({'cmd': 'stack_next'})
+	assert reply['ok'] is False and 'two Roblox windows' in reply['error']
+
+
+def test_benchmark_requests_per_second(fake_backend):
+	server = main.ControlServer(main.CONTROL_COMMANDS, token='t')
+	address = server.start()
+	count = 500
+	try:
+		payload = b''.join(b'{"id": %d, "cmd": "ping", "token": "t"}\n' % i for i in range(count))
+		start = main.time.perf_counter()
+		data = _exchange(address, payload)
+		elapsed = main.time.perf_counter() - start
+	finally:
+		server.stop()
+	replies = data.splitlines()
+	assert len(replies) == count
+	assert json.loads(replies[-1]) == {'id': count - 1, 'ok': True, 'result': 'pong'}
+	print('control server: %.0f requests/s over one connection' % (count / elapsed))
@@ -0,0 +1,78 @@
+import time
+
+import pytest
+
+import main
+
+pytestmark = pytest.mark.xvfb
+
+
+def _checkbuttons(win):
+	return [w for w in win.winfo_children() if isinstance(w, main.tk.Checkbutton)]
+
+
+def test_settings_dialog_is_reused(tk_root):
+	main.open_settings()
+	win = main._DIALOGS['settings']
+	main.hide_dialog(win)
+	main.open_settings()
+	assert main._DIALOGS['settings'] is win
+	assert win.state() == 'normal'
+
+
+def test_minimized_dialog_is_brought_back(tk_root):
+	main.open_settings()
+	win = main._DIALOGS['settings']
+	tk_root.update()
+	win.iconify()
+	tk_root.update()
+	main.open_settings()
+	tk_root.update()
+	assert win.state() == 'normal'
+
+
+def test_reopen_syncs_checkbuttons_without_saving(tk_root):
+	main.save_settings({'control_server_enabled': True, 'watchdog_enabled': True})
+	main.open_settings()
+	win = main._DIALOGS['settings']
+	main.hide_dialog(win)
+	# Neither service is running, so the checkboxes are cleared on reopen...
+	main.open_settings()
+	assert all(not tk_root.getvar(chk.cget('variable')) for chk in _checkbuttons(win))
+	# ...but the saved preferences are left alone
+	s = main.load_settings()
+	assert s['control_server_enabled'] is True
+	assert s['watchdog_enabled'] is True
+
+
+def test_reopen_applies_current_theme(tk_root, monkeypatch):
+	monkeypatch.setattr(main, 'CURRENT_BG', '#000000')
+	main.open_settings()
+	win = main._DIALOGS['settings']
+	main.hide_dialog(win)
+	monkeypatch.setattr(main, 'CURRENT_BG', '#ffffff')
+	main.open_settings()
+	for chk in _checkbuttons(win):
+		assert chk.cget('fg') == 'black'
+		assert chk.cget('bg') == '#ffffff'
+
+
+def test_reopen_benchmark(tk_root):
+	"""Showing a cached dialog should cost a fraction of building it."""
+	t0 = time.perf_counter()
+	main.open_settings()
+	tk_root.update()
+	build = time.perf_counter() - t0
+	win = main._DIALOGS['settings']
+	reopen = []
+	for _ in range(20):
+		main.hide_dialog(win)
+		tk_root.update()
+		t0 = time.perf_counter()
+		main.open_settings()
+		tk_root.update()
+		reopen.append(time.perf_counter() - t0)
+	reopen.sort()
+	print(f'settings dialog: build {build * 1000:.1f} ms, reopen p50 {reopen[10] * 1000:.1f} ms')
+	assert main._DIALOGS['settings'] is win
+	assert reopen[10] < build
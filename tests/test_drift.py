@@ -0,0 +1,96 @@
+from conftest import FakeBackend
+
+import main
+
+
+def _enforcer(backend, **kwargs):
+	clock = [0.0]
+	enforcer = main.DriftEnforcer(backend, debounce=0.5, clock=lambda: clock[0], **kwargs)
+	enforcer.set_targets(main.snapshot_placements(list(backend.rects)))
+	return enforcer, clock
+
+
+def _play(enforcer, backend, clock, script, until, tick=0.01):
+	"""
+	Run a scripted event stream: script is [(time, hwnd, rect), ...]. Each event moves the
+	window and fires on_location_change; every tick the due windows are corrected like
+	the enforcer thread does. Returns [(time, sorted hwnds corrected), ...] per batch.
+	"""
+	script = sorted(script)
+	batches = []
+	steps = int(round(until / tick))
+	for step in range(steps + 1):
+		now = clock[0] = step * tick
+		while script and script[0][0] <= now + 1e-9:
+			_t, hwnd, rect = script.pop(0)
+			backend.rects[hwnd] = rect
+			enforcer.on_location_change(hwnd)
+		ready = enforcer.due(now)
+		if ready:
+			before = enforcer.batches
+			enforcer.correct(ready)
+			if enforcer.batches != before:
+				batches.append((round(now, 3), sorted(ready)))
+	return batches
+
+
+def test_drag_is_corrected_once_after_it_settles(fake_backend):
+	enforcer, clock = _enforcer(fake_backend)
+	drag = [(i * 0.01, 101, (10 + i * 5, 10, 810 + i * 5, 610)) for i in range(30)]
+	batches = _play(enforcer, fake_backend, clock, drag, until=2.0)
+	assert batches == [(0.79, [101])]
+	assert fake_backend.rects[101] == (10, 10, 810, 610)
+	assert enforcer.events == 30
+	assert fake_backend.calls['apply_placements'] == 1
+
+
+def test_burst_across_windows_makes_one_batch(fake_backend):
+	enforcer, clock = _enforcer(fake_backend)
+	script = [(0.0, 100, (300, 300, 1100, 900)), (0.05, 102, (0, 0, 800, 600)), (0.1, 104, (5, 5, 805, 605))]
+	batches = _play(enforcer, fake_backend, clock, script, until=2.0)
+	assert batches == [(0.5, [100, 102, 104])]
+	assert fake_backend.calls['apply_placements'] == 1
+
+
+def test_events_without_drift_send_nothing(fake_backend):
+	enforcer, clock = _enforcer(fake_backend)
+	script = [(0.0, 100, (0, 0, 800, 600)), (0.2, 103, (30, 30, 830, 630))]
+	assert _play(enforcer, fake_backend, clock, script, until=2.0) == []
+	assert fake_backend.calls.get('apply_placements', 0) == 0
+
+
+def test_minimized_window_is_left_alone(fake_backend):
+	enforcer, clock = _enforcer(fake_backend)
+	fake_backend.states[102] = 'minimized'
+	assert _play(enforcer, fake_backend, clock, [(0.0, 102, (-32000, -32000, -31840, -31972))], until=1.0) == []
+
+
+class StubbornBackend(FakeBackend):
+	"""Window 101 refuses its slot: it springs back, raising a location event like the OS would."""
+
+	enforcer = None
+
+	def apply_placements(self, placements, resize=True):
+		n = super().apply_placements(placements, resize)
+		if 101 in placements:
+			self.rects[101] = (400, 10, 1200, 610)
+			self.enforcer.on_location_change(101)
+		return n
+
+
+def test_stubborn_window_slot_is_adopted_after_max_attempts():
+	backend = StubbornBackend({100 + i: (i * 10, i * 10, i * 10 + 800, i * 10 + 600) for i in range(3)})
+	main.set_window_backend(backend)
+	enforcer, clock = _enforcer(backend, max_attempts=3)
+	backend.enforcer = enforcer
+	batches = _play(enforcer, backend, clock, [(0.0, 101, (400, 10, 1200, 610))], until=4.0)
+	# Three tries, each a debounce after the last spring-back; then the rect is adopted
+	assert batches == [(0.5, [101]), (1.0, [101]), (1.5, [101])]
+	assert enforcer.targets[101] == ((400, 10, 1200, 610), 'normal')
+
+
+def test_reused_hwnd_is_forgotten(fake_backend):
+	enforcer, clock = _enforcer(fake_backend)
+	fake_backend.pids[101] = 424242
+	assert _play(enforcer, fake_backend, clock, [(0.0, 101, (600, 600, 1400, 1200))], until=1.0) == []
+	assert 101 not in enforcer.targets
@@ -0,0 +1,99 @@
+import collections
+import random
+
+import main
+
+
+def _spin(seconds):
+	end = main.time.perf_counter() + seconds
+	while main.time.perf_counter() < end:
+		pass
+
+
+class SimulatedDesktop(main.Win32Backend):
+	"""
+	Win32Backend over an in-memory desktop: 500 top-level windows, 40 of them clients.
+	Opening a process costs OPEN_COST seconds, as OpenProcess + QueryFullProcessImageNameW do.
+	"""
+
+	OPEN_COST = 20e-6
+
+	def __init__(self, windows=500, clients=40, snapshot_works=True):
+		rng = random.Random(3)
+		self.calls = collections.Counter()
+		self.snapshot_works = snapshot_works
+		self.set_match_config(main.window_match_config({}))
+		self.last_matcher = None
+		self.images = {}
+		self.windows = {}
+		client_hwnds = set(rng.sample(range(windows), clients))
+		for i in range(windows):
+			hwnd = 0x10000 + i
+			if i in client_hwnds:
+				pid = 5000 + i
+				self.images[pid] = main.ROBLOX_IMAGE_NAME
+				visible = True
+			else:
+				# Many windows per process, most of them hidden, like a real desktop
+				pid = 100 + i % 60
+				self.images[pid] = 'explorer.exe' if pid % 2 else 'chrome.exe'
+				visible = rng.random() < 0.4
+			self.windows[hwnd] = (pid, visible)
+
+	def enum_top_level_windows(self):
+		self.calls['EnumWindows'] += 1
+		return list(self.windows)
+
+	def snapshot_pids(self, image_names):
+		self.calls['snapshot'] += 1
+		if not self.snapshot_works:
+			return None
+		targets = {n.lower() for n in image_names}
+		return {pid for pid, name in self.images.items() if name.lower() in targets}
+
+	def is_window_visible(self, hwnd):
+		return self.windows[hwnd][1]
+
+	def get_window_pid(self, hwnd):
+		self.calls['GetWindowThreadProcessId'] += 1
+		return self.windows[hwnd][0]
+
+	def get_process_image_name(self, pid):
+		self.calls['OpenProcess'] += 1
+		_spin(self.OPEN_COST)
+		return self.images.get(pid)
+
+
+def test_snapshot_path_opens_no_process():
+	desktop = SimulatedDesktop()
+	found = desktop.enum_roblox_window_pids()
+	assert len(found) == 40
+	assert desktop.calls['snapshot'] == 1 and desktop.calls['EnumWindows'] == 1
+	assert desktop.calls['OpenProcess'] == 0
+
+
+def test_fallback_when_snapshot_fails_finds_the_same_clients():
+	fast = SimulatedDesktop().enum_roblox_window_pids()
+	desktop = SimulatedDesktop(snapshot_works=False)
+	assert desktop.enum_roblox_window_pids() == fast
+	visible = sum(1 for pid, shown in desktop.windows.values() if shown)
+	assert desktop.calls['OpenProcess'] == visible
+
+
+def test_no_clients_skips_the_window_walk():
+	desktop = SimulatedDesktop()
+	desktop.images = {pid: 'explorer.exe' for pid in desktop.images}
+	assert desktop.enum_roblox_window_pids() == []
+	assert desktop.calls['EnumWindows'] == 0
+
+
+def test_benchmark_500_windows_40_clients():
+	timings = {}
+	for name, works in (('snapshot', True), ('per-window OpenProcess', False)):
+		desktop = SimulatedDesktop(snapshot_works=works)
+		start = main.time.perf_counter()
+		for _ in range(20):
+			found = desktop.enum_roblox_window_pids()
+		timings[name] = (main.time.perf_counter() - start) / 20 * 1000
+		assert len(found) == 40
+	print('enumeration, 500 windows / 40 clients: ' + ', '.join('%s %.2f ms' % kv for kv in timings.items()))
@@ -0,0 +1,100 @@
+import main
+
+
+def test_empty_area_puts_window_top_left():
+	index = main.FreeSpaceIndex((0, 0, 1000, 1000), cell=10)
+	assert index.best_position(400, 300) == (0, 0)
+
+
+def test_picks_free_spot_next_to_tracked_window():
+	index = main.FreeSpaceIndex((0, 0, 1000, 1000), cell=10)
+	index.update('a', (0, 0, 500, 500))
+	assert index.best_position(500, 500) == (500, 0)
+	index.update('b', (500, 0, 1000, 500))
+	assert index.best_position(500, 500) == (0, 500)
+
+
+def test_least_overlap_when_area_is_full():
+	index = main.FreeSpaceIndex((0, 0, 1000, 1000), cell=10)
+	index.update('a', (0, 0, 1000, 1000))
+	index.update('b', (0, 0, 500, 1000))
+	assert index.best_position(500, 500) == (500, 0)
+
+
+def test_remove_and_move_update_coverage():
+	index = main.FreeSpaceIndex((0, 0, 1000, 1000), cell=10)
+	index.update('a', (0, 0, 500, 500))
+	index.update('a', (500, 500, 1000, 1000))
+	assert index.best_position(500, 500) == (0, 0)
+	index.remove('a')
+	index.remove('missing')
+	assert sum(map(sum, index.counts)) == 0
+
+
+def test_offset_work_area_and_clamping():
+	index = main.FreeSpaceIndex((100, 50, 1005, 1000), cell=24)
+	x, y = index.best_position(905, 400)
+	assert (x, y) == (100, 50)
+	index.update('a', (100, 50, 1005, 450))
+	x, y = index.best_position(905, 400)
+	assert 100 <= x and x + 905 <= 1005
+	assert y >= 450 - 24 and y + 400 <= 1000
+
+
+def test_pure_python_table_matches_numpy(monkeypatch):
+	rects = [(i * 37 % 900, i * 53 % 700, i * 37 % 900 + 320, i * 53 % 700 + 240) for i in range(30)]
+
+	def place_all():
+		index = main.FreeSpaceIndex((0, 0, 1920, 1040))
+		for i, rect in enumerate(rects):
+			index.update(i, rect)
+		return [index.best_position(w, h) for w, h in ((320, 240), (800, 600), (1920, 1040))]
+
+	expected = place_all()
+	monkeypatch.setattr(main, '_NUMPY_AVAILABLE', False)
+	assert place_all() == expected
+
+
+def _smart_setup(backend, count, **settings):
+	backend.rects = {hwnd: (0, 0, 320, 240) for hwnd in range(1000, 1000 + count)}
+	backend.states = {hwnd: 'normal' for hwnd in backend.rects}
+	main.set_window_backend(backend)
+	main.save_settings(dict({'next_placement_mode': 'smart'}, **settings))
+	return main._ControlStackState()
+
+
+def test_index_tracks_final_clamped_rect(fake_backend, monkeypatch):
+	win = _smart_setup(fake_backend, 3, keep_in_bounds=True)
+	monkeypatch.setattr(main, 'clamp_to_monitor', lambda hwnd, x, y, work, size=None: (700, 300))
+	main.stack_next_roblox(win, notify=False)
+	index = win._placement_index
+	target = next(h for h in index.rects if fake_backend.rects[h][:2] == (700, 300))
+	assert index.rects[target] == fake_backend.rects[target] == (700, 300, 1020, 540)
+
+
+def test_failed_move_keeps_old_rect_in_index(fake_backend, monkeypatch):
+	win = _smart_setup(fake_backend, 3)
+
+	def fail(*args):
+		raise OSError('gone')
+
+	monkeypatch.setattr(fake_backend, 'move_window', fail)
+	main.stack_next_roblox(win, notify=False)
+	for hwnd, rect in win._placement_index.rects.items():
+		assert rect == fake_backend.rects[hwnd]
+
+
+def test_benchmark_200_window_sequential_placement(fake_backend):
+	win = _smart_setup(fake_backend, 200)
+	start = main.time.perf_counter()
+	for _ in range(199):
+		main.stack_next_roblox(win, notify=False)
+	elapsed = main.time.perf_counter() - start
+	print('200-window smart Next: %.2f ms per press' % (elapsed * 1000 / 199))
+	index = win._placement_index
+	assert len(index.rects) == 200
+	for hwnd, rect in index.rects.items():
+		assert rect == fake_backend.rects[hwnd]
+	# The first windows spread out over free space instead of piling up at the origin
+	origins = {fake_backend.rects[h][:2] for h in range(1001, 1013)}
+	assert len(origins) == 12
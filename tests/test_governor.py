@@ -0,0 +1,93 @@
+import sys
+import types
+
+import main
+
+
+class FakeControl:
+	def __init__(self, cpus=4, can_raise=True, refuse_raise=False):
+		self.cpus = cpus
+		self.can_raise = can_raise
+		self.refuse_raise = refuse_raise
+		self.priority = {}
+		self.affinity = {}
+		self.calls = 0
+
+	def cpu_count(self):
+		return self.cpus
+
+	def can_raise_priority(self):
+		return self.can_raise
+
+	def set_priority(self, pid, level):
+		self.calls += 1
+		if level == 'normal' and self.refuse_raise:
+			return False
+		self.priority[pid] = level
+		return True
+
+	def set_affinity(self, pid, cpus):
+		self.calls += 1
+		self.affinity[pid] = tuple(cpus)
+		return True
+
+
+CLIENTS = {1: 10, 2: 20, 3: 30}
+
+
+def test_focus_change_only_touches_old_and_new_focus():
+	control = FakeControl()
+	gov = main.ResourceGovernor(control)
+	assert gov.sync(CLIENTS, 1) == 3
+	assert control.priority == {20: 'below_normal', 30: 'below_normal'}
+	control.calls = 0
+	assert gov.sync(CLIENTS, 2) == 2
+	assert control.priority == {10: 'below_normal', 20: 'normal', 30: 'below_normal'}
+	assert control.calls == 2
+	assert gov.sync(CLIENTS, 2) == 0
+
+
+def test_pin_affinity_round_robin_and_restore():
+	control = FakeControl(cpus=2)
+	gov = main.ResourceGovernor(control, background_priority='idle', pin_affinity=True)
+	gov.sync(CLIENTS, None)
+	assert control.affinity == {10: (0,), 20: (1,), 30: (0,)}
+	assert set(control.priority.values()) == {'idle'}
+	gov.restore_all()
+	assert set(control.priority.values()) == {'normal'}
+	assert set(control.affinity.values()) == {()}
+
+
+def test_no_lowering_when_priority_cannot_be_raised_again():
+	control = FakeControl(can_raise=False)
+	gov = main.ResourceGovernor(control, pin_affinity=True)
+	gov.sync(CLIENTS, 1)
+	gov.sync(CLIENTS, 2)
+	assert control.priority == {}
+	# Affinity doesn't need privileges to undo, so it still applies
+	assert control.affinity[10] != ()
+
+
+def test_refused_raise_stops_further_lowering():
+	control = FakeControl(refuse_raise=True)
+	gov = main.ResourceGovernor(control)
+	gov.sync({1: 10, 2: 20}, 1)
+	assert control.priority == {20: 'below_normal'}
+	gov.sync({1: 10, 2: 20, 3: 30}, 2)
+	assert gov.lower_priority is False
+	assert 30 not in control.priority
+
+
+def _psutil_control(monkeypatch, euid, nice_limit):
+	monkeypatch.setitem(sys.modules, 'psutil', types.SimpleNamespace(cpu_count=lambda: 4))
+	monkeypatch.setattr(main.os, 'geteuid', lambda: euid, raising=False)
+	resource = types.SimpleNamespace(RLIMIT_NICE=13, RLIM_INFINITY=-1, getrlimit=lambda which: (nice_limit, nice_limit))
+	monkeypatch.setitem(sys.modules, 'resource', resource)
+	return main.PsutilProcessControl()
+
+
+def test_psutil_control_checks_rlimit_nice(monkeypatch):
+	assert _psutil_control(monkeypatch, 0, 0).can_raise_priority()
+	assert not _psutil_control(monkeypatch, 1000, 0).can_raise_priority()
+	assert _psutil_control(monkeypatch, 1000, 20).can_raise_priority()
+	assert _psutil_control(monkeypatch, 1000, -1).can_raise_priority()
@@ -0,0 +1,75 @@
+import random
+
+import main
+
+SCREEN = [(0, 0, 1920, 1080)]
+
+
+def test_fully_covered_window_is_hidden():
+	rects = [('top', (0, 0, 800, 600)), ('under', (100, 100, 500, 400))]
+	assert main.find_hidden_windows(rects, SCREEN) == {'under'}
+
+
+def test_partially_visible_window_is_not_hidden():
+	rects = [('top', (0, 0, 800, 600)), ('peek', (700, 500, 1000, 800))]
+	assert main.find_hidden_windows(rects, SCREEN) == set()
+
+
+def test_covered_by_several_windows_together():
+	rects = [('left', (0, 0, 400, 600)), ('right', (400, 0, 800, 600)), ('under', (100, 100, 700, 500))]
+	assert main.find_hidden_windows(rects, SCREEN) == {'under'}
+
+
+def test_off_screen_and_empty_windows_are_hidden():
+	rects = [('off', (-2000, 0, -1200, 600)), ('empty', (10, 10, 10, 10)), ('edge', (-400, 0, 100, 600))]
+	assert main.find_hidden_windows(rects, SCREEN) == {'off', 'empty'}
+	# A window whose only visible part is off-screen is hidden too
+	rects = [('top', (0, 0, 800, 600)), ('under', (-300, 0, 700, 500))]
+	assert main.find_hidden_windows(rects, SCREEN) == {'under'}
+
+
+def test_throttler_minimizes_and_restores(fake_backend):
+	fake_backend.rects = {1: (0, 0, 800, 600), 2: (100, 100, 500, 400), 3: (5000, 0, 5800, 600), 4: (700, 500, 1000, 800)}
+	fake_backend.states = {hwnd: 'normal' for hwnd in fake_backend.rects}
+	throttler = main.HiddenClientThrottler()
+	assert sorted(throttler.apply(fake_backend, SCREEN)) == [2, 3]
+	assert fake_backend.states == {1: 'normal', 2: 'minimized', 3: 'minimized', 4: 'normal'}
+	# Already minimized windows are left alone on the next pass
+	assert throttler.apply(fake_backend, SCREEN) == []
+	# Restored by hand: no longer the throttler's to bring back
+	fake_backend.restore_window(3)
+	fake_backend.rects[3] = (1000, 600, 1400, 900)
+	assert throttler.apply(fake_backend, SCREEN) == []
+	assert throttler.minimized == {2}
+	assert throttler.restore_all(fake_backend) == 1
+	assert fake_backend.states[2] == 'normal'
+	assert throttler.minimized == set()
+
+
+def test_benchmark_200_windows():
+	rng = random.Random(7)
+	rects = []
+	for i in range(200):
+		x, y = rng.randrange(0, 1600), rng.randrange(0, 800)
+		rects.append((i, (x, y, x + rng.randrange(200, 800), y + rng.randrange(150, 600))))
+	start = main.time.perf_counter()
+	for _ in range(10):
+		hidden = main.find_hidden_windows(rects, SCREEN)
+	elapsed = (main.time.perf_counter() - start) / 10
+	print('find_hidden_windows, 200 windows: %.2f ms' % (elapsed * 1000))
+	# Spot-check against a per-pixel-block reference on a coarse grid
+	step = 8
+	for key, rect in rects[::20]:
+		visible = False
+		for x in range(rect[0], rect[2], step):
+			for y in range(rect[1], rect[3], step):
+				if not (0 <= x < 1920 and 0 <= y < 1080):
+					continue
+				above = rects[:key]
+				if not any(r[0] <= x < r[2] and r[1] <= y < r[3] for _, r in above):
+					visible = True
+					break
+			if visible:
+				break
+		if visible:
+			assert key not in hidden
@@ -0,0 +1,129 @@
+import time
+
+import main
+
+from conftest import FakeBackend
+
+
+def _p(x, y, state='normal'):
+	return ((x, y, x + 800, y + 600), state)
+
+
+def test_record_stores_only_changed_windows():
+	history = main.PlacementHistory()
+	before = {1: _p(0, 0), 2: _p(10, 10)}
+	after = {1: _p(100, 0), 2: _p(10, 10)}
+	assert history.record(before, after) == 1
+	assert history.step_count() == 1
+	assert history.undo() == {1: _p(0, 0)}
+	assert history.redo() == {1: _p(100, 0)}
+
+
+def test_unchanged_pass_adds_no_step():
+	history = main.PlacementHistory()
+	assert history.record({1: _p(0, 0)}, {1: _p(0, 0)}) == 0
+	assert history.step_count() == 0
+	assert history.undo() == {}
+
+
+def test_new_pass_clears_redo():
+	history = main.PlacementHistory()
+	history.record({1: _p(0, 0)}, {1: _p(50, 0)})
+	history.undo()
+	assert history.can_redo()
+	history.record({1: _p(0, 0)}, {1: _p(0, 50)})
+	assert not history.can_redo()
+
+
+def test_trim_drops_oldest_steps_but_keeps_one():
+	history = main.PlacementHistory(max_bytes=main.PlacementHistory.ENTRY_BYTES * 2)
+	for i in range(5):
+		history.record({1: _p(i, 0)}, {1: _p(i + 1, 0)})
+	assert history.step_count() == 2
+	assert history.memory_estimate() <= history.max_bytes
+	assert history.undo() == {1: _p(4, 0)}
+
+	big = main.PlacementHistory(max_bytes=1)
+	big.record({1: _p(0, 0), 2: _p(0, 0)}, {1: _p(1, 0), 2: _p(1, 0)})
+	assert big.step_count() == 1
+
+
+def test_forget_drops_closed_windows_and_empty_steps():
+	history = main.PlacementHistory()
+	history.record({1: _p(0, 0), 2: _p(0, 0)}, {1: _p(1, 0), 2: _p(1, 0)})
+	history.record({2: _p(1, 0)}, {2: _p(2, 0)})
+	history.forget([2])
+	assert history.step_count() == 1
+	assert 2 not in history.current()
+	assert 2 not in history.origin()
+	assert history.undo() == {1: _p(0, 0)}
+
+
+def test_origin_keeps_first_placement():
+	history = main.PlacementHistory()
+	history.record({1: _p(0, 0)}, {1: _p(1, 0)})
+	history.record({1: _p(1, 0)}, {1: _p(2, 0)})
+	assert history.origin() == {1: _p(0, 0)}
+	assert history.current() == {1: _p(2, 0)}
+
+
+def test_listeners_see_every_change():
+	history = main.PlacementHistory()
+	seen = []
+	history.add_listener(seen.append)
+	history.record({1: _p(0, 0)}, {1: _p(1, 0)})
+	history.undo()
+	history.remove_listener(seen.append)
+	history.redo()
+	assert seen == [{1: _p(1, 0)}, {1: _p(0, 0)}]
+
+
+def test_moved_placement_keeps_size_unless_given():
+	assert main.moved_placement(_p(0, 0), 5, 6) == ((5, 6, 805, 606), 'normal')
+	assert main.moved_placement(_p(0, 0), 5, 6, (100, 50)) == ((5, 6, 105, 56), 'normal')
+	assert main.moved_placement(None, 0, 0) == ((0, 0, 800, 600), 'normal')
+
+
+def _clients(n):
+	return FakeBackend({1000 + i: ((i % 10) * 150 + 10, (i // 10) * 90, (i % 10) * 150 + 810, (i // 10) * 90 + 600) for i in range(n)})
+
+
+def test_undo_redo_100_windows_in_one_batch_each():
+	backend = _clients(100)
+	main.set_window_backend(backend)
+	original = dict(backend.rects)
+	main.move_roblox_windows_top_left(notify=False)
+	moved = dict(backend.rects)
+	assert all(rect[:2] == (0, 0) for rect in moved.values())
+	assert main.PLACEMENT_HISTORY.step_count() == 1
+
+	backend.calls.clear()
+	t0 = time.perf_counter()
+	assert main.undo_placement() == 100
+	undo_s = time.perf_counter() - t0
+	assert backend.rects == original
+	assert backend.calls == {'apply_placements': 1}
+
+	t0 = time.perf_counter()
+	assert main.redo_placement() == 100
+	redo_s = time.perf_counter() - t0
+	assert backend.rects == moved
+	assert backend.calls == {'apply_placements': 2}
+	print(f'100-window undo {undo_s * 1000:.2f} ms, redo {redo_s * 1000:.2f} ms')
+
+	# Restore Original is an undoable step of its own
+	assert main.restore_pre_layout_positions() == 100
+	assert backend.rects == original
+	main.undo_placement()
+	assert backend.rects == moved
+
+
+def test_history_memory_grows_with_changed_windows_only():
+	backend = _clients(100)
+	main.set_window_backend(backend)
+	main.move_roblox_windows_top_left(notify=False)
+	size = main.PLACEMENT_HISTORY.memory_estimate()
+	# A second pass finds every window already in place: no new step, no memory
+	main.move_roblox_windows_top_left(notify=False)
+	assert main.PLACEMENT_HISTORY.step_count() == 1
+	assert main.PLACEMENT_HISTORY.memory_estimate() == size == 100 * main.PlacementHistory.ENTRY_BYTES
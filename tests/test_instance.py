@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+import main
+
+
+def test_second_lock_is_refused_until_released(tmp_path):
+	path = str(tmp_path / 'app' / 'instance.lock')
+	first = main.InstanceLock(path)
+	second = main.InstanceLock(path)
+	assert first.acquire()
+	assert not second.acquire()
+	first.release()
+	assert second.acquire()
+	second.release()
+	# Releasing twice is harmless
+	second.release()
+
+
+@pytest.mark.parametrize('argv,command', [
+	([], 'show'),
+	(['--stacker'], 'stacker'),
+	(['--load-layout'], 'apply_profile'),
+	(['--top-left', '--unknown'], 'top_left'),
+])
+def test_parse_cli_command(argv, command):
+	assert main.parse_cli_command(argv) == command
+
+
+def test_second_launch_forwards_to_running_instance(monkeypatch):
+	seen = []
+	monkeypatch.setattr(main, 'INSTANCE_COMMANDS', {'top_left': lambda request: seen.append(request['cmd']) or {'placed': 3}})
+	lock = main.InstanceLock(main.get_instance_lock_path())
+	assert lock.acquire()
+	server = main.start_instance_server()
+	assert server is not None
+	try:
+		assert not main.InstanceLock(main.get_instance_lock_path()).acquire()
+		assert os.path.exists(main.get_instance_info_path())
+		assert main.forward_to_running_instance('top_left') == {'id': None, 'ok': True, 'result': {'placed': 3}}
+		assert seen == ['top_left']
+		reply = main.forward_to_running_instance('stacker')
+		assert reply['ok'] is False
+	finally:
+		main.stop_instance_server()
+		lock.release()
+	assert not os.path.exists(main.get_instance_info_path())
+
+
+def test_forward_gives_up_when_nobody_answers():
+	start = main.time.monotonic()
+	assert main.forward_to_running_instance('show', timeout=0.3) is None
+	assert main.time.monotonic() - start < 2
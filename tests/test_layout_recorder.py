@@ -0,0 +1,65 @@
+import main
+
+
+def test_capture_saves_layout_once(fake_backend, monkeypatch):
+	writes = []
+	save = main.save_settings
+	monkeypatch.setattr(main, 'save_settings', lambda s: (writes.append(1), save(s)))
+	assert main.capture_current_layout() == 5
+	s = main.load_settings()
+	assert len(writes) == 1
+	assert s['load_start_corner'] == 'saved'
+	assert s['roblox_windows']['#2'][:2] == [10, 10]
+
+
+def test_moves_are_batched_into_one_posted_write(fake_backend):
+	t = [0.0]
+	posted = []
+	recorder = main.LayoutRecorder(fake_backend, flush_delay=1.0, clock=lambda: t[0], post=posted.append)
+	recorder._clients = set(fake_backend.rects)
+	for hwnd in list(fake_backend.rects):
+		left, top, right, bottom = fake_backend.rects[hwnd]
+		fake_backend.rects[hwnd] = (left + 50, top, right + 50, bottom)
+		recorder.on_location_change(hwnd)
+	assert recorder.events == 5
+	assert not recorder.flush_due(0.5)
+	assert recorder.flush_due(1.0)
+	assert recorder.flush() == 5
+	assert fake_backend.calls['enum_roblox_windows'] == 1
+	# Nothing is written until the posted write runs (on the Tk thread in the app)
+	assert 'roblox_windows' not in main.load_settings()
+	posted.pop()()
+	assert main.load_settings()['roblox_windows']['#1'][:2] == [50, 0]
+	assert recorder.flushes == 1
+	# Unchanged layout: no second write
+	recorder.flush()
+	posted.pop()()
+	assert recorder.flushes == 1
+
+
+def test_unknown_window_triggers_one_probe(fake_backend):
+	t = [0.0]
+	recorder = main.LayoutRecorder(fake_backend, flush_delay=1.0, clock=lambda: t[0])
+	recorder._clients = set(fake_backend.rects)
+	fake_backend.rects[999] = (3000, 0, 3800, 600)
+	recorder.on_location_change(999)
+	recorder.on_location_change(999)
+	assert recorder.events == 0
+	assert not recorder.probe_due(0.5)
+	assert recorder.probe_due(1.0)
+	t[0] = 1.0
+	assert recorder.probe() is True
+	assert 999 in recorder._clients
+	assert recorder.flush_due(1.0)
+	assert recorder.flush() == 6
+	assert len(main.load_settings()['roblox_windows']) == 6
+
+
+def test_stop_writes_pending_moves_in_place(fake_backend):
+	posted = []
+	recorder = main.LayoutRecorder(fake_backend, flush_delay=60, post=posted.append)
+	recorder._clients = set(fake_backend.rects)
+	recorder.on_location_change(100)
+	recorder.stop()
+	assert posted == []
+	assert len(main.load_settings()['roblox_windows']) == 5
@@ -0,0 +1,56 @@
+import main
+
+
+def test_entry_parsing():
+	assert main.parse_layout_entry([1, 2]) == (1, 2, None, None)
+	assert main.parse_layout_entry([1, 2, 300, 200]) == (1, 2, 300, 200)
+	assert main.parse_layout_entry([1, 2, 0, 200]) == (1, 2, None, None)
+	assert main.parse_layout_entry('bad') is None
+
+
+def test_per_slot_size_wins_over_uniform():
+	assert main.resolve_slot_size([0, 0, 300, 200], (800, 600)) == (300, 200)
+	assert main.resolve_slot_size([0, 0], (800, 600)) == (800, 600)
+	assert main.resolve_slot_size([0, 0], None) is None
+	assert main.resolve_slot_size(None, (800, 600)) == (800, 600)
+
+
+def test_forced_uniform_size_wins():
+	assert main.resolve_slot_size([0, 0, 300, 200], (800, 600), force_uniform=True) == (800, 600)
+	# Forcing without a uniform size keeps per-slot sizes
+	assert main.resolve_slot_size([0, 0, 300, 200], None, force_uniform=True) == (300, 200)
+	assert main.get_force_uniform_size({'load_force_uniform': True}) is False
+	assert main.get_force_uniform_size({'load_force_uniform': True, 'load_uniform_size': [800, 600]}) is True
+
+
+def test_saved_entries_always_keep_their_size():
+	assert main.layout_entry(5, 6, 800, 600) == [5, 6, 800, 600]
+	assert main.layout_entry(5, 6) == [5, 6]
+
+
+def _load(fake_backend, **settings):
+	layout = {'#1': [0, 0, 300, 200], '#2': [50, 50]}
+	main.save_settings(dict(settings, roblox_windows=layout, load_start_corner='saved'))
+	for hwnd in list(fake_backend.rects)[2:]:
+		del fake_backend.rects[hwnd]
+	main.apply_saved_layout(notify=False)
+	first, second = sorted(fake_backend.rects)
+	return fake_backend.rects[first], fake_backend.rects[second]
+
+
+def test_load_uses_per_slot_sizes_over_uniform(fake_backend):
+	first, second = _load(fake_backend, load_uniform_size=[640, 480])
+	assert first == (0, 0, 300, 200)
+	assert second == (50, 50, 690, 530)
+
+
+def test_load_with_forced_uniform_size(fake_backend):
+	first, second = _load(fake_backend, load_uniform_size=[640, 480], load_force_uniform=True)
+	assert first == (0, 0, 640, 480)
+	assert second == (50, 50, 690, 530)
+
+
+def test_capture_keeps_sizes_with_uniform_size_set(fake_backend):
+	main.save_settings({'load_uniform_size': [640, 480]})
+	main.capture_current_layout()
+	assert main.load_settings()['roblox_windows']['#1'] == [0, 0, 800, 600]
@@ -0,0 +1,158 @@
+import heapq
+import itertools
+import time
+
+import pytest
+
+import main
+
+
+class ScriptedLoop:
+	"""A single-threaded event loop on a virtual clock, standing in for Tk's after()."""
+
+	def __init__(self):
+		self.now = 0.0
+		self._queue = []
+		self._seq = itertools.count()
+
+	def clock(self):
+		return self.now
+
+	def after(self, ms, fn):
+		job = next(self._seq)
+		heapq.heappush(self._queue, (self.now + ms / 1000.0, job, fn))
+		return job
+
+	def after_cancel(self, job):
+		self._queue = [entry for entry in self._queue if entry[1] != job]
+		heapq.heapify(self._queue)
+
+	def run_until(self, end):
+		while self._queue and self._queue[0][0] <= end:
+			due, _job, fn = heapq.heappop(self._queue)
+			self.now = max(self.now, due)
+			fn()
+		self.now = max(self.now, end)
+
+
+def test_histogram_buckets_and_percentiles():
+	monitor = main.LoopLagMonitor(ScriptedLoop())
+	for lag in [0.5] * 90 + [30] * 9 + [3000]:
+		monitor.record(lag)
+	st = monitor.stats()
+	assert st['samples'] == 100
+	assert st['p50_ms'] == 1
+	assert st['p99_ms'] == 50
+	assert st['max_ms'] == 3000
+	assert st['buckets']['<=1ms'] == 90
+	assert st['buckets']['<=50ms'] == 9
+	assert st['buckets']['>2500ms'] == 1
+
+
+def test_percentile_never_exceeds_max():
+	monitor = main.LoopLagMonitor(ScriptedLoop())
+	monitor.record(120)
+	assert monitor.percentile(99) == 120
+	assert main.LoopLagMonitor(ScriptedLoop()).percentile(50) == 0.0
+
+
+def test_scripted_p50_p99_benchmark():
+	"""Heartbeats every 10 ms; every 50th interval the loop is blocked for 40 ms."""
+	loop = ScriptedLoop()
+	monitor = main.LoopLagMonitor(loop, interval=0.01, clock=loop.clock)
+	block = {'n': 0}
+
+	def busy():
+		block['n'] += 1
+		if block['n'] % 50 == 0:
+			loop.now += 0.04
+		loop.after(10, busy)
+
+	monitor.start()
+	loop.after(5, busy)
+	loop.run_until(10.0)
+	monitor.stop()
+	st = monitor.stats()
+	print('scripted UI lag:', {k: st[k] for k in ('samples', 'p50_ms', 'p99_ms', 'max_ms')})
+	assert st['samples'] > 900
+	assert st['p50_ms'] <= 1
+	assert 20 <= st['p99_ms'] <= 50
+	assert st['max_ms'] == pytest.approx(40, abs=1)
+	# Stopped: no more heartbeats are scheduled
+	samples = st['samples']
+	loop.run_until(20.0)
+	assert monitor.stats()['samples'] == samples
+
+
+def test_describe_loop_lag(monkeypatch):
+	monkeypatch.setattr(main, 'LOOP_LAG_MONITOR', None)
+	assert 'not measured' in main.describe_loop_lag()
+	monitor = main.LoopLagMonitor(ScriptedLoop())
+	monkeypatch.setattr(main, 'LOOP_LAG_MONITOR', monitor)
+	assert 'measuring' in main.describe_loop_lag()
+	monitor.record(3)
+	assert main.describe_loop_lag() == 'UI lag: p50 3 ms, p99 3 ms, max 3 ms (1 samples)'
+
+
+def _find_all(widget, cls):
+	out = []
+	for child in widget.winfo_children():
+		if isinstance(child, cls):
+			out.append(child)
+		out.extend(_find_all(child, cls))
+	return out
+
+
+def _entry_after_label(win, text):
+	for label in _find_all(win, main.tk.Label):
+		if label.cget('text') == text:
+			siblings = label.master.winfo_children()
+			return next(w for w in siblings[siblings.index(label) + 1:] if isinstance(w, main.tk.Entry))
+	raise LookupError(text)
+
+
+@pytest.mark.xvfb
+def test_tk_loop_lag_benchmark(tk_root, fake_backend):
+	"""UI lag on a real Tk loop (Xvfb) while the Stacker is used the way a person would."""
+	monitor = main.LoopLagMonitor(tk_root, interval=0.01)
+	timings = {}
+
+	def pump(seconds=0.05):
+		end = time.monotonic() + seconds
+		while time.monotonic() < end:
+			tk_root.update()
+			time.sleep(0.001)
+
+	def timed(name, action):
+		start = time.perf_counter()
+		action()
+		tk_root.update()
+		timings.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+		pump()
+
+	def type_into(entry, text):
+		entry.delete(0, main.tk.END)
+		for ch in text:
+			entry.insert(main.tk.END, ch)
+			tk_root.update()
+
+	monitor.start()
+	main.capture_current_layout()
+	for round_ in range(5):
+		timed('open_stacker', main.open_stacker)
+		win = main._DIALOGS['stacker']
+		timed('dX/dY', lambda: (type_into(_entry_after_label(win, 'dX:'), str(30 + round_)),
+			type_into(_entry_after_label(win, 'dY:'), str(40 + round_))))
+		fake_backend.rects[101] = (900, 400, 1700, 1000)
+		timed('apply_saved_layout', lambda: main.apply_saved_layout(notify=False))
+		timed('color change', lambda: main.apply_bg_color('#202020' if round_ % 2 == 0 else '#f0f0f0'))
+		main.hide_dialog(win)
+		pump()
+	monitor.stop()
+	st = monitor.stats()
+	print('Tk UI lag:', {k: st[k] for k in ('samples', 'p50_ms', 'p99_ms', 'max_ms')})
+	print('action ms (max):', {k: round(max(v), 2) for k, v in timings.items()})
+	s = main.load_settings()
+	assert (s['load_stair_dx'], s['load_stair_dy']) == (34, 44)
+	assert fake_backend.rects[101][:2] == (10, 10)
+	assert st['samples'] > 20
@@ -0,0 +1,129 @@
+import pytest
+
+import main
+
+
+def _sample():
+	macro = main.Macro((1280, 720))
+	macro.add(0, main.EV_MOVE, 10, 20)
+	macro.add(1500, main.EV_DOWN, 10, 20, 0)
+	macro.add(3000, main.EV_UP, 10, 20, 0)
+	macro.add(4000, main.EV_WHEEL, 5, 5, -120)
+	macro.add(2 ** 40, main.EV_KEY_DOWN, 30, 65)
+	return macro
+
+
+def test_round_trip_bytes():
+	macro = _sample()
+	loaded = main.Macro.from_bytes(macro.to_bytes())
+	assert loaded.client_size == (1280, 720)
+	assert len(loaded) == 5
+	for a, b in zip(loaded.columns(), macro.columns()):
+		assert list(a) == list(b)
+	assert loaded.duration() == pytest.approx(2 ** 40 / 1e6)
+
+
+def test_round_trip_file(tmp_path):
+	path = tmp_path / 'm.rwsm'
+	_sample().save(str(path))
+	assert path.read_bytes()[:4] == main.MACRO_MAGIC
+	assert len(main.Macro.load(str(path))) == 5
+
+
+def test_empty_macro():
+	loaded = main.Macro.from_bytes(main.Macro().to_bytes())
+	assert len(loaded) == 0
+	assert loaded.duration() == 0.0
+
+
+def test_rejects_other_files():
+	data = bytearray(_sample().to_bytes())
+	data[:4] = b'NOPE'
+	with pytest.raises(ValueError):
+		main.Macro.from_bytes(bytes(data))
+
+
+def test_rejects_truncated_file():
+	data = _sample().to_bytes()
+	with pytest.raises(ValueError):
+		main.Macro.from_bytes(data[:-3])
+
+
+class FakeClock:
+	"""perf_counter stand-in: each read costs `tick` seconds, each sleep overshoots by `overshoot`."""
+
+	def __init__(self, tick=0.00005, overshoot=0.0005):
+		self.t = 0.0
+		self.tick = tick
+		self.overshoot = overshoot
+		self.sleeps = []
+
+	def clock(self):
+		self.t += self.tick
+		return self.t
+
+	def sleep(self, seconds):
+		self.sleeps.append((self.t, seconds))
+		self.t += seconds + self.overshoot
+
+
+class FakeSink:
+	def __init__(self, clock):
+		self.clock = clock
+		self.events = []
+
+	def send(self, kind, a, b, c):
+		self.events.append((self.clock.t, kind, a, b, c))
+
+
+def test_timer_sleeps_then_spins_to_the_deadline():
+	fake = FakeClock()
+	timer = main.HighResolutionTimer(clock=fake.clock, sleep=fake.sleep)
+	assert timer.wait_until(0.2)
+	assert 0.2 <= fake.t < 0.2 + 0.0002
+	# Every sleep ends (overshoot included) before the spin window, and none is shorter than 1 ms
+	for start, seconds in fake.sleeps:
+		assert seconds >= timer.MIN_SLEEP
+		assert start + seconds <= 0.2 - timer.spin
+	assert 0.2 - (fake.sleeps[-1][0] + fake.sleeps[-1][1]) <= timer.spin + timer.MIN_SLEEP
+
+
+def test_timer_stops_when_asked():
+	fake = FakeClock()
+	timer = main.HighResolutionTimer(clock=fake.clock, sleep=fake.sleep)
+	stop = main.threading.Event()
+	stop.set()
+	assert not timer.wait_until(10.0, stop)
+
+
+def test_player_scales_positions_per_slot_and_keeps_time():
+	fake = FakeClock()
+	macro = main.Macro((1280, 720))
+	macro.add(0, main.EV_MOVE, 640, 360)
+	macro.add(1500, main.EV_DOWN, 1280, 720, 0)
+	macro.add(20000, main.EV_KEY_DOWN, 30, 65)
+	macro.add(50000, main.EV_WHEEL, 100, 200, -120)
+	same, half = FakeSink(fake), FakeSink(fake)
+	player = main.MacroPlayer(macro, [(same, (1280, 720)), (half, (640, 360))], timer=main.HighResolutionTimer(clock=fake.clock, sleep=fake.sleep))
+	assert player.play() == 4
+	assert [e[1:] for e in same.events] == [
+		(main.EV_MOVE, 640, 360, 0), (main.EV_DOWN, 1280, 720, 0), (main.EV_KEY_DOWN, 30, 65, 0), (main.EV_WHEEL, 100, 200, -120)]
+	assert [e[1:] for e in half.events] == [
+		(main.EV_MOVE, 320, 180, 0), (main.EV_DOWN, 640, 360, 0), (main.EV_KEY_DOWN, 30, 65, 0), (main.EV_WHEEL, 50, 100, -120)]
+	start = same.events[0][0]
+	for (t, *_), offset in zip(same.events, (0, 0.0015, 0.02, 0.05)):
+		assert abs(t - start - offset) < 0.0005
+	assert len(player.lateness) == 4
+	assert 0 <= player.max_lateness < 0.0005
+
+
+def test_player_lateness_buffer_is_capped(monkeypatch):
+	monkeypatch.setattr(main.MacroPlayer, 'LATENESS_SAMPLES', 3)
+	fake = FakeClock()
+	macro = main.Macro((100, 100))
+	for i in range(10):
+		macro.add(i * 1000, main.EV_MOVE, i, i)
+	player = main.MacroPlayer(macro, [(FakeSink(fake), (100, 100))], timer=main.HighResolutionTimer(clock=fake.clock, sleep=fake.sleep))
+	assert player.play() == 10
+	assert len(player.lateness) == 3
+	assert player.max_lateness >= max(player.lateness)
@@ -0,0 +1,120 @@
+import collections
+
+import main
+
+
+class FakeWindows:
+	"""Window attribute source for WindowProbe, counting each lookup."""
+
+	def __init__(self, windows):
+		self.windows = windows
+		self.calls = collections.Counter()
+
+	def _get(self, what, hwnd):
+		self.calls[what] += 1
+		return self.windows[hwnd][what]
+
+	def is_window_visible(self, hwnd):
+		return self._get('visible', hwnd)
+
+	def get_class_name(self, hwnd):
+		return self._get('class', hwnd)
+
+	def get_window_title(self, hwnd):
+		return self._get('title', hwnd)
+
+	def get_window_pid(self, hwnd):
+		return self._get('pid', hwnd)
+
+	def get_process_image_name(self, pid):
+		self.calls['image'] += 1
+		return {1: 'RobloxPlayerBeta.exe', 2: 'Windows10Universal.exe'}.get(pid, 'other.exe')
+
+
+def _window(visible=True, cls='WINDOWSCLIENT', title='Roblox', pid=1):
+	return {'visible': visible, 'class': cls, 'title': title, 'pid': pid}
+
+
+def _run(config, windows, pids=None):
+	source = FakeWindows(windows)
+	matcher = main.build_window_matcher(config, pids)
+	found = [hwnd for hwnd in windows if matcher.match(main.WindowProbe(source, hwnd))]
+	return found, matcher, source
+
+
+def test_predicates_run_cheapest_first_and_stop_at_first_rejection():
+	config = main.window_match_config({'window_match': {'class_names': 'WINDOWSCLIENT', 'title_regex': '^Roblox$'}})
+	windows = {
+		1: _window(),
+		2: _window(visible=False),
+		3: _window(cls='Chrome_WidgetWin_1'),
+		4: _window(title='Roblox Studio'),
+		5: _window(pid=9),
+	}
+	found, matcher, source = _run(config, windows)
+	assert found == [1]
+	stats = matcher.stats()
+	assert [p['name'] for p in stats['predicates']] == ['visible', 'class', 'title', 'image']
+	assert [(p['evaluated'], p['rejected']) for p in stats['predicates']] == [(5, 1), (4, 1), (3, 1), (2, 1)]
+	# Only windows that passed every cheaper check had their process opened
+	assert source.calls['image'] == 2
+
+
+def test_snapshot_pids_replace_the_image_check():
+	config = main.window_match_config({})
+	windows = {1: _window(pid=1), 2: _window(pid=2), 3: _window(pid=3)}
+	found, matcher, source = _run(config, windows, pids={1, 3})
+	assert found == [1, 3]
+	assert source.calls['image'] == 0
+	assert matcher.stats()['predicates'][-1]['name'] == 'pid'
+
+
+def test_store_build_config():
+	config = main.window_match_config({'window_match': {'image_names': 'Windows10Universal.exe', 'title_regex': '^Roblox$'}})
+	windows = {1: _window(pid=2), 2: _window(pid=2, title='Calculator'), 3: _window(pid=1)}
+	assert _run(config, windows)[0] == [1]
+
+
+def test_probe_reads_pid_once():
+	source = FakeWindows({1: _window()})
+	probe = main.WindowProbe(source, 1)
+	assert probe.pid() == probe.pid() == 1
+	assert probe.image_name() == 'RobloxPlayerBeta.exe'
+	assert source.calls['pid'] == 1
+
+
+def test_invalid_regex_is_reported_without_printing(capsys, monkeypatch):
+	monkeypatch.setattr(main, 'WINDOW_MATCH_ERROR', None)
+	config = main.window_match_config({'window_match': {'title_regex': '(unclosed'}})
+	assert config['title_regex'] == ''
+	assert main.WINDOW_MATCH_ERROR.startswith("invalid title_regex '(unclosed'")
+	assert capsys.readouterr().out == ''
+	assert main._cmd_get_stats({})['window_match_error'] == main.WINDOW_MATCH_ERROR
+	main.window_match_config({'window_match': {'title_regex': 'ok'}})
+	assert main.WINDOW_MATCH_ERROR is None
+
+
+def test_benchmark_500_windows():
+	config = main.window_match_config({'window_match': {'class_names': ['WINDOWSCLIENT'], 'title_regex': 'Roblox'}})
+	windows = {}
+	for i in range(500):
+		if i % 12 == 0:
+			windows[i] = _window()
+		else:
+			windows[i] = _window(visible=i % 3 == 0, cls='Other', title='Other', pid=100 + i)
+	start = main.time.perf_counter()
+	for _ in range(20):
+		found, matcher, source = _run(config, windows)
+	ordered = (main.time.perf_counter() - start) / 20 * 1000
+	opens = source.calls['image']
+	# Same checks in the worst order: the process is opened for every window
+	reverse = main.WindowMatcher(list(main.build_window_matcher(config).predicates))
+	reverse.predicates.reverse()
+	source = FakeWindows(windows)
+	start = main.time.perf_counter()
+	worst = [hwnd for hwnd in windows if reverse.match(main.WindowProbe(source, hwnd))]
+	reversed_ms = (main.time.perf_counter() - start) * 1000
+	assert worst == found and len(found) == 42
+	assert opens == 42 and source.calls['image'] == 500
+	print('matcher, 500 windows: cheapest first %.3f ms (%d process opens), most expensive first %.3f ms (%d)' % (
+		ordered, opens, reversed_ms, source.calls['image']))
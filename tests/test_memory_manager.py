@@ -0,0 +1,74 @@
+import main
+
+MB = 1024 * 1024
+
+
+class FakeProcesses:
+	"""Process backend with a working set per PID; a trim leaves 10% of it."""
+
+	def __init__(self, usage):
+		self.usage = dict(usage)
+		self.trimmed = []
+
+	def get_memory(self, pid):
+		return self.usage.get(pid)
+
+	def trim_working_set(self, pid):
+		self.trimmed.append(pid)
+		self.usage[pid] //= 10
+		return True
+
+
+CLIENTS = {1: 10, 2: 20, 3: 30}
+
+
+def test_idle_clients_trimmed_once_then_on_retrim_interval():
+	procs = FakeProcesses({10: 500 * MB, 20: 500 * MB, 30: 500 * MB})
+	mm = main.MemoryManager(procs, idle_seconds=120, retrim_seconds=300)
+	assert mm.run_once(CLIENTS, 1, 0) == []
+	assert mm.run_once(CLIENTS, 1, 119) == []
+	assert sorted(mm.run_once(CLIENTS, 1, 120)) == [20, 30]
+	assert mm.run_once(CLIENTS, 1, 200) == []
+	assert sorted(mm.run_once(CLIENTS, 1, 420)) == [20, 30]
+	assert 10 not in procs.trimmed
+
+
+def test_regaining_focus_resets_idle_time():
+	procs = FakeProcesses({10: MB, 20: MB})
+	mm = main.MemoryManager(procs, idle_seconds=60, retrim_seconds=1000)
+	clients = {1: 10, 2: 20}
+	mm.run_once(clients, 1, 0)
+	assert mm.run_once(clients, 1, 60) == [20]
+	mm.run_once(clients, 2, 70)
+	mm.run_once(clients, 1, 80)
+	# Focused again since the last trim, so it is due as soon as it has been idle long enough
+	assert mm.run_once(clients, 1, 129) == []
+	assert mm.run_once(clients, 1, 130) == [20]
+
+
+def test_budget_trims_longest_idle_first_until_it_fits():
+	procs = FakeProcesses({10: 100 * MB, 20: 100 * MB, 30: 100 * MB})
+	mm = main.MemoryManager(procs, idle_seconds=10000, budget_bytes=900 * MB)
+	for now, hwnd in ((0, 3), (5, 2), (10, 1)):
+		assert mm.run_once(CLIENTS, hwnd, now) == []
+	procs.usage = {10: 400 * MB, 20: 400 * MB, 30: 400 * MB}
+	# 30 has been unfocused longest; trimming it alone brings 1200 MB under 900 MB
+	assert mm.run_once(CLIENTS, 1, 11) == [30]
+	rows, total = mm.get_report()
+	assert total == 840 * MB
+	assert sorted(rows) == [(1, 10, 400 * MB), (2, 20, 400 * MB), (3, 30, 40 * MB)]
+
+
+def test_budget_never_trims_focused_client_and_forgets_closed_ones():
+	procs = FakeProcesses({10: 2000 * MB, 20: 100 * MB})
+	mm = main.MemoryManager(procs, idle_seconds=10000, budget_bytes=500 * MB)
+	assert mm.run_once({1: 10, 2: 20}, 1, 0) == [20]
+	mm.run_once({1: 10}, 1, 1)
+	assert 20 not in mm.last_focus and 20 not in mm.last_trim
+
+
+def test_unreadable_usage_counts_as_zero():
+	procs = FakeProcesses({10: 100 * MB})
+	mm = main.MemoryManager(procs, idle_seconds=10000, budget_bytes=50 * MB)
+	assert mm.run_once({1: 10, 2: 20}, 2, 0) == [10]
+	assert mm.get_report()[1] == 10 * MB
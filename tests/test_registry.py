@@ -0,0 +1,65 @@
+import main
+
+
+def test_snapshot_is_a_copy():
+	reg = main.ClientRegistry()
+	reg.update(1, pid=10, title='Roblox')
+	snap = reg.snapshot()
+	snap[1]['title'] = 'changed'
+	snap[2] = {}
+	assert reg.snapshot() == {1: {'pid': 10, 'title': 'Roblox'}}
+
+
+def test_changes_since_reports_only_changed_rows():
+	reg = main.ClientRegistry()
+	reg.sync({1: 10, 2: 20, 3: 30})
+	v, changed, removed = reg.changes_since(-1)
+	assert sorted(changed) == [1, 2, 3] and removed == set()
+	assert not reg.update(2, pid=20)
+	reg.update(2, state='minimized')
+	reg.sync({1: 10, 2: 20})
+	v2, changed, removed = reg.changes_since(v)
+	assert list(changed) == [2] and changed[2]['state'] == 'minimized'
+	assert removed == {3}
+	assert reg.changes_since(v2) == (v2, {}, set())
+
+
+def test_refresh_fills_live_fields(fake_backend):
+	reg = main.ClientRegistry()
+	fake_backend.minimize_window(101)
+	main.refresh_client_registry(reg, fake_backend)
+	snap = reg.snapshot()
+	assert sorted(snap) == [100, 101, 102, 103, 104]
+	assert snap[101]['state'] == 'minimized'
+	assert snap[102]['rect'] == (20, 20, 820, 620)
+	assert snap[100]['pid'] == 1000
+	fake_backend.close_window(104)
+	main.refresh_client_registry(reg, fake_backend)
+	assert 104 not in reg.snapshot()
+
+
+def test_bulk_actions(fake_backend, monkeypatch):
+	released = []
+	monkeypatch.setattr(main, 'WATCHDOG', type('W', (), {'release': lambda self, h: released.extend(h)})())
+	assert main.apply_client_action([100, 101, 999], 'minimize') == 3
+	assert fake_backend.states[100] == fake_backend.states[101] == 'minimized'
+	assert main.apply_client_action([100], 'restore') == 1
+	assert fake_backend.states[100] == 'normal'
+	assert main.apply_client_action([102, 103], 'close') == 2
+	assert released == [102, 103]
+	assert 102 not in fake_backend.rects and 103 not in fake_backend.rects
+	assert main.apply_client_action([100], 'explode') == 0
+
+
+def test_move_to_monitor_is_one_batch_and_undoable(fake_backend):
+	main.save_settings({'load_stair_dx': 30, 'load_stair_dy': 20})
+	before = dict(fake_backend.rects)
+	assert main.move_clients_to_monitor([104, 102, 100], -1) == 3
+	assert fake_backend.calls['apply_placements'] == 1
+	assert fake_backend.rects[104][:2] == (0, 0)
+	assert fake_backend.rects[102][:2] == (30, 20)
+	assert fake_backend.rects[100][:2] == (60, 40)
+	# Only moved: sizes are kept
+	assert fake_backend.rects[100][2] - fake_backend.rects[100][0] == 800
+	main.undo_placement()
+	assert fake_backend.rects == before
@@ -0,0 +1,74 @@
+from conftest import FakeBackend
+
+import main
+
+
+def _p(x, y, state='normal'):
+	return ((x, y, x + 800, y + 600), state)
+
+
+def test_placement_diff():
+	current = {1: _p(0, 0), 2: _p(10, 10), 3: _p(20, 20, 'minimized')}
+	target = {1: _p(0, 0), 2: _p(11, 10), 3: _p(20, 20), 4: _p(0, 0)}
+	changed, skipped = main.placement_diff(current, target)
+	assert skipped == [1]
+	assert sorted(changed) == [2, 3, 4]
+
+
+def test_placement_diff_accepts_lists():
+	# Rects read back from Settings.json are lists
+	changed, skipped = main.placement_diff({1: ([0, 0, 800, 600], 'normal')}, {1: _p(0, 0)})
+	assert (changed, skipped) == ([], [1])
+
+
+class RecordingBackend(FakeBackend):
+	"""FakeBackend that records which windows were moved, one by one or in a batch."""
+
+	def __init__(self, rects):
+		super().__init__(rects)
+		self.moved = []
+
+	def move_window(self, hwnd, x, y, w=None, h=None):
+		self.moved.append(hwnd)
+		return super().move_window(hwnd, x, y, w, h)
+
+	def apply_placements(self, placements, resize=True):
+		self.moved.extend(placements)
+		return super().apply_placements(placements, resize)
+
+
+def _recording():
+	backend = RecordingBackend({100 + i: (i * 10, i * 10, i * 10 + 800, i * 10 + 600) for i in range(5)})
+	main.set_window_backend(backend)
+	return backend
+
+
+def _moved_windows(backend):
+	return sorted(backend.moved)
+
+
+def test_top_left_skips_windows_already_there():
+	backend = _recording()
+	main.move_roblox_windows_top_left(notify=False)
+	# 100 already sits at the top-left corner
+	assert _moved_windows(backend) == [101, 102, 103, 104]
+	assert main.LAST_PLACEMENT_REPORT == {'moved': 4, 'skipped': 1}
+	backend.moved.clear()
+	main.move_roblox_windows_top_left(notify=False)
+	assert _moved_windows(backend) == []
+	assert main.LAST_PLACEMENT_REPORT == {'moved': 0, 'skipped': 5}
+
+
+def test_saved_layout_only_moves_windows_out_of_place():
+	backend = _recording()
+	assert main.capture_current_layout() == 5
+	assert main.apply_saved_layout(notify=False) == 5
+	assert _moved_windows(backend) == []
+	assert main.LAST_PLACEMENT_REPORT == {'moved': 0, 'skipped': 5}
+	backend.rects[101] = (500, 500, 1300, 1100)
+	backend.minimize_window(103)
+	assert main.apply_saved_layout(notify=False) == 5
+	assert _moved_windows(backend) == [101, 103]
+	assert main.LAST_PLACEMENT_REPORT == {'moved': 2, 'skipped': 3}
+	assert backend.rects[101] == (10, 10, 810, 610)
+	assert backend.states[103] == 'normal'
@@ -0,0 +1,49 @@
+import pytest
+
+import main
+
+Image = pytest.importorskip('PIL.Image')
+
+
+def test_scale_swaps_bgra_to_rgb():
+	capturer = main.ThumbnailCapturer(None, list, thumb_width=40)
+	# One BGRA pixel value everywhere: blue=10, green=20, red=30
+	thumb = capturer.scale(200, 100, bytearray(bytes([10, 20, 30, 255]) * (200 * 100)))
+	assert thumb.mode == 'RGB' and thumb.size == (40, 20)
+	assert thumb.getpixel((5, 5)) == (30, 20, 10)
+	# Small frames are resized directly
+	assert capturer.scale(50, 50, bytearray(50 * 50 * 4)).size == (40, 40)
+
+
+def test_buffers_are_reused_and_dropped_with_their_client():
+	hwnds = [1, 2, 3]
+	capturer = main.ThumbnailCapturer(main.SyntheticCaptureSource(320, 240), lambda: hwnds)
+	capturer.capture_once()
+	first = dict(capturer._buffers)
+	capturer.capture_once()
+	assert all(capturer._buffers[h] is first[h] for h in hwnds)
+	hwnds.remove(2)
+	capturer.capture_once()
+	assert sorted(capturer._buffers) == [1, 3]
+	assert [h for h, _im in capturer.latest()] == [1, 3]
+
+
+def test_benchmark_synthetic_frames():
+	clients = list(range(10))
+	source = main.SyntheticCaptureSource(1280, 720)
+	capturer = main.ThumbnailCapturer(source, lambda: clients, fps=2, thumb_width=160)
+	capturer.capture_once()
+	passes = 10
+	total = sum(capturer.capture_once() for _ in range(passes))
+	per_pass = total / passes * 1000
+	# Baseline: copy each frame and do one full filtered resize, as a naive pipeline would
+	buf = capturer._buffers[0]
+	start = main.time.perf_counter()
+	for _ in range(passes * len(clients)):
+		Image.frombytes('RGBA', (1280, 720), bytes(buf)).convert('RGB').resize((160, 90), Image.LANCZOS)
+	naive = (main.time.perf_counter() - start) / passes * 1000
+	print('thumbnails, 10 x 1280x720: %.2f ms per pass (naive copy + LANCZOS: %.2f ms)' % (per_pass, naive))
+	thumbs = capturer.latest()
+	assert len(thumbs) == 10
+	assert all(im.size == (160, 90) for _h, im in thumbs)
+	assert capturer.frames == passes + 1
@@ -0,0 +1,108 @@
+import collections
+import os
+
+import pytest
+
+import main
+
+
+class FakeFS:
+	"""A directory tree in a dict ({name: subtree or None for a file}) with call counts."""
+
+	def __init__(self, tree):
+		self.tree = tree
+		self.calls = collections.Counter()
+
+	def _node(self, path):
+		node = self.tree
+		for part in [p for p in path.replace('\\', '/').split('/') if p]:
+			if not isinstance(node, dict) or part not in node:
+				return False
+			node = node[part]
+		return node
+
+	def isfile(self, path):
+		self.calls['isfile'] += 1
+		return self._node(path) is None
+
+	def which(self, name):
+		self.calls['which'] += 1
+		return None
+
+	def scandir(self, folder):
+		self.calls['scandir'] += 1
+		node = self._node(folder)
+		if not isinstance(node, dict):
+			raise OSError(folder)
+		fs = self
+
+		class Entry:
+			def __init__(self, name, child):
+				self.name = name
+				self.path = os.path.join(folder, name)
+				self.child = child
+
+			def is_file(self):
+				return self.child is None
+
+			def is_dir(self, follow_symlinks=True):
+				return isinstance(self.child, dict)
+
+		class Scan:
+			def __enter__(self):
+				return iter([Entry(name, child) for name, child in node.items()])
+
+			def __exit__(self, *exc):
+				return False
+
+		return Scan()
+
+
+@pytest.fixture(autouse=True)
+def no_install_dirs(monkeypatch):
+	for name in ('ProgramFiles', 'ProgramFiles(x86)'):
+		monkeypatch.delenv(name, raising=False)
+
+
+def _locator(fs, extra_dirs, depth):
+	return main.TinyTaskLocator(extra_dirs, depth, isfile=fs.isfile, scandir=fs.scandir, which=fs.which)
+
+
+def test_direct_candidate_needs_no_scan():
+	fs = FakeFS({'tools': {'TinyTask': {'TinyTask.exe': None}}})
+	assert _locator(fs, ['/tools'], 2).find() == os.path.join('/tools', 'TinyTask', 'TinyTask.exe')
+	assert fs.calls['scandir'] == 0
+	assert fs.calls['which'] == len(main.TINYTASK_NAMES)
+
+
+def test_shallow_scan_respects_depth():
+	fs = FakeFS({'games': {'a': {'b': {'tinytask.exe': None}}, 'c': {}}})
+	assert _locator(fs, ['/games'], 2).find() is None
+	fs.calls.clear()
+	assert _locator(fs, ['/games'], 3).find() == os.path.join('/games', 'a', 'b', 'tinytask.exe')
+	# The two per-user folders (missing here), then games, a and b: c is never listed
+	assert fs.calls['scandir'] == 5
+
+
+def test_string_setting_is_one_folder():
+	fs = FakeFS({'tools': {'tinytask.exe': None}})
+	locator = _locator(fs, '/tools', 0)
+	assert locator.extra_dirs == ['/tools']
+	assert locator.find() == os.path.join('/tools', 'tinytask.exe')
+
+
+def test_no_scan_when_depth_is_zero():
+	fs = FakeFS({'games': {'a': {'tinytask.exe': None}}})
+	assert _locator(fs, ['/games'], 0).find() is None
+	assert fs.calls['scandir'] == 0
+
+
+def test_cached_path_costs_one_stat(monkeypatch):
+	fs = FakeFS({'tools': {'TinyTask.exe': None}})
+	main.save_settings({'tinytask_path': '/tools/TinyTask.exe'})
+	monkeypatch.setattr(main, '_TINYTASK_PATH', None)
+	assert main.resolve_cached_tinytask(isfile=fs.isfile) == '/tools/TinyTask.exe'
+	assert main.resolve_cached_tinytask(isfile=fs.isfile) == '/tools/TinyTask.exe'
+	assert fs.calls['isfile'] == 2
+	fs.tree = {}
+	assert main.resolve_cached_tinytask(isfile=fs.isfile) is None
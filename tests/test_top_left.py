@@ -0,0 +1,40 @@
+import pytest
+
+import main
+
+
+def test_top_left_scans_windows_once(fake_backend):
+	placements = main.move_roblox_windows_top_left(notify=False)
+	assert fake_backend.calls['enum_roblox_windows'] == 1
+	assert len(placements) == 5
+	assert all(rect[:2] == (0, 0) for rect in placements.values())
+	# The returned rects are the windows' real ones, in enumeration order
+	assert list(placements) == sorted(fake_backend.rects)
+	assert placements == {hwnd: fake_backend.rects[hwnd] for hwnd in placements}
+
+
+def test_top_left_without_clients(fake_backend):
+	fake_backend.rects.clear()
+	assert main.move_roblox_windows_top_left(notify=False) == {}
+	assert fake_backend.calls['enum_roblox_windows'] == 1
+
+
+def _find_button(widget, text):
+	for child in widget.winfo_children():
+		if isinstance(child, main.tk.Button) and child.cget('text') == text:
+			return child
+		found = _find_button(child, text)
+		if found is not None:
+			return found
+	return None
+
+
+@pytest.mark.xvfb
+def test_stacker_top_left_records_without_rescanning(tk_root, fake_backend):
+	main.open_stacker()
+	win = main._DIALOGS['stacker']
+	fake_backend.calls.clear()
+	_find_button(win, 'Top Left').invoke()
+	assert fake_backend.calls['enum_roblox_windows'] == 1
+	first = fake_backend.rects[min(fake_backend.rects)]
+	assert win._moved_order == [(first[0], first[1], first[2] - first[0], first[3] - first[1])]
@@ -0,0 +1,176 @@
+import sys
+
+import pytest
+
+import main
+
+
+class Clients:
+	"""The client list a watchdog polls: {hwnd: pid}."""
+
+	def __init__(self, clients):
+		self.clients = dict(clients)
+
+	def __call__(self):
+		return dict(self.clients)
+
+
+class ExitCodes:
+	"""Process-control stand-in that reports the exit codes tests set."""
+
+	def __init__(self):
+		self.codes = {}
+		self.tracked = set()
+
+	def track_exit(self, pid):
+		self.tracked.add(pid)
+
+	def untrack_exit(self, pid):
+		self.tracked.discard(pid)
+
+	def exit_code(self, pid):
+		return self.codes.get(pid)
+
+
+@pytest.fixture
+def setup(fake_backend):
+	clients = Clients({100: 1000, 101: 1001, 102: 1002})
+	launched = []
+	t = [0.0]
+	wd = main.ClientWatchdog(clients, launcher=launched.append, backend=fake_backend,
+		base_delay=1, max_delay=8, max_concurrent=1, launch_timeout=10, clock=lambda: t[0])
+	wd.adopt(clients())
+	return wd, clients, launched, t, fake_backend
+
+
+def test_crash_relaunches_and_restores_slot(setup):
+	wd, clients, launched, t, backend = setup
+	slot_rect = backend.rects[101]
+	del clients.clients[101]
+	assert wd.tick(0) == [('exited', 2)]
+	assert wd.tick(0.5) == []
+	assert wd.tick(1) == [('launched', 2)]
+	assert launched == [2]
+	clients.clients[500] = 5000
+	backend.rects[500] = (1000, 1000, 1800, 1600)
+	assert wd.tick(2) == [('restored', 2)]
+	assert backend.rects[500] == slot_rect
+	assert wd.restored == 1
+	assert wd.order([500, 102, 100]) == [100, 500, 102]
+	assert main.PLACEMENT_HISTORY.current()[500] == (slot_rect, 'normal')
+
+
+def test_launch_timeout_backs_off(setup):
+	wd, clients, launched, t, backend = setup
+	del clients.clients[100]
+	wd.tick(0)
+	assert wd.tick(1) == [('launched', 1)]
+	assert wd.tick(11) == [('timeout', 1)]
+	# attempts=1 -> retry after base_delay * 2
+	assert wd.tick(12) == []
+	assert wd.tick(13) == [('launched', 1)]
+	assert [wd.backoff(a) for a in range(5)] == [1, 2, 4, 8, 8]
+
+
+def test_concurrency_cap(setup):
+	wd, clients, launched, t, backend = setup
+	clients.clients.clear()
+	wd.tick(0)
+	assert wd.tick(1) == [('launched', 1)]
+	assert wd.tick(2) == []
+	assert launched == [1]
+
+
+def test_failed_launch_counts_as_attempt(fake_backend):
+	clients = Clients({100: 1000})
+
+	def launcher(slot):
+		raise OSError('no such file')
+
+	wd = main.ClientWatchdog(clients, launcher=launcher, backend=fake_backend, base_delay=1)
+	wd.adopt(clients())
+	clients.clients.clear()
+	wd.tick(0)
+	assert wd.tick(1) == [('launch_failed', 1)]
+	assert wd.status() == [(1, 'vacant', 100, 1)]
+
+
+def test_without_launcher_slot_waits_for_manual_relaunch(fake_backend):
+	clients = Clients({100: 1000, 101: 1001})
+	wd = main.ClientWatchdog(clients, backend=fake_backend, base_delay=1)
+	wd.adopt(clients())
+	del clients.clients[100]
+	assert wd.tick(0) == [('exited', 1)]
+	assert wd.tick(100) == []
+	clients.clients[7] = 7000
+	assert wd.tick(101) == [('restored', 1)]
+
+
+def test_clean_exit_gives_up_the_slot(fake_backend):
+	clients = Clients({100: 1000, 101: 1001})
+	codes = ExitCodes()
+	launched = []
+	wd = main.ClientWatchdog(clients, launcher=launched.append, backend=fake_backend, base_delay=1, process_control=codes)
+	wd.adopt(clients())
+	assert codes.tracked == {1000, 1001}
+	codes.codes[1000] = 0
+	codes.codes[1001] = 0xC0000005
+	clients.clients.clear()
+	assert wd.tick(0) == [('closed', 1), ('exited', 2)]
+	assert wd.tick(1) == [('launched', 1)]
+	assert wd.status() == [(1, 'launching', 101, 0)]
+
+
+def test_release_forgets_closed_clients(setup):
+	wd, clients, launched, t, backend = setup
+	wd.release([100])
+	del clients.clients[100]
+	assert wd.tick(0) == []
+	assert [s[2] for s in wd.status()] == [101, 102]
+
+
+def test_new_window_without_vacancy_gets_new_slot(setup):
+	wd, clients, launched, t, backend = setup
+	clients.clients[9] = 9000
+	assert wd.tick(0) == [('added', 4)]
+
+
+def test_order_follows_slots_and_waits_for_the_lock(setup):
+	wd, clients, launched, t, backend = setup
+	assert wd.order([7, 102, 100, 101]) == [100, 101, 102, 7]
+	result = []
+	with wd._lock:
+		reader = main.threading.Thread(target=lambda: result.append(wd.order([102, 100])))
+		reader.start()
+		reader.join(0.05)
+		# Slots are being rewritten (as in tick): order() must not read them half-done
+		assert reader.is_alive()
+	reader.join(2)
+	assert result == [[100, 102]]
+
+
+def test_restore_moves_are_posted_outside_the_lock(setup):
+	wd, clients, launched, t, backend = setup
+	posted = []
+
+	def post(fn):
+		# Must not be called with the watchdog lock held
+		assert wd._lock.acquire(blocking=False)
+		wd._lock.release()
+		posted.append(fn)
+
+	wd.post = post
+	del clients.clients[100]
+	wd.tick(0)
+	clients.clients[8] = 8000
+	backend.rects[8] = (5, 5, 10, 10)
+	wd.tick(1)
+	assert len(posted) == 1 and backend.rects[8] == (5, 5, 10, 10)
+	posted[0]()
+	assert backend.rects[8] == (0, 0, 800, 600)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='POSIX command-line splitting')
+def test_launcher_splits_posix_command_lines():
+	proc = main.make_client_launcher('"%s" -c "import sys; sys.exit({slot})"' % sys.executable)(3)
+	assert proc.wait(10) == 3
@@ -0,0 +1,109 @@
+import os
+import time
+
+import pytest
+
+import main
+
+pytestmark = pytest.mark.xvfb
+
+Xlib = pytest.importorskip('Xlib')
+from Xlib import X, Xatom  # noqa: E402
+import Xlib.display  # noqa: E402
+
+
+class DummyClients:
+	"""Plain X windows dressed up as managed clients; the test plays the window manager."""
+
+	def __init__(self, display_name):
+		self.display = Xlib.display.Display(display_name)
+		self.root = self.display.screen().root
+		self.windows = []
+
+	def atom(self, name):
+		return self.display.intern_atom(name)
+
+	def create(self, x, y, w=320, h=240, wm_class='DummyClient', pid=None):
+		win = self.root.create_window(x, y, w, h, 0, X.CopyFromParent)
+		win.set_wm_class('dummy', wm_class)
+		win.change_property(self.atom('_NET_WM_PID'), Xatom.CARDINAL, 32, [pid or os.getpid()])
+		win.change_property(self.atom('WM_STATE'), self.atom('WM_STATE'), 32, [1, 0])
+		win.map()
+		self.windows.append(win)
+		return win.id
+
+	def publish(self):
+		ids = [w.id for w in self.windows]
+		for name in ('_NET_CLIENT_LIST', '_NET_CLIENT_LIST_STACKING'):
+			self.root.change_property(self.atom(name), Xatom.WINDOW, 32, ids)
+		self.display.sync()
+
+	def close(self):
+		for win in self.windows:
+			win.destroy()
+		self.root.delete_property(self.atom('_NET_CLIENT_LIST'))
+		self.root.delete_property(self.atom('_NET_CLIENT_LIST_STACKING'))
+		self.display.sync()
+		self.display.close()
+
+
+@pytest.fixture
+def clients(xvfb_display):
+	dummy = DummyClients(xvfb_display)
+	yield dummy
+	dummy.close()
+
+
+def _backend(xvfb_display):
+	config = main.window_match_config({'window_match': {
+		'class_names': ['DummyClient'],
+		'image_names': [main._proc_image_name(os.getpid())],
+	}})
+	return main.X11Backend(config, display_name=xvfb_display)
+
+
+def test_enumerates_matching_windows(clients, xvfb_display):
+	ids = [clients.create(i * 10, i * 10) for i in range(3)]
+	clients.create(0, 0, wm_class='Other')
+	clients.publish()
+	backend = _backend(xvfb_display)
+	found = dict(backend.enum_roblox_window_pids())
+	assert sorted(found) == sorted(ids)
+	assert set(found.values()) == {os.getpid()}
+
+
+def test_sandboxed_pid_maps_to_host_pid(clients, xvfb_display, monkeypatch):
+	# A Flatpak client reports its PID inside the sandbox
+	monkeypatch.setattr(main, '_proc_ns_pid', lambda pid: 2 if int(pid) == os.getpid() else None)
+	xid = clients.create(0, 0, pid=2)
+	clients.publish()
+	backend = _backend(xvfb_display)
+	assert dict(backend.enum_roblox_window_pids()) == {xid: os.getpid()}
+
+
+def test_placements_round_trip(clients, xvfb_display):
+	ids = [clients.create(i * 10, i * 10) for i in range(3)]
+	clients.publish()
+	backend = _backend(xvfb_display)
+	assert backend.get_placements(ids)[ids[1]] == ((10, 10, 330, 250), 'normal')
+	target = {xid: ((100 + i * 50, 200, 500 + i * 50, 500), 'normal') for i, xid in enumerate(ids)}
+	assert backend.apply_placements(target) == 3
+	clients.display.sync()
+	assert backend.get_placements(ids) == target
+
+
+def test_scan_and_snapshot_benchmark(clients, xvfb_display):
+	"""200 clients: enumeration and a placement snapshot are one round trip each."""
+	ids = [clients.create((i % 20) * 40, (i // 20) * 40, 200, 150) for i in range(200)]
+	clients.publish()
+	backend = _backend(xvfb_display)
+	t0 = time.perf_counter()
+	found = backend.enum_roblox_window_pids()
+	scan = time.perf_counter() - t0
+	t0 = time.perf_counter()
+	placements = backend.get_placements(ids)
+	snap = time.perf_counter() - t0
+	print(f'x11 200 clients: scan {scan * 1000:.1f} ms, snapshot {snap * 1000:.1f} ms')
+	assert len(found) == 200
+	assert len(placements) == 200
+	assert scan < 1.0 and snap < 1.0